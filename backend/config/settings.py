@@ -50,14 +50,121 @@ REDIS_PORT = env("REDIS_PORT", default="6379")
 
 # --- AI Configuration ---
 GEMINI_API_KEY = env("GEMINI_API_KEY", default="")
+# 워커(이벤트 루프)당 동시 Gemini 호출 상한
+GEMINI_MAX_CONCURRENCY = env.int("GEMINI_MAX_CONCURRENCY", default=8)
+# 키워드 추출 결과 캐시 (in-process LRU + Redis)
+KEYWORD_CACHE_TTL = env.int("KEYWORD_CACHE_TTL", default=60 * 60 * 6)  # 6시간
+KEYWORD_CACHE_MAX_ENTRIES = env.int("KEYWORD_CACHE_MAX_ENTRIES", default=1024)
 
 # --- Shopping API Keys ---
 NAVER_CLIENT_ID = env("NAVER_CLIENT_ID", default="")
 NAVER_CLIENT_SECRET = env("NAVER_CLIENT_SECRET", default="")
+# 가격 범위 검색 시 동시에 가져올 최대 페이지 수 (페이지당 100개, 페이지마다 호출 한도 1회 차감)
+NAVER_PRICE_RANGE_PAGES = env.int("NAVER_PRICE_RANGE_PAGES", default=3)
 ELEVENST_API_KEY = env("ELEVENST_API_KEY", default="")
 COUPANG_ACCESS_KEY = env("COUPANG_ACCESS_KEY", default="")
 COUPANG_SECRET_KEY = env("COUPANG_SECRET_KEY", default="")
 
+# --- HTTP Connection Pools (플랫폼별 공유 httpx 클라이언트) ---
+HTTP_POOL_MAX_CONNECTIONS = env.int("HTTP_POOL_MAX_CONNECTIONS", default=32)  # 플랫폼당 최대 연결 수
+HTTP_POOL_MAX_KEEPALIVE = env.int("HTTP_POOL_MAX_KEEPALIVE", default=16)  # 유지할 유휴 연결 수
+HTTP_POOL_KEEPALIVE_EXPIRY = env.float("HTTP_POOL_KEEPALIVE_EXPIRY", default=120.0)  # 유휴 연결 유지 시간 (초)
+HTTP_POOL_TIMEOUT = env.float("HTTP_POOL_TIMEOUT", default=10.0)  # 기본 요청 타임아웃 (초)
+
+# --- Upstream Quotas (클러스터 공유 호출 한도: Redis 토큰 버킷 + 일일 예산) ---
+# per_minute: 분당 호출 수 (0이면 무제한), burst: 순간 최대 호출 수, daily: 일일 예산 (0이면 무제한)
+UPSTREAM_QUOTAS = {
+    "naver": {
+        "per_minute": env.int("NAVER_QUOTA_PER_MINUTE", default=600),  # 초당 10회
+        "burst": env.int("NAVER_QUOTA_BURST", default=20),
+        "daily": env.int("NAVER_QUOTA_DAILY", default=25000),  # 검색 API 일일 한도
+    },
+    "11st": {
+        "per_minute": env.int("ELEVENST_QUOTA_PER_MINUTE", default=600),
+        "burst": env.int("ELEVENST_QUOTA_BURST", default=20),
+        "daily": env.int("ELEVENST_QUOTA_DAILY", default=0),
+    },
+    "gemini": {
+        "per_minute": env.int("GEMINI_QUOTA_PER_MINUTE", default=1000),
+        "burst": env.int("GEMINI_QUOTA_BURST", default=50),
+        "daily": env.int("GEMINI_QUOTA_DAILY", default=0),
+    },
+    "coupang": {
+        "per_minute": env.int("COUPANG_QUOTA_PER_MINUTE", default=100),
+        "burst": env.int("COUPANG_QUOTA_BURST", default=10),
+        "daily": env.int("COUPANG_QUOTA_DAILY", default=0),
+    },
+}
+QUOTA_BACKGROUND_RESERVE = env.float("QUOTA_BACKGROUND_RESERVE", default=0.2)  # 백그라운드가 남겨둘 버킷/예산 비율
+QUOTA_INTERACTIVE_MAX_WAIT = env.float("QUOTA_INTERACTIVE_MAX_WAIT", default=0.5)  # 검색 요청 최대 대기 (초)
+QUOTA_BACKGROUND_MAX_WAIT = env.float("QUOTA_BACKGROUND_MAX_WAIT", default=30.0)  # 백그라운드 작업 최대 대기 (초)
+QUOTA_REDIS_RETRY = env.int("QUOTA_REDIS_RETRY", default=30)  # Redis 장애 시 워커 버킷 사용 후 재시도 (초)
+
+# --- Circuit Breakers (플랫폼별, 워커 단위) ---
+BREAKER_WINDOW = env.int("BREAKER_WINDOW", default=60)  # 에러율/지연 시간 집계 구간 (초)
+BREAKER_MIN_CALLS = env.int("BREAKER_MIN_CALLS", default=10)  # open 판단/적응형 타임아웃 최소 표본 수
+BREAKER_ERROR_RATE = env.float("BREAKER_ERROR_RATE", default=0.5)  # 이 에러율 이상이면 open
+BREAKER_COOLDOWN = env.int("BREAKER_COOLDOWN", default=30)  # open 후 half-open probe까지 (초)
+BREAKER_TIMEOUT_FACTOR = env.float("BREAKER_TIMEOUT_FACTOR", default=2.0)  # 타임아웃 = p95 x 배수
+BREAKER_MIN_TIMEOUT = env.float("BREAKER_MIN_TIMEOUT", default=1.0)  # 적응형 타임아웃 하한 (초)
+
+# --- Search Fan-out ---
+# 추출된 키워드 중 플랫폼 검색에 사용할 최대 개수
+SEARCH_FANOUT_MAX_KEYWORDS = env.int("SEARCH_FANOUT_MAX_KEYWORDS", default=3)
+# 워커당 동시 업스트림(네이버/11번가) 호출 상한
+SEARCH_UPSTREAM_MAX_INFLIGHT = env.int("SEARCH_UPSTREAM_MAX_INFLIGHT", default=16)
+# 요청당 fan-out 데드라인 (초)
+SEARCH_FANOUT_DEADLINE = env.float("SEARCH_FANOUT_DEADLINE", default=1.5)
+
+# --- Product Cache (stale-while-revalidate) ---
+# soft TTL 경과: 캐시로 즉시 응답 + 백그라운드 갱신 / hard TTL 경과: 캐시 미사용
+PRODUCT_CACHE_SOFT_TTL = env.int("PRODUCT_CACHE_SOFT_TTL", default=60 * 60 * 6)  # 6시간
+PRODUCT_CACHE_HARD_TTL = env.int("PRODUCT_CACHE_HARD_TTL", default=60 * 60 * 24)  # 24시간
+# 키워드 갱신 중복 방지 락 (Redis, 초)
+SEARCH_REFRESH_LOCK_TTL = env.int("SEARCH_REFRESH_LOCK_TTL", default=60)
+# 백그라운드 갱신의 fan-out 데드라인 (초) - 응답을 기다리는 사용자가 없으므로 요청 데드라인보다 길게
+SEARCH_REFRESH_DEADLINE = env.float("SEARCH_REFRESH_DEADLINE", default=10.0)
+
+# --- Negative Cache (플랫폼 x 키워드 결과 없음/실패) ---
+SEARCH_NEGATIVE_EMPTY_TTL = env.int("SEARCH_NEGATIVE_EMPTY_TTL", default=60 * 10)  # 결과 없음: 10분
+SEARCH_NEGATIVE_ERROR_TTL = env.int("SEARCH_NEGATIVE_ERROR_TTL", default=30)  # 호출 실패: 30초
+
+# --- Search Snapshots (페이지네이션/정렬/필터용 결과 스냅샷) ---
+SEARCH_SNAPSHOT_TTL = env.int("SEARCH_SNAPSHOT_TTL", default=600)  # 10분
+
+# --- Streaming Search (SSE) ---
+# 새 검색 첫 페이지를 빈 셸로 렌더링하고 결과를 소스별로 스트리밍
+# (JS 없는 클라이언트/크롤러는 서버 렌더링 결과를 받지 못하므로 기본 비활성)
+SEARCH_STREAMING_ENABLED = env.bool("SEARCH_STREAMING_ENABLED", default=False)
+
+# --- Coupang Catalog Index (워커 공유 메모리 색인) ---
+# 쿠팡 수동 상품 검색을 DB 대신 mmap 색인으로 처리 (Admin 저장 시 세대 번호로 재빌드)
+SEARCH_CATALOG_INDEX_ENABLED = env.bool("SEARCH_CATALOG_INDEX_ENABLED", default=False)
+SEARCH_CATALOG_INDEX_DIR = env.str("SEARCH_CATALOG_INDEX_DIR", default="")  # 빈 값: 시스템 임시 디렉터리
+SEARCH_CATALOG_POLL_INTERVAL = env.float("SEARCH_CATALOG_POLL_INTERVAL", default=30.0)  # pub/sub 끊겼을 때 (초)
+
+# --- Autocomplete (워커 메모리 접두어 색인) ---
+SEARCH_SUGGEST_REFRESH_INTERVAL = env.int("SEARCH_SUGGEST_REFRESH_INTERVAL", default=300)  # 증분 갱신 주기 (초)
+SEARCH_SUGGEST_HISTORY_DAYS = env.int("SEARCH_SUGGEST_HISTORY_DAYS", default=30)  # 집계할 검색 기록 기간
+SEARCH_SUGGEST_MIN_COUNT = env.int("SEARCH_SUGGEST_MIN_COUNT", default=2)  # 제안할 최소 검색 횟수
+SEARCH_SUGGEST_CACHE_SECONDS = env.int("SEARCH_SUGGEST_CACHE_SECONDS", default=60)  # 응답 Cache-Control max-age
+
+# --- Cache Warmer (warm_search_cache 명령) ---
+SEARCH_WARM_LIMIT = env.int("SEARCH_WARM_LIMIT", default=50)  # 예열할 인기 검색어 수
+SEARCH_WARM_RATE = env.float("SEARCH_WARM_RATE", default=1.0)  # 초당 최대 검색어 수 (업스트림 쿼터 보호)
+SEARCH_WARM_DEADLINE = env.float("SEARCH_WARM_DEADLINE", default=10.0)  # 검색어당 fan-out 데드라인 (초)
+SEARCH_WARM_AHEAD = env.int("SEARCH_WARM_AHEAD", default=60 * 60)  # soft TTL 만료 몇 초 전부터 갱신
+
+# --- Single-flight (동일 키워드 동시 요청 합치기) ---
+SEARCH_SINGLEFLIGHT_LEASE = env.float("SEARCH_SINGLEFLIGHT_LEASE", default=10.0)  # Redis 락 lease (초)
+SEARCH_SINGLEFLIGHT_POLL_INTERVAL = env.float("SEARCH_SINGLEFLIGHT_POLL_INTERVAL", default=0.05)
+
+# --- Background Jobs (in-process queue) ---
+# 캐시 채우기, 검색 기록, 클릭 로그를 응답 후 배치로 flush
+BACKGROUND_QUEUE_MAX_SIZE = env.int("BACKGROUND_QUEUE_MAX_SIZE", default=10000)
+BACKGROUND_BATCH_SIZE = env.int("BACKGROUND_BATCH_SIZE", default=200)
+BACKGROUND_FLUSH_INTERVAL = env.float("BACKGROUND_FLUSH_INTERVAL", default=0.5)  # 초
+
 
 # =============================================================================
 # 🔍 Auto-Discovery: Automatically find and register Django apps in domains/
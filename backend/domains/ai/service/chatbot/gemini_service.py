@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from django.conf import settings
 from google import genai
 
+from domains.integrations.interface import acquire_quota
+
 
 @dataclass
 class ChatResponse:
@@ -50,7 +52,7 @@ class GeminiChatService:
         """
         Generate response from Gemini
 
-        ✅ Pure function: No DB, No side effects
+        ✅ No DB. Side effect: Gemini 호출 한도 차감 (Redis, 한도 초과 시 호출 없이 오류 메시지)
 
         Args:
             prompt: User prompt
@@ -64,6 +66,8 @@ class GeminiChatService:
             if system_instruction:
                 contents = f"{system_instruction}\n\n{prompt}"
 
+            # 키워드 추출과 같은 Gemini 호출 한도를 공유
+            acquire_quota("gemini")
             response = self.client.models.generate_content(
                 model=self.model,
                 contents=contents,
@@ -168,7 +172,7 @@ def generate_text(
     """
     Generate text from Gemini AI
 
-    ✅ Public Interface: 간단한 텍스트 생성
+    ✅ Public Interface: 간단한 텍스트 생성 (Gemini 호출 한도를 공유하므로 Redis 사용)
 
     Args:
         prompt: User prompt
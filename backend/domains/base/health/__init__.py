@@ -11,4 +11,5 @@ Endpoints:
 - /health/         - Basic health status
 - /health/ready/   - Readiness probe (DB, Redis, etc.)
 - /health/live/    - Liveness probe (app running)
+- /health/metrics/ - Runtime metrics (caches, background jobs)
 """
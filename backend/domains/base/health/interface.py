@@ -13,7 +13,7 @@ from typing import Literal
 
 from pydantic import BaseModel
 
-from .pages.status.views import _check_cache, _check_database
+from .pages.status.views import _check_cache, _check_database, _collect_metrics
 
 # =============================================================================
 # 📋 Pydantic Schemas
@@ -90,6 +90,16 @@ def is_ready() -> bool:
     return check_health().is_healthy
 
 
+def get_metrics() -> dict:
+    """
+    Collect runtime metrics for this worker process.
+
+    Returns:
+        dict of component name → counters
+    """
+    return _collect_metrics()
+
+
 def is_alive() -> bool:
     """
     Quick liveness check.
@@ -99,4 +109,4 @@ def is_alive() -> bool:
     return True
 
 
-__all__ = ["ComponentCheck", "HealthStatus", "check_health", "is_alive", "is_ready"]
+__all__ = ["ComponentCheck", "HealthStatus", "check_health", "get_metrics", "is_alive", "is_ready"]
@@ -27,11 +27,14 @@ def health(request):
     If requested via script, returns JSON.
     """
     if "text/html" in request.headers.get("Accept", ""):
+        from domains.integrations.interface import get_breaker_stats
+
         return render(
             request,
             "health/pages/status/status.html",
             {
                 "page_title": "System Status | DAEMON-ONE",
+                "breakers": get_breaker_stats(),
             },
         )
 
@@ -92,6 +95,38 @@ def liveness(request):
     )
 
 
+@never_cache
+@require_GET
+def metrics(request):
+    """
+    Runtime metrics endpoint (per worker process).
+
+    Exposes in-process counters for caches and background jobs
+    so they can be scraped by monitoring.
+    """
+    return JsonResponse(
+        {
+            "metrics": _collect_metrics(),
+            "timestamp": time.time(),
+        }
+    )
+
+
+def _collect_metrics() -> dict:
+    """Collect in-process metrics from domain interfaces."""
+    from domains.integrations.gemini.interface import get_keyword_cache_stats
+    from domains.integrations.interface import get_breaker_stats, get_http_pool_stats, get_quota_stats
+    from domains.search.interface import get_background_job_stats
+
+    return {
+        "keyword_cache": get_keyword_cache_stats(),
+        "background_jobs": get_background_job_stats(),
+        "http_pools": get_http_pool_stats(),
+        "upstream_quotas": get_quota_stats(),
+        "circuit_breakers": get_breaker_stats(),
+    }
+
+
 def _check_database() -> dict:
     """Check database connectivity."""
     try:
@@ -5,6 +5,7 @@ Endpoints:
 - /health/         - Basic health status
 - /health/ready/   - Readiness probe
 - /health/live/    - Liveness probe
+- /health/metrics/ - Runtime metrics (caches, background jobs)
 """
 
 from django.urls import path
@@ -17,4 +18,5 @@ urlpatterns = [
     path("", views.health, name="health"),
     path("ready/", views.readiness, name="readiness"),
     path("live/", views.liveness, name="liveness"),
+    path("metrics/", views.metrics, name="metrics"),
 ]
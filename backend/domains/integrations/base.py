@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import logging
 import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -12,6 +13,8 @@ from decimal import Decimal
 
 import httpx
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CrawlResult:
@@ -32,6 +35,14 @@ class CrawlResult:
     mall_name: str = ""  # 판매처명
 
 
+class CrawlError(Exception):
+    """업스트림 호출 실패 (타임아웃, HTTP 에러, API 에러 응답) - 결과 없음과 구분"""
+
+    def __init__(self, platform: str, message: str):
+        super().__init__(f"[{platform}] {message}")
+        self.platform = platform
+
+
 class BaseCrawler(ABC):
     """크롤러 베이스 클래스"""
 
@@ -50,12 +61,9 @@ class BaseCrawler(ABC):
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     ]
 
-    def __init__(self):
-        self._client: httpx.AsyncClient | None = None
-
     @property
     def headers(self) -> dict:
-        """랜덤 User-Agent 포함 헤더"""
+        """랜덤 User-Agent 포함 헤더 (요청마다 지정, 공유 풀 클라이언트에는 기본 헤더 없음)"""
         return {
             "User-Agent": random.choice(self.USER_AGENTS),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -65,19 +73,28 @@ class BaseCrawler(ABC):
         }
 
     async def get_client(self) -> httpx.AsyncClient:
-        """HTTP 클라이언트 (싱글톤)"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                headers=self.headers,
-                timeout=30.0,
-                follow_redirects=True,
-            )
-        return self._client
-
-    async def close(self):
-        """클라이언트 종료"""
-        if self._client:
-            await self._client.aclose()
+        """플랫폼 공유 HTTP 클라이언트 (워커 연결 풀, http_pool 참고)"""
+        from .http_pool import get_http_client
+
+        return get_http_client(self.PLATFORM_NAME)
+
+    async def acquire_quota(self, raise_errors: bool = False) -> bool:
+        """
+        클러스터 공유 호출 한도 확보 (quota 참고)
+
+        Returns:
+            False면 한도 초과 - 호출하지 말 것 (raise_errors=True면 QuotaExceeded)
+        """
+        from .quota import QuotaExceeded, aacquire_quota
+
+        try:
+            await aacquire_quota(self.PLATFORM_NAME)
+        except QuotaExceeded as e:
+            logger.warning(str(e))
+            if raise_errors:
+                raise
+            return False
+        return True
 
     async def delay(self):
         """Rate limiting delay"""
@@ -86,8 +103,10 @@ class BaseCrawler(ABC):
     async def fetch(self, url: str, retries: int = 0) -> str | None:
         """URL fetch with retry"""
         try:
+            if not await self.acquire_quota():
+                return None
             client = await self.get_client()
-            response = await client.get(url)
+            response = await client.get(url, headers=self.headers, follow_redirects=True, timeout=30.0)
             response.raise_for_status()
             await self.delay()
             return response.text
@@ -100,8 +119,22 @@ class BaseCrawler(ABC):
             return None
 
     @abstractmethod
-    async def search(self, keyword: str, limit: int = 20) -> list[CrawlResult]:
-        """키워드로 제품 검색"""
+    async def search(
+        self,
+        keyword: str,
+        limit: int = 20,
+        raise_errors: bool = False,
+        price_min: int | None = None,
+        price_max: int | None = None,
+        timeout: float = 10.0,
+    ) -> list[CrawlResult]:
+        """
+        키워드로 제품 검색
+
+        raise_errors=True면 호출 실패 시 빈 리스트 대신 CrawlError 발생.
+        price_min/price_max가 있으면 범위 밖 상품은 변환 전에 제외.
+        timeout은 요청 타임아웃 (초).
+        """
         pass
 
     @abstractmethod
@@ -109,6 +142,11 @@ class BaseCrawler(ABC):
         """제품 URL에서 가격 정보 추출"""
         pass
 
+    @staticmethod
+    def in_price_range(price: Decimal, price_min: int | None, price_max: int | None) -> bool:
+        """가격 범위 체크 (범위가 없으면 True)"""
+        return (price_min is None or price >= price_min) and (price_max is None or price <= price_max)
+
     def parse_price(self, price_text: str) -> Decimal:
         """가격 문자열 → Decimal 변환"""
         # "₩12,900" → 12900
@@ -0,0 +1,224 @@
+"""
+🔌 Circuit Breakers
+
+플랫폼별 서킷 브레이커 + 적응형 타임아웃 (워커 단위).
+
+- 최근 BREAKER_WINDOW초 호출의 에러율과 지연 시간(p50/p95)을 추적
+- 에러율이 BREAKER_ERROR_RATE 이상이면 (BREAKER_MIN_CALLS건 이상일 때) open:
+  업스트림을 호출하지 않고 바로 CircuitOpen
+- BREAKER_COOLDOWN초 뒤 half-open: probe 호출 하나만 통과시켜 성공하면 closed,
+  실패하면 다시 open
+- 타임아웃 = 최근 성공 호출 p95 x BREAKER_TIMEOUT_FACTOR
+  (BREAKER_MIN_TIMEOUT ~ 플랫폼 기본 타임아웃, 표본이 적으면 기본 타임아웃)
+- 호출 한도 초과(QuotaExceeded)와 취소는 업스트림 장애가 아니므로 집계하지 않음
+- 상태는 /health/ 상태 페이지와 /health/metrics/에 노출
+"""
+
+import math
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from django.conf import settings
+
+from .base import CrawlError
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 브레이커당 보관하는 최근 호출 수 상한 (윈도우 안에서도 이 이상은 버림)
+MAX_SAMPLES = 500
+
+
+class CircuitOpen(CrawlError):
+    """서킷이 열려 있어 업스트림을 호출하지 않음"""
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+class CircuitBreaker:
+    """
+    플랫폼 하나의 서킷 브레이커
+
+    Args:
+        name: 플랫폼 이름 (CircuitOpen.platform)
+        max_timeout: 기본(최대) 타임아웃 (초)
+    """
+
+    def __init__(self, name: str, max_timeout: float) -> None:
+        self.name = name
+        self.max_timeout = max_timeout
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.counters: Counter = Counter()
+        self._calls: deque[tuple[float, bool, float]] = deque(maxlen=MAX_SAMPLES)
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def _window(self, now: float) -> list[tuple[float, bool, float]]:
+        cutoff = now - getattr(settings, "BREAKER_WINDOW", 60)
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
+        return list(self._calls)
+
+    def _latencies(self, now: float) -> list[float]:
+        return sorted(latency for _, ok, latency in self._window(now) if ok)
+
+    def timeout(self) -> float:
+        """최근 성공 호출 p95 기반 타임아웃 (초)"""
+        with self._lock:
+            latencies = self._latencies(time.monotonic())
+        if len(latencies) < getattr(settings, "BREAKER_MIN_CALLS", 10):
+            return self.max_timeout
+        timeout = _percentile(latencies, 0.95) * getattr(settings, "BREAKER_TIMEOUT_FACTOR", 2.0)
+        return min(self.max_timeout, max(getattr(settings, "BREAKER_MIN_TIMEOUT", 1.0), timeout))
+
+    def allow(self) -> bool:
+        """
+        호출 가능 여부 확인
+
+        Returns:
+            True면 이 호출이 half-open probe (결과를 record/release에 probe=True로 전달)
+
+        Raises:
+            CircuitOpen: 서킷이 열려 있거나 probe가 이미 진행 중
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < getattr(settings, "BREAKER_COOLDOWN", 30):
+                    self.counters["rejected"] += 1
+                    raise CircuitOpen(self.name, "circuit open")
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    self.counters["rejected"] += 1
+                    raise CircuitOpen(self.name, "circuit half-open (probe in flight)")
+                self._probe_in_flight = True
+                self.counters["probes"] += 1
+                return True
+            return False
+
+    def record(self, ok: bool, latency: float, probe: bool = False) -> None:
+        """호출 결과 기록 → 상태 전환"""
+        with self._lock:
+            now = time.monotonic()
+            self.counters["succeeded" if ok else "failed"] += 1
+            if probe:
+                self._probe_in_flight = False
+                if ok:
+                    # 회복: 장애 구간 기록은 버리고 새로 집계
+                    self.state = CLOSED
+                    self._calls.clear()
+                    self._calls.append((now, ok, latency))
+                else:
+                    self._open(now)
+                return
+
+            self._calls.append((now, ok, latency))
+            if not ok and self.state == CLOSED:
+                window = self._window(now)
+                failures = sum(1 for _, call_ok, _ in window if not call_ok)
+                if len(window) >= getattr(settings, "BREAKER_MIN_CALLS", 10) and failures / len(window) >= getattr(
+                    settings, "BREAKER_ERROR_RATE", 0.5
+                ):
+                    self._open(now)
+
+    def release(self, probe: bool = False) -> None:
+        """결과를 집계하지 않는 호출 종료 (probe였으면 자리만 반환)"""
+        if probe:
+            with self._lock:
+                self._probe_in_flight = False
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self.opened_at = now
+        self.counters["opened"] += 1
+
+    async def acall(self, func: Callable[[float], Awaitable[T]]) -> T:
+        """
+        브레이커를 거쳐 업스트림 호출
+
+        Args:
+            func: 타임아웃(초)을 받아 호출하는 코루틴 함수 (실패 시 예외)
+
+        Raises:
+            CircuitOpen: 서킷이 열려 있음 (호출하지 않음)
+        """
+        from .quota import QuotaExceeded
+
+        probe = self.allow()
+        started = time.monotonic()
+        try:
+            result = await func(self.timeout())
+        except QuotaExceeded:
+            self.release(probe)
+            raise
+        except Exception:
+            self.record(False, time.monotonic() - started, probe)
+            raise
+        except BaseException:
+            # 취소 (데드라인/연결 종료) - 업스트림 상태와 무관
+            self.release(probe)
+            raise
+        self.record(True, time.monotonic() - started, probe)
+        return result
+
+    def call(self, func: Callable[[float], T]) -> T:
+        """브레이커를 거쳐 업스트림 호출 (sync, acall 참고)"""
+        from .quota import QuotaExceeded
+
+        probe = self.allow()
+        started = time.monotonic()
+        try:
+            result = func(self.timeout())
+        except QuotaExceeded:
+            self.release(probe)
+            raise
+        except Exception:
+            self.record(False, time.monotonic() - started, probe)
+            raise
+        self.record(True, time.monotonic() - started, probe)
+        return result
+
+    def snapshot(self) -> dict:
+        """현재 상태/에러율/지연 시간"""
+        timeout = self.timeout()
+        with self._lock:
+            now = time.monotonic()
+            window = self._window(now)
+            latencies = self._latencies(now)
+            failures = sum(1 for _, ok, _ in window if not ok)
+            return {
+                "name": self.name,
+                "state": self.state,
+                "calls": len(window),
+                "error_rate": round(failures / len(window), 3) if window else 0.0,
+                "p50_ms": round(_percentile(latencies, 0.5) * 1000) if latencies else None,
+                "p95_ms": round(_percentile(latencies, 0.95) * 1000) if latencies else None,
+                "timeout_ms": round(timeout * 1000),
+                "open_for": round(now - self.opened_at, 1) if self.state != CLOSED else None,
+                **dict(self.counters),
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(name: str, max_timeout: float = 10.0) -> CircuitBreaker:
+    """플랫폼 브레이커 (워커당 1개)"""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name, max_timeout)
+    return breaker
+
+
+def get_breaker_stats() -> list[dict]:
+    """모든 플랫폼 브레이커 상태 (이름순)"""
+    return [_breakers[name].snapshot() for name in sorted(_breakers)]
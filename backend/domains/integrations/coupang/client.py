@@ -12,9 +12,11 @@ import time
 from typing import Any
 from urllib.parse import urlencode
 
-import httpx
 from django.conf import settings
 
+from ..http_pool import get_http_client
+from ..quota import aacquire_quota
+
 
 class CoupangPartnersClient:
     """
@@ -99,17 +101,18 @@ class CoupangPartnersClient:
             "Content-Type": "application/json;charset=UTF-8",
         }
 
-        async with httpx.AsyncClient(trust_env=False) as client:
-            response = await client.get(
-                f"{self.BASE_URL}{path}",
-                params=query_params,
-                headers=headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        await aacquire_quota("coupang")
+        client = get_http_client("coupang")
+        response = await client.get(
+            f"{self.BASE_URL}{path}",
+            params=query_params,
+            headers=headers,
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            return data.get("data", [])
+        return data.get("data", [])
 
     async def get_product_detail(
         self,
@@ -131,16 +134,17 @@ class CoupangPartnersClient:
             "Content-Type": "application/json;charset=UTF-8",
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}{path}",
-                headers=headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        await aacquire_quota("coupang")
+        client = get_http_client("coupang")
+        response = await client.get(
+            f"{self.BASE_URL}{path}",
+            headers=headers,
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            return data.get("data")
+        return data.get("data")
 
     async def generate_deeplink(
         self,
@@ -166,18 +170,19 @@ class CoupangPartnersClient:
             "coupangUrls": [product_url],
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}{path}",
-                json=payload,
-                headers=headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            links = data.get("data", [])
-            return links[0] if links else None
+        await aacquire_quota("coupang")
+        client = get_http_client("coupang")
+        response = await client.post(
+            f"{self.BASE_URL}{path}",
+            json=payload,
+            headers=headers,
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        links = data.get("data", [])
+        return links[0] if links else None
 
 
 # Singleton instance
@@ -14,10 +14,14 @@ from decimal import Decimal
 import httpx
 from django.conf import settings
 
-from ..base import BaseCrawler, CrawlResult
+from ..base import BaseCrawler, CrawlError, CrawlResult
+from .parser import ProductStreamParser
 
 logger = logging.getLogger(__name__)
 
+# BuySatisfy(구매만족도, 0~100) → CrawlResult.rating(5점 만점) 환산 배수
+BUY_SATISFY_SCALE = 20
+
 
 class ElevenStreetClient(BaseCrawler):
     """11번가 Open API 클라이언트"""
@@ -29,13 +33,30 @@ class ElevenStreetClient(BaseCrawler):
         super().__init__()
         self.api_key = getattr(settings, "ELEVENST_API_KEY", "")
 
-    async def search(self, keyword: str, limit: int = 20) -> list[CrawlResult]:
+    # 가격 범위 검색 시 한 번에 가져올 개수 (API 최대 200)
+    PRICE_RANGE_PAGE_SIZE = 100
+
+    async def search(
+        self,
+        keyword: str,
+        limit: int = 20,
+        raise_errors: bool = False,
+        price_min: int | None = None,
+        price_max: int | None = None,
+        timeout: float = 10.0,
+    ) -> list[CrawlResult]:
         """
         11번가 상품 검색
 
+        가격 범위가 있으면 넉넉히 가져와서 범위 밖 상품은 CrawlResult 변환 전에 제외.
+
         Args:
             keyword: 검색 키워드
             limit: 최대 결과 수 (최대 200)
+            raise_errors: True면 호출 실패 시 CrawlError 발생 (기본: 빈 리스트)
+            price_min: 최저 가격 (원)
+            price_max: 최고 가격 (원)
+            timeout: 요청 타임아웃 (초, 서킷 브레이커가 최근 p95로 조정)
 
         Returns:
             list[CrawlResult]: 검색 결과 리스트
@@ -44,123 +65,129 @@ class ElevenStreetClient(BaseCrawler):
             logger.warning("11번가 API key not configured")
             return []
 
+        # 클러스터 공유 호출 한도 (초과 시 호출하지 않음)
+        if not await self.acquire_quota(raise_errors):
+            return []
+
+        has_price_range = price_min is not None or price_max is not None
         params = {
             "key": self.api_key,
             "apiCode": "ProductSearch",
             "keyword": keyword,
             "pageNum": 1,
-            "pageSize": min(limit, 200),
+            "pageSize": self.PRICE_RANGE_PAGE_SIZE if has_price_range else min(limit, 200),
             "sortCd": "CP",  # CP: 인기도순, A: 정확도순, L: 낮은가격순, H: 높은가격순
         }
 
         results = []
+        error = None
         try:
-            # Disable proxy to avoid connection issues
-            async with httpx.AsyncClient(timeout=10.0, trust_env=False) as client:
-                response = await client.get(self.BASE_URL, params=params)
-
+            # 워커 공유 연결 풀 (keep-alive) - 응답을 받는 대로 스트리밍 파싱
+            client = await self.get_client()
+            async with client.stream("GET", self.BASE_URL, params=params, timeout=timeout) as response:
                 if response.status_code == 200:
-                    # XML 파싱
-                    root = ET.fromstring(response.text)
+                    parser = ProductStreamParser(encoding=response.charset_encoding)
+                    async for chunk in response.aiter_bytes():
+                        self._collect_results(results, parser.feed(chunk), limit, price_min, price_max)
+                    self._collect_results(results, parser.close(), limit, price_min, price_max)
 
                     # 에러 체크
-                    error_code = root.find(".//ErrorCode")
-                    if error_code is not None and error_code.text != "0":
-                        error_msg = root.find(".//ErrorMessage")
-                        logger.error(f"11번가 API 에러: {error_msg.text if error_msg is not None else 'Unknown'}")
+                    if parser.error:
+                        error = parser.error
+                        logger.error(f"11번가 API 에러: {error}")
+                        if raise_errors:
+                            raise CrawlError(self.PLATFORM_NAME, error)
                         return []
+                else:
+                    error = f"HTTP {response.status_code}"
 
-                    # 상품 목록 파싱
-                    products = root.findall(".//Product")
-
-                    for product in products:
-                        try:
-                            # 필수 필드 추출
-                            product_name = self._get_text(product, "ProductName", "")
-                            if not product_name:
-                                continue
-
-                            # 가격 정보
-                            sale_price = self._get_text(product, "SalePrice", "0")
-                            price = Decimal(sale_price.replace(",", "")) if sale_price else Decimal(0)
-
-                            if price <= 0:
-                                continue
-
-                            # 원래 가격 (할인 전)
-                            original_price_str = self._get_text(product, "Price", "0")
-                            original_price = (
-                                Decimal(original_price_str.replace(",", "")) if original_price_str else None
-                            )
-
-                            # 할인율
-                            discount_percent = None
-                            if original_price and original_price > price:
-                                discount_percent = int(((original_price - price) / original_price) * 100)
-
-                            # 상품 ID 및 URL
-                            self._get_text(product, "ProductCode", "")
-                            detail_page_url = self._get_text(product, "DetailPageUrl", "")
-
-                            # 이미지
-                            product_image = self._get_text(product, "ProductImage300", "")
-                            if not product_image:
-                                product_image = self._get_text(product, "ProductImage", "")
-
-                            # 판매자 정보
-                            seller_nm = self._get_text(product, "SellerNm", "11번가")
-
-                            # 평점 (11번가 API에서 제공되는 경우)
-                            rating = None
-                            rating_str = self._get_text(product, "BuySatisfy", "")
-                            if rating_str:
-                                try:
-                                    rating = float(rating_str)
-                                except ValueError:
-                                    pass
-
-                            # 리뷰 수
-                            review_count = 0
-                            review_count_str = self._get_text(product, "ReviewCount", "0")
-                            try:
-                                review_count = int(review_count_str.replace(",", ""))
-                            except ValueError:
-                                pass
-
-                            results.append(
-                                CrawlResult(
-                                    product_name=product_name,
-                                    price=price,
-                                    original_price=original_price,
-                                    discount_percent=discount_percent,
-                                    url=detail_page_url,
-                                    image_url=product_image,
-                                    platform=self.PLATFORM_NAME,
-                                    is_in_stock=True,
-                                    mall_name=seller_nm,
-                                    rating=rating,
-                                    review_count=review_count,
-                                )
-                            )
-                        except Exception as e:
-                            logger.debug(f"11번가 상품 파싱 실패: {e}")
-                            continue
-
+        except CrawlError:
+            raise
         except httpx.TimeoutException:
             logger.warning("11번가 API 타임아웃")
+            error = "timeout"
         except ET.ParseError as e:
             logger.error(f"11번가 API XML 파싱 에러: {e}")
+            error = f"XML parse error: {e}"
         except Exception as e:
             logger.exception(f"11번가 API 호출 실패: {e}")
+            error = str(e) or type(e).__name__
+
+        if error and raise_errors:
+            raise CrawlError(self.PLATFORM_NAME, error)
 
         return results
 
-    def _get_text(self, element: ET.Element, tag: str, default: str = "") -> str:
-        """XML 요소에서 텍스트 추출"""
-        child = element.find(tag)
-        if child is not None and child.text:
-            return child.text.strip()
-        return default
+    def _collect_results(
+        self,
+        results: list[CrawlResult],
+        products: list[dict[str, str]],
+        limit: int,
+        price_min: int | None,
+        price_max: int | None,
+    ) -> None:
+        """파싱된 상품 필드 → CrawlResult (가격 범위 밖/가격 없음 제외, limit까지)"""
+        for fields in products:
+            if len(results) >= limit:
+                return
+            try:
+                result = self._to_result(fields)
+            except Exception as e:
+                logger.debug(f"11번가 상품 파싱 실패: {e}")
+                continue
+            if result is not None and self.in_price_range(result.price, price_min, price_max):
+                results.append(result)
+
+    def _to_result(self, fields: dict[str, str]) -> CrawlResult | None:
+        """<Product> 필드 → CrawlResult (필수 필드가 없으면 None)"""
+        product_name = fields.get("ProductName", "")
+        if not product_name:
+            return None
+
+        # 가격 정보
+        sale_price = fields.get("SalePrice", "0")
+        price = Decimal(sale_price.replace(",", "")) if sale_price else Decimal(0)
+        if price <= 0:
+            return None
+
+        # 원래 가격 (할인 전)
+        original_price_str = fields.get("Price", "0")
+        original_price = Decimal(original_price_str.replace(",", "")) if original_price_str else None
+
+        # 할인율
+        discount_percent = None
+        if original_price and original_price > price:
+            discount_percent = int(((original_price - price) / original_price) * 100)
+
+        # 평점 (11번가 API에서 제공되는 경우) - 구매만족도(0~100) → 5점 만점
+        rating = None
+        rating_str = fields.get("BuySatisfy", "")
+        if rating_str:
+            try:
+                rating = round(min(max(float(rating_str), 0.0), 100.0) / BUY_SATISFY_SCALE, 2)
+            except ValueError:
+                pass
+
+        # 리뷰 수
+        review_count = 0
+        try:
+            review_count = int(fields.get("ReviewCount", "0").replace(",", ""))
+        except ValueError:
+            pass
+
+        return CrawlResult(
+            product_name=product_name,
+            price=price,
+            original_price=original_price,
+            discount_percent=discount_percent,
+            url=fields.get("DetailPageUrl", ""),
+            image_url=fields.get("ProductImage300") or fields.get("ProductImage", ""),
+            platform=self.PLATFORM_NAME,
+            is_in_stock=True,
+            mall_name=fields.get("SellerNm", "11번가"),
+            rating=rating,
+            review_count=review_count,
+        )
 
     async def get_price(self, product_url: str) -> CrawlResult | None:
         """
@@ -4,18 +4,43 @@
 Public API for 11st integration.
 """
 
+from ..base import CrawlError
+from ..breaker import get_breaker
 from .client import elevenst_client
 
+breaker = get_breaker("11st", max_timeout=10.0)
 
-async def search_elevenst_products(keyword: str, limit: int = 20) -> list:
+
+async def search_elevenst_products(
+    keyword: str,
+    limit: int = 20,
+    raise_errors: bool = False,
+    price_min: int | None = None,
+    price_max: int | None = None,
+) -> list:
     """
     11번가 상품 검색
 
+    서킷 브레이커를 거친다: 장애 중이면 호출하지 않고 바로 실패 (raise_errors=True면 CircuitOpen),
+    타임아웃은 최근 응답 시간 p95 기준.
+
     Args:
         keyword: 검색 키워드
         limit: 최대 결과 수
+        raise_errors: True면 호출 실패 시 CrawlError 발생 (결과 없음과 구분)
+        price_min: 최저 가격 (원, 범위 밖 상품 제외)
+        price_max: 최고 가격 (원)
 
     Returns:
         list[CrawlResult]: 검색 결과 리스트
     """
-    return await elevenst_client.search(keyword, limit=limit)
+    try:
+        return await breaker.acall(
+            lambda timeout: elevenst_client.search(
+                keyword, limit=limit, raise_errors=True, price_min=price_min, price_max=price_max, timeout=timeout
+            )
+        )
+    except CrawlError:
+        if raise_errors:
+            raise
+        return []
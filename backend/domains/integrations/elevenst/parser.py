@@ -0,0 +1,106 @@
+"""
+🛒 11번가 Open API XML Parser
+
+상품 검색 응답을 받는 대로 읽는 스트리밍 파서.
+
+- XMLPullParser로 청크 단위 파싱. <Product>가 끝날 때마다 필요한 필드만 dict로 꺼내고
+  하위 요소는 비운다 (응답 전체 문자열/트리를 만들지 않음)
+- 11번가 응답은 EUC-KR이고 expat은 멀티바이트 인코딩 바이트를 직접 읽지 못하므로
+  청크를 점진 디코딩해서 넣는다 (HTTP charset → XML 선언 → UTF-8 순)
+"""
+
+import codecs
+import re
+import xml.etree.ElementTree as ET
+
+# ElevenStreetClient가 사용하는 <Product> 필드 (나머지 태그는 무시)
+PRODUCT_FIELDS = frozenset(
+    {
+        "ProductName",
+        "SalePrice",
+        "Price",
+        "DetailPageUrl",
+        "ProductImage300",
+        "ProductImage",
+        "SellerNm",
+        "BuySatisfy",
+        "ReviewCount",
+    }
+)
+
+# XML 선언을 찾을 때 버퍼링하는 최대 바이트
+DECLARATION_MAX_BYTES = 256
+
+_ENCODING_RE = re.compile(rb"""<\?xml[^>]*encoding=["']([A-Za-z0-9._-]+)["']""")
+
+
+class ProductStreamParser:
+    """
+    11번가 상품 검색 응답 스트리밍 파서
+
+    feed()에 바이트 청크를 넣으면 그 사이에 완성된 <Product>의 {필드: 텍스트}를 반환한다.
+    응답이 끝나면 close()를 호출 (잘린 XML이면 ET.ParseError).
+
+    Args:
+        encoding: 응답 인코딩 (HTTP charset). None이면 XML 선언, 없으면 UTF-8
+    """
+
+    def __init__(self, encoding: str | None = None) -> None:
+        self.encoding = encoding
+        self.error_code: str | None = None
+        self.error_message: str | None = None
+        self._decoder = None
+        self._pending = b""
+        self._parser = ET.XMLPullParser(events=("end",))
+
+    @property
+    def error(self) -> str | None:
+        """API 에러 메시지 (ErrorCode가 0이 아닌 경우)"""
+        if self.error_code is not None and self.error_code != "0":
+            return self.error_message or "Unknown"
+        return None
+
+    def feed(self, chunk: bytes) -> list[dict[str, str]]:
+        """바이트 청크 파싱 → 완성된 상품 필드 목록"""
+        if self._decoder is None:
+            self._pending += chunk
+            if b"?>" not in self._pending and len(self._pending) < DECLARATION_MAX_BYTES:
+                return []
+            chunk = self._start_decoding()
+        return self._parse(self._decoder.decode(chunk))
+
+    def close(self) -> list[dict[str, str]]:
+        """남은 입력 파싱 후 종료"""
+        chunk = self._start_decoding() if self._decoder is None else b""
+        products = self._parse(self._decoder.decode(chunk, final=True))
+        self._parser.close()
+        return products + self._read_events()
+
+    def _start_decoding(self) -> bytes:
+        if self.encoding is None:
+            match = _ENCODING_RE.search(self._pending)
+            self.encoding = match.group(1).decode("ascii") if match else "utf-8"
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        pending, self._pending = self._pending, b""
+        return pending
+
+    def _parse(self, text: str) -> list[dict[str, str]]:
+        if text:
+            self._parser.feed(text)
+        return self._read_events()
+
+    def _read_events(self) -> list[dict[str, str]]:
+        products = []
+        for _, element in self._parser.read_events():
+            tag = element.tag
+            if tag == "Product":
+                products.append(
+                    {child.tag: child.text.strip() for child in element if child.tag in PRODUCT_FIELDS and child.text}
+                )
+                # 처리한 상품의 하위 요소 해제 (트리가 응답 크기만큼 자라지 않게)
+                element.clear()
+            elif tag == "ErrorCode":
+                self.error_code = (element.text or "").strip()
+            elif tag == "ErrorMessage":
+                self.error_message = (element.text or "").strip()
+        return products
@@ -0,0 +1,163 @@
+"""
+🤖 Gemini Keyword Cache
+
+키워드 추출 결과 2단 캐시 (in-process LRU → Redis).
+
+트래픽 대부분이 반복되는 영양제 검색어("루테인", "피로 회복")이므로
+정규화된 쿼리 기준으로 KeywordExtractionResult 전체를 캐시한다.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .client import KeywordExtractionResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "gemini:keywords:v2"  # v2: price_range 추출 프롬프트
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (공백 정리 + 소문자)"""
+    return " ".join(query.split()).lower()
+
+
+class KeywordCache:
+    """
+    키워드 추출 결과 캐시
+
+    - L1: 워커 내 LRU (OrderedDict, 최대 max_entries개)
+    - L2: django_redis 캐시 (워커/컨테이너 간 공유)
+    - 두 계층 모두 같은 TTL 사용
+    """
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local: OrderedDict[str, tuple[float, KeywordExtractionResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _key(self, query: str) -> str:
+        digest = hashlib.sha1(normalize_query(query).encode("utf-8")).hexdigest()
+        return f"{CACHE_KEY_PREFIX}:{digest}"
+
+    # --- L1 (in-process) ---
+
+    def _get_local(self, key: str) -> KeywordExtractionResult | None:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            self.local_hits += 1
+            return result
+
+    def _set_local(self, key: str, result: KeywordExtractionResult) -> None:
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.ttl, result)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    # --- L2 (Redis) ---
+
+    def _from_redis(self, key: str, data: dict | None) -> KeywordExtractionResult | None:
+        if not data:
+            with self._lock:
+                self.misses += 1
+            return None
+        result = KeywordExtractionResult(**data)
+        with self._lock:
+            self.redis_hits += 1
+        self._set_local(key, result)
+        return result
+
+    def get(self, query: str) -> KeywordExtractionResult | None:
+        """캐시 조회 (L1 → L2)"""
+        key = self._key(query)
+        result = self._get_local(key)
+        if result is not None:
+            return result
+        try:
+            data = cache.get(key)
+        except Exception as e:
+            logger.debug(f"Keyword cache read failed: {e}")
+            data = None
+        return self._from_redis(key, data)
+
+    async def aget(self, query: str) -> KeywordExtractionResult | None:
+        """캐시 조회 (async)"""
+        key = self._key(query)
+        result = self._get_local(key)
+        if result is not None:
+            return result
+        try:
+            data = await cache.aget(key)
+        except Exception as e:
+            logger.debug(f"Keyword cache read failed: {e}")
+            data = None
+        return self._from_redis(key, data)
+
+    def set(self, query: str, result: KeywordExtractionResult) -> None:
+        """캐시 저장 (L1 + L2)"""
+        key = self._key(query)
+        self._set_local(key, result)
+        try:
+            cache.set(key, asdict(result), timeout=self.ttl)
+        except Exception as e:
+            logger.debug(f"Keyword cache write failed: {e}")
+
+    async def aset(self, query: str, result: KeywordExtractionResult) -> None:
+        """캐시 저장 (async)"""
+        key = self._key(query)
+        self._set_local(key, result)
+        try:
+            await cache.aset(key, asdict(result), timeout=self.ttl)
+        except Exception as e:
+            logger.debug(f"Keyword cache write failed: {e}")
+
+    def clear_local(self) -> None:
+        """L1 캐시 비우기 (테스트/운영용)"""
+        with self._lock:
+            self._local.clear()
+
+    def stats(self) -> dict:
+        """히트/미스 카운터"""
+        with self._lock:
+            lookups = self.local_hits + self.redis_hits + self.misses
+            hits = self.local_hits + self.redis_hits
+            return {
+                "local_hits": self.local_hits,
+                "redis_hits": self.redis_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "local_size": len(self._local),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+            }
+
+
+def is_cacheable(query: str, result: KeywordExtractionResult) -> bool:
+    """Gemini 실패/미설정 시의 fallback 결과(keywords=[query])는 캐시하지 않음"""
+    return bool(result.category) or result.keywords != [query]
+
+
+# Singleton instance
+keyword_cache = KeywordCache(
+    max_entries=getattr(settings, "KEYWORD_CACHE_MAX_ENTRIES", 1024),
+    ttl=getattr(settings, "KEYWORD_CACHE_TTL", 60 * 60 * 6),
+)
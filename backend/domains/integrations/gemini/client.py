@@ -5,6 +5,7 @@ Google Gemini API 클라이언트 (PRD v2).
 google-genai SDK 사용 (새로운 통합 SDK).
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -16,10 +17,15 @@ try:
 except ImportError:
     genai = None
 
+from ..breaker import CircuitOpen, get_breaker
+from ..quota import aacquire_quota, acquire_quota
 from .prompts import KEYWORD_EXTRACTION_PROMPT, RECOMMENDATION_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# 키워드 추출 서킷 브레이커 (장애 시 Gemini 호출 없이 원본 쿼리로 fallback)
+breaker = get_breaker("gemini", max_timeout=10.0)
+
 
 @dataclass
 class KeywordExtractionResult:
@@ -36,6 +42,8 @@ class GeminiClient:
 
     _instance = None
     _client = None
+    _semaphore: asyncio.Semaphore | None = None
+    _semaphore_loop: asyncio.AbstractEventLoop | None = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -53,6 +61,53 @@ class GeminiClient:
 
         self._client = genai.Client(api_key=api_key)
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        워커(이벤트 루프)당 동시 Gemini 호출 수 제한
+
+        asyncio.Semaphore는 생성된 루프에 묶이므로 루프가 바뀌면 새로 만든다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            limit = getattr(settings, "GEMINI_MAX_CONCURRENCY", 8)
+            self._semaphore = asyncio.Semaphore(max(1, limit))
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _parse_keyword_response(self, text: str, query: str) -> KeywordExtractionResult:
+        """Gemini 응답 텍스트(JSON) → KeywordExtractionResult"""
+        text = text.strip()
+
+        # JSON 파싱
+        if text.startswith("```json"):
+            text = text[7:]
+        if text.startswith("```"):
+            text = text[3:]
+        if text.endswith("```"):
+            text = text[:-3]
+        text = text.strip()
+
+        data = json.loads(text)
+
+        price_range = data.get("price_range")
+        if not isinstance(price_range, dict):
+            price_range = {}
+        return KeywordExtractionResult(
+            keywords=data.get("keywords", [query]),
+            category=data.get("category", ""),
+            price_min=self._parse_price(price_range.get("min")),
+            price_max=self._parse_price(price_range.get("max")),
+        )
+
+    @staticmethod
+    def _parse_price(value) -> int | None:
+        """가격 값 정규화 (숫자/숫자 문자열만, 0 이하는 범위 없음)"""
+        try:
+            price = int(float(value))
+        except (TypeError, ValueError):
+            return None
+        return price if price > 0 else None
+
     def extract_keywords(self, query: str) -> KeywordExtractionResult:
         """
         자연어 질문에서 검색 키워드 추출
@@ -72,29 +127,67 @@ class GeminiClient:
 
         try:
             prompt = KEYWORD_EXTRACTION_PROMPT.format(query=query)
-            response = self._client.models.generate_content(
-                model="gemini-2.0-flash",
-                contents=prompt,
+            acquire_quota("gemini")
+            response = breaker.call(
+                lambda timeout: self._client.models.generate_content(
+                    model="gemini-2.0-flash",
+                    contents=prompt,
+                    config={"http_options": {"timeout": int(timeout * 1000)}},
+                )
+            )
+            return self._parse_keyword_response(response.text, query)
+        except CircuitOpen as e:
+            logger.warning(f"Gemini keyword extraction skipped: {e}")
+            return KeywordExtractionResult(
+                keywords=[query],
+                category="",
+            )
+        except Exception as e:
+            logger.exception(f"Gemini keyword extraction failed: {e}")
+            return KeywordExtractionResult(
+                keywords=[query],
+                category="",
             )
-            text = response.text.strip()
 
-            # JSON 파싱
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
+    async def aextract_keywords(self, query: str) -> KeywordExtractionResult:
+        """
+        자연어 질문에서 검색 키워드 추출 (async)
+
+        SDK의 async 클라이언트(client.aio)를 사용하므로 LLM 응답을 기다리는 동안
+        이벤트 루프를 막지 않는다. 동시 호출 수는 워커당 세마포어로 제한.
+
+        Args:
+            query: 사용자 자연어 질문
 
-            data = json.loads(text)
+        Returns:
+            KeywordExtractionResult: 추출된 키워드, 카테고리, 가격 범위
+        """
+        if self._client is None:
+            # Fallback: 원본 쿼리를 키워드로 사용
+            return KeywordExtractionResult(
+                keywords=[query],
+                category="",
+            )
 
-            price_range = data.get("price_range")
+        try:
+            prompt = KEYWORD_EXTRACTION_PROMPT.format(query=query)
+            await aacquire_quota("gemini")
+            async with self._get_semaphore():
+                response = await breaker.acall(
+                    lambda timeout: asyncio.wait_for(
+                        self._client.aio.models.generate_content(
+                            model="gemini-2.0-flash",
+                            contents=prompt,
+                        ),
+                        timeout,
+                    )
+                )
+            return self._parse_keyword_response(response.text, query)
+        except CircuitOpen as e:
+            logger.warning(f"Gemini keyword extraction skipped: {e}")
             return KeywordExtractionResult(
-                keywords=data.get("keywords", [query]),
-                category=data.get("category", ""),
-                price_min=price_range.get("min") if price_range else None,
-                price_max=price_range.get("max") if price_range else None,
+                keywords=[query],
+                category="",
             )
         except Exception as e:
             logger.exception(f"Gemini keyword extraction failed: {e}")
@@ -119,6 +212,7 @@ class GeminiClient:
 
         try:
             prompt = RECOMMENDATION_PROMPT.format(query=query, products_json=products_json)
+            acquire_quota("gemini")
             response = self._client.models.generate_content(
                 model="gemini-2.0-flash",
                 contents=prompt,
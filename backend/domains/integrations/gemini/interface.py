@@ -4,6 +4,7 @@
 Public API for Gemini AI integration.
 """
 
+from .cache import is_cacheable, keyword_cache
 from .client import gemini_client
 
 
@@ -11,13 +12,77 @@ def extract_keywords(query: str):
     """
     자연어 질문에서 검색 키워드 추출
 
+    정규화된 쿼리 기준 2단 캐시(LRU → Redis)를 먼저 확인한다.
+
+    Args:
+        query: 사용자 자연어 질문
+
+    Returns:
+        KeywordExtractionResult: 추출된 키워드, 카테고리, 가격 범위
+    """
+    cached = keyword_cache.get(query)
+    if cached is not None:
+        return cached
+
+    result = gemini_client.extract_keywords(query)
+    if is_cacheable(query, result):
+        keyword_cache.set(query, result)
+    return result
+
+
+async def aextract_keywords(query: str):
+    """
+    자연어 질문에서 검색 키워드 추출 (async, non-blocking)
+
+    async 뷰/오케스트레이터에서 사용. 캐시 미스일 때만 Gemini를 호출하며,
+    워커당 동시 Gemini 호출 수는 settings.GEMINI_MAX_CONCURRENCY로 제한된다.
+
     Args:
         query: 사용자 자연어 질문
 
     Returns:
         KeywordExtractionResult: 추출된 키워드, 카테고리, 가격 범위
     """
-    return gemini_client.extract_keywords(query)
+    cached = await keyword_cache.aget(query)
+    if cached is not None:
+        return cached
+
+    result = await gemini_client.aextract_keywords(query)
+    if is_cacheable(query, result):
+        await keyword_cache.aset(query, result)
+    return result
+
+
+async def awarm_keywords(query: str):
+    """
+    키워드 캐시 예열 (캐시 워머용)
+
+    캐시에 있으면 Gemini를 호출하지 않고 같은 결과를 다시 저장해 TTL만 연장하고,
+    없으면 추출해서 저장한다.
+
+    Args:
+        query: 사용자 자연어 질문
+
+    Returns:
+        KeywordExtractionResult: 추출된 키워드, 카테고리, 가격 범위
+    """
+    result = await keyword_cache.aget(query)
+    if result is None:
+        result = await gemini_client.aextract_keywords(query)
+        if not is_cacheable(query, result):
+            return result
+    await keyword_cache.aset(query, result)
+    return result
+
+
+def get_keyword_cache_stats() -> dict:
+    """
+    키워드 추출 캐시 히트/미스 통계
+
+    Returns:
+        dict: local_hits, redis_hits, misses, hit_rate, local_size, ...
+    """
+    return keyword_cache.stats()
 
 
 def generate_recommendation(query: str, products_json: str) -> str:
@@ -12,9 +12,11 @@ KEYWORD_EXTRACTION_PROMPT = """
 {{
   "keywords": ["키워드1", "키워드2", "키워드3"],
   "category": "영양제 카테고리",
-  "price_range": null
+  "price_range": {{"min": 최저가격(원) 또는 null, "max": 최고가격(원) 또는 null}} 또는 null
 }}
 
+가격 조건("3만원 이하", "1~2만원대")이 있을 때만 price_range를 채우고, 없으면 null.
+
 예시:
 입력: "눈 피로에 좋은 영양제"
 출력: {{"keywords": ["루테인", "빌베리", "아스타잔틴"], "category": "눈 건강", "price_range": null}}
@@ -22,6 +24,9 @@ KEYWORD_EXTRACTION_PROMPT = """
 입력: "피로 회복"
 출력: {{"keywords": ["비타민B", "마그네슘", "코엔자임Q10"], "category": "피로 회복", "price_range": null}}
 
+입력: "3만원 이하 오메가3"
+출력: {{"keywords": ["오메가3", "rTG 오메가3"], "category": "혈행 건강", "price_range": {{"min": null, "max": 30000}}}}
+
 입력: "{query}"
 출력:
 """
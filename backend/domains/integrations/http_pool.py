@@ -0,0 +1,144 @@
+"""
+🔌 Shared HTTP Client Pools
+
+플랫폼별 공유 httpx.AsyncClient (워커/이벤트 루프당 플랫폼마다 1개).
+
+- keep-alive 연결 재사용: 검색마다 DNS 조회/TCP/TLS 연결을 새로 맺지 않음 (HTTP/1.1)
+- 연결 수 상한: HTTP_POOL_MAX_CONNECTIONS / HTTP_POOL_MAX_KEEPALIVE
+- httpx에는 별도 DNS 캐시가 없고 DNS 조회는 새 연결을 맺을 때만 일어나므로,
+  keep-alive 유지 시간(HTTP_POOL_KEEPALIVE_EXPIRY)을 길게 잡아 조회 횟수를 줄인다
+- ASGI lifespan(main.py)에서 open_http_clients() / close_http_clients()로 열고 닫음.
+  asyncio.run()을 쓰는 sync 경로는 run_with_http_clients()로 루프가 끝나기 전에 닫는다
+- 그 밖의 루프(runserver/WSGI의 요청마다 생기는 async_to_sync 루프, 테스트)에서는 아무도
+  클라이언트를 닫지 않으므로 keep-alive 없이 생성 → 응답을 다 읽으면 연결을 바로 닫아
+  루프가 사라져도 소켓이 남지 않음
+"""
+
+import asyncio
+import logging
+import weakref
+from collections import Counter, defaultdict
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import httpx
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# lifespan 시작 시 미리 여는 플랫폼
+PLATFORMS = ("naver", "11st", "coupang")
+
+_clients: dict[str, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+# 끝날 때 close_http_clients()가 호출되는 루프 (keep-alive 연결 풀 사용)
+_pooled_loops: weakref.WeakSet[asyncio.AbstractEventLoop] = weakref.WeakSet()
+pool_stats: defaultdict[str, Counter] = defaultdict(Counter)
+
+
+def _create_client(platform: str, keepalive: bool = True) -> httpx.AsyncClient:
+    stats = pool_stats[platform]
+
+    async def trace(event_name: str, info: dict) -> None:
+        # httpcore trace: 새 연결/TLS 핸드셰이크만 집계 (재사용 비율 계산용)
+        if event_name == "connection.connect_tcp.complete":
+            stats["connections_opened"] += 1
+        elif event_name == "connection.start_tls.complete":
+            stats["tls_handshakes"] += 1
+
+    async def on_request(request: httpx.Request) -> None:
+        stats["requests"] += 1
+        request.extensions["trace"] = trace
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=getattr(settings, "HTTP_POOL_MAX_CONNECTIONS", 32),
+            max_keepalive_connections=getattr(settings, "HTTP_POOL_MAX_KEEPALIVE", 16) if keepalive else 0,
+            keepalive_expiry=getattr(settings, "HTTP_POOL_KEEPALIVE_EXPIRY", 120.0),
+        ),
+        timeout=getattr(settings, "HTTP_POOL_TIMEOUT", 10.0),
+        # 프록시 환경 변수 무시 (기존 클라이언트와 동일)
+        trust_env=False,
+        event_hooks={"request": [on_request]},
+    )
+
+
+def get_http_client(platform: str) -> httpx.AsyncClient:
+    """
+    플랫폼 공유 HTTP 클라이언트
+
+    httpx 연결은 이벤트 루프에 묶여 있으므로 다른 루프에서 호출하면 새로 만든다.
+    open_http_clients()/run_with_http_clients()로 시작한 루프가 아니면 keep-alive 없이 만든다.
+
+    Args:
+        platform: 플랫폼 이름 (naver, 11st, coupang, ...)
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(platform)
+    if entry is not None and entry[0] is loop and not entry[1].is_closed:
+        return entry[1]
+
+    keepalive = loop in _pooled_loops
+    client = _create_client(platform, keepalive=keepalive)
+    _clients[platform] = (loop, client)
+    pool_stats[platform]["clients_created" if keepalive else "unpooled_clients_created"] += 1
+    return client
+
+
+async def open_http_clients(platforms: tuple[str, ...] = PLATFORMS) -> None:
+    """워커 시작 시 플랫폼 클라이언트 생성 (lifespan.startup)"""
+    _pooled_loops.add(asyncio.get_running_loop())
+    for platform in platforms:
+        get_http_client(platform)
+    logger.info(f"[HTTP] Opened pools for {', '.join(platforms)}")
+
+
+async def close_http_clients() -> None:
+    """현재 루프의 클라이언트 연결 종료 (lifespan.shutdown)"""
+    loop = asyncio.get_running_loop()
+    for platform, (client_loop, client) in list(_clients.items()):
+        del _clients[platform]
+        if client_loop is loop:
+            await client.aclose()
+
+
+def run_with_http_clients(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    asyncio.run() + 끝나면 그 루프에서 만든 클라이언트 종료
+
+    루프가 닫힌 뒤에는 클라이언트를 aclose()할 수 없으므로, lifespan 밖에서 asyncio.run()을
+    반복하는 sync 경로(찜 가격 체크, 주기 캐시 예열)는 이 함수로 실행해 keep-alive 연결을 남기지 않는다.
+    """
+
+    async def main() -> T:
+        _pooled_loops.add(asyncio.get_running_loop())
+        try:
+            return await coro
+        finally:
+            await close_http_clients()
+
+    return asyncio.run(main())
+
+
+def get_http_pool_stats() -> dict:
+    """
+    플랫폼별 연결 풀 통계
+
+    Returns:
+        {platform: requests, connections_opened, tls_handshakes, reuse_rate,
+         open/idle 연결 수}
+    """
+    result = {}
+    for platform, counters in pool_stats.items():
+        entry = _clients.get(platform)
+        pool = getattr(getattr(entry[1], "_transport", None), "_pool", None) if entry else None
+        connections = list(getattr(pool, "connections", []))
+        requests = counters["requests"]
+        result[platform] = {
+            **dict(counters),
+            "reuse_rate": round(1 - counters["connections_opened"] / requests, 3) if requests else None,
+            "open": len(connections),
+            "idle": sum(1 for connection in connections if connection.is_idle()),
+        }
+    return result
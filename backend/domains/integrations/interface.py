@@ -0,0 +1,41 @@
+"""
+🔌 Integrations Interface
+
+Public API for shared upstream infrastructure (호출 한도, HTTP 연결 풀, 서킷 브레이커).
+플랫폼별 검색/추출은 각 플랫폼 interface.py (naver, elevenst, gemini, coupang)를 사용.
+
+✅ DAEMON: 다른 도메인은 quota/http_pool/breaker 모듈 대신 이 모듈을 통해서만 사용
+"""
+
+from .breaker import get_breaker_stats
+from .http_pool import (
+    close_http_clients,
+    get_http_client,
+    get_http_pool_stats,
+    open_http_clients,
+    run_with_http_clients,
+)
+from .quota import (
+    QuotaExceeded,
+    aacquire_quota,
+    acquire_quota,
+    background_priority,
+    get_quota_stats,
+)
+
+__all__ = [
+    # Upstream Quotas
+    "QuotaExceeded",
+    "aacquire_quota",
+    "acquire_quota",
+    "background_priority",
+    # HTTP Connection Pools
+    "close_http_clients",
+    # Circuit Breakers
+    "get_breaker_stats",
+    "get_http_client",
+    "get_http_pool_stats",
+    "get_quota_stats",
+    "open_http_clients",
+    "run_with_http_clients",
+]
@@ -5,13 +5,17 @@
 https://developers.naver.com/docs/serviceapi/search/shopping/shopping.md
 """
 
+import asyncio
+import logging
+from collections.abc import AsyncIterator
 from decimal import Decimal
 
-import httpx
 from django.conf import settings
 from pydantic import BaseModel, ConfigDict
 
-from ..base import BaseCrawler, CrawlResult
+from ..base import BaseCrawler, CrawlError, CrawlResult
+
+logger = logging.getLogger(__name__)
 
 
 class NaverProduct(BaseModel):
@@ -46,88 +50,209 @@ class NaverClient(BaseCrawler):
         self.client_id = getattr(settings, "NAVER_CLIENT_ID", "")
         self.client_secret = getattr(settings, "NAVER_CLIENT_SECRET", "")
 
-    async def search(self, keyword: str, limit: int = 20) -> list[CrawlResult]:
+    # 페이지당 최대 개수 / 최대 start (API 제한: display ≤ 100, start ≤ 1000)
+    PAGE_SIZE = 100
+    MAX_START = 1000
+
+    async def search(
+        self,
+        keyword: str,
+        limit: int = 20,
+        raise_errors: bool = False,
+        price_min: int | None = None,
+        price_max: int | None = None,
+        timeout: float = 10.0,
+        pages: int | None = None,
+    ) -> list[CrawlResult]:
         """
         네이버 쇼핑 검색 API 호출
 
+        가격 범위가 있으면 여러 페이지를 동시에 가져와서 범위 안의 상품만 변환
+        (최고 가격이 있으면 가격 오름차순(asc), 최저 가격만 있으면 유사도순).
+        페이지는 도착하는 대로 변환하고, 앞 페이지부터 limit이 차면 남은 요청은 취소 (_iter_pages 참고).
+
         Args:
             keyword: 검색 키워드
             limit: 최대 결과 수 (10~100)
+            raise_errors: True면 호출 실패 시 CrawlError 발생 (기본: 빈 리스트)
+            price_min: 최저 가격 (원)
+            price_max: 최고 가격 (원)
+            timeout: 요청 타임아웃 (초, 서킷 브레이커가 최근 p95로 조정)
+            pages: 가져올 최대 페이지 수 (start=1, 101, 201…). None이면 가격 범위 검색은
+                NAVER_PRICE_RANGE_PAGES, 아니면 1
 
         Returns:
-            list[CrawlResult]: 검색 결과 리스트
+            list[CrawlResult]: 검색 결과 리스트 (페이지 순서)
         """
         if not self.client_id or not self.client_secret:
             return []
 
+        has_price_range = price_min is not None or price_max is not None
+        if pages is None:
+            pages = getattr(settings, "NAVER_PRICE_RANGE_PAGES", 3) if has_price_range else 1
+        pages = max(1, min(pages, self.MAX_START // self.PAGE_SIZE))
+        # 가격 범위/여러 페이지 검색은 범위 밖 상품을 걸러도 limit을 채우도록 한 페이지를 꽉 채워 요청
+        display = self.PAGE_SIZE if has_price_range or pages > 1 else min(limit, 100)  # 10~100
+        # sim(유사도), date(날짜), asc(가격오름차순), dsc(가격내림차순)
+        # 최고 가격이 있을 때만 asc (최저 가격만 있으면 asc 앞 페이지는 거의 전부 범위 밖 → 유사도순 후 필터)
+        sort = "asc" if price_max is not None else "sim"
+
+        logger.info(f"[Naver API] Searching: {keyword}, limit: {limit}, pages: {pages}")
+        by_page: dict[int, list[CrawlResult]] = {}
+        error = None
+        try:
+            async for index, page_results in self._iter_pages(
+                keyword, pages, display, sort, limit, price_min, price_max, timeout
+            ):
+                by_page[index] = page_results
+        except CrawlError as e:
+            # 호출 한도 초과(QuotaExceeded)도 그대로 전달
+            error = e
+
+        results = [result for index in sorted(by_page) for result in by_page[index]][:limit]
+        if error is not None:
+            logger.warning(f"[Naver API] Error: {error} ({len(results)} results from other pages)")
+            # 일부 페이지라도 도착했으면 그 결과로 응답
+            if not results:
+                if raise_errors:
+                    raise error
+                return []
+
+        logger.info(f"[Naver API] Returning {len(results)} results")
+        return results
+
+    async def _iter_pages(
+        self,
+        keyword: str,
+        pages: int,
+        display: int,
+        sort: str,
+        limit: int,
+        price_min: int | None,
+        price_max: int | None,
+        timeout: float,
+    ) -> AsyncIterator[tuple[int, list[CrawlResult]]]:
+        """
+        페이지를 동시에 요청하고 도착하는 순서대로 (페이지 번호, 범위 안 결과) 반환
+
+        남은 요청 취소 조건:
+        - 첫 페이지부터 이어서 도착한 결과가 limit 이상
+        - 마지막 페이지 (display보다 적게 옴)
+        - 가격 오름차순에서 price_max를 넘는 상품이 나온 페이지 (이후 페이지는 모두 범위 밖)
+
+        Raises:
+            CrawlError: 실패한 페이지가 있음 (도착한 페이지를 모두 반환한 뒤)
+        """
+        tasks = {
+            asyncio.create_task(self._fetch_page(keyword, 1 + index * display, display, sort, timeout)): index
+            for index in range(pages)
+        }
+        pending = set(tasks)
+        counts: dict[int, int] = {}
+        last_page = pages - 1
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=tasks.get):
+                    index = tasks[task]
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        counts[index] = 0
+                        continue
+                    items = task.result()
+                    if len(items) < display or (
+                        sort == "asc" and price_max is not None and self._exceeds_price(items, price_max)
+                    ):
+                        last_page = min(last_page, index)
+                    if index > last_page:
+                        counts[index] = 0
+                        continue
+                    # 도착한 페이지부터 바로 변환
+                    page_results = self._to_results(items, price_min, price_max)
+                    counts[index] = len(page_results)
+                    yield index, page_results
+
+                collected = 0
+                for index in range(last_page + 1):
+                    if index not in counts:
+                        break
+                    collected += counts[index]
+                stop = [task for task in pending if tasks[task] > last_page or collected >= limit]
+                for task in stop:
+                    task.cancel()
+                pending.difference_update(stop)
+        finally:
+            # 조기 종료/호출자 취소 (fan-out 데드라인)
+            for task in pending:
+                task.cancel()
+
+        if error is not None:
+            raise error
+
+    async def _fetch_page(self, keyword: str, start: int, display: int, sort: str, timeout: float) -> list[dict]:
+        """검색 API 한 페이지 호출 → items (호출 한도는 페이지마다 차감)"""
+        await self.acquire_quota(raise_errors=True)
         headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret,
         }
+        params = {"query": keyword, "display": display, "start": start, "sort": sort}
+        try:
+            # 워커 공유 연결 풀 (keep-alive)
+            client = await self.get_client()
+            response = await client.get(self.BASE_URL, headers=headers, params=params, timeout=timeout)
+        except Exception as e:
+            raise CrawlError(self.PLATFORM_NAME, str(e) or type(e).__name__) from e
+        logger.info(f"[Naver API] start={start} status: {response.status_code}")
+        if response.status_code != 200:
+            raise CrawlError(self.PLATFORM_NAME, f"HTTP {response.status_code}")
+        return response.json().get("items", [])
 
-        params = {
-            "query": keyword,
-            "display": min(limit, 100),  # 10~100
-            "start": 1,
-            "sort": "sim",  # sim(유사도), date(날짜), asc(가격오름차순), dsc(가격내림차순)
-        }
+    @staticmethod
+    def _exceeds_price(items: list[dict], price_max: int) -> bool:
+        """페이지에 price_max보다 비싼 상품이 있는지 (가격 오름차순 기준)"""
+        prices = [int(item["lprice"]) for item in items if str(item.get("lprice", "")).isdigit()]
+        return bool(prices) and prices[-1] > price_max
 
+    def _to_results(self, items: list[dict], price_min: int | None, price_max: int | None) -> list[CrawlResult]:
+        """API items → 범위 안 CrawlResult 목록"""
         results = []
-        try:
-            # Disable proxy to avoid connection issues
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"[Naver API] Searching: {keyword}, limit: {limit}")
-
-            async with httpx.AsyncClient(timeout=10.0, trust_env=False) as client:
-                response = await client.get(self.BASE_URL, headers=headers, params=params)
-                logger.info(f"[Naver API] Status: {response.status_code}")
-
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("items", [])
-                    logger.info(f"[Naver API] Items found: {len(items)}")
-
-                    for item in items:
-                        try:
-                            # HTML 태그 제거 (title에 <b> 포함됨)
-                            title = item["title"].replace("<b>", "").replace("</b>", "")
-
-                            # lprice가 빈 문자열이거나 0일 수 있음
-                            lprice_str = item.get("lprice", "")
-                            if not lprice_str:
-                                continue
-
-                            price = Decimal(lprice_str)
-                            hprice = Decimal(item.get("hprice", lprice_str)) if item.get("hprice") else None
-
-                            # 할인율 계산
-                            discount_percent = None
-                            if hprice and hprice > price:
-                                discount_percent = int(((hprice - price) / hprice) * 100)
-
-                            results.append(
-                                CrawlResult(
-                                    product_name=title,
-                                    price=price,
-                                    original_price=hprice,
-                                    discount_percent=discount_percent,
-                                    url=item["link"],
-                                    image_url=item.get("image", ""),
-                                    platform=self.PLATFORM_NAME,
-                                    is_in_stock=True,
-                                    mall_name=item.get("mallName", ""),
-                                )
-                            )
-                        except Exception:
-                            continue
+        for item in items:
+            try:
+                # HTML 태그 제거 (title에 <b> 포함됨)
+                title = item["title"].replace("<b>", "").replace("</b>", "")
 
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.exception(f"[Naver API] Error: {e}")
+                # lprice가 빈 문자열이거나 0일 수 있음
+                lprice_str = item.get("lprice", "")
+                if not lprice_str:
+                    continue
 
-        logger.info(f"[Naver API] Returning {len(results)} results")
+                price = Decimal(lprice_str)
+                if not self.in_price_range(price, price_min, price_max):
+                    continue
+                hprice = Decimal(item.get("hprice", lprice_str)) if item.get("hprice") else None
+
+                # 할인율 계산
+                discount_percent = None
+                if hprice and hprice > price:
+                    discount_percent = int(((hprice - price) / hprice) * 100)
+
+                results.append(
+                    CrawlResult(
+                        product_name=title,
+                        price=price,
+                        original_price=hprice,
+                        discount_percent=discount_percent,
+                        url=item["link"],
+                        image_url=item.get("image", ""),
+                        platform=self.PLATFORM_NAME,
+                        is_in_stock=True,
+                        mall_name=item.get("mallName", ""),
+                    )
+                )
+            except Exception:
+                continue
         return results
 
     async def get_price(self, product_url: str) -> CrawlResult | None:
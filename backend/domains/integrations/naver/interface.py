@@ -4,18 +4,51 @@
 Public API for Naver Shopping integration.
 """
 
+from ..base import CrawlError
+from ..breaker import get_breaker
 from .client import naver_client
 
+breaker = get_breaker("naver", max_timeout=10.0)
 
-async def search_naver_products(keyword: str, limit: int = 20) -> list:
+
+async def search_naver_products(
+    keyword: str,
+    limit: int = 20,
+    raise_errors: bool = False,
+    price_min: int | None = None,
+    price_max: int | None = None,
+    pages: int | None = None,
+) -> list:
     """
     네이버 쇼핑 검색
 
+    서킷 브레이커를 거친다: 장애 중이면 호출하지 않고 바로 실패 (raise_errors=True면 CircuitOpen),
+    타임아웃은 최근 응답 시간 p95 기준.
+
     Args:
         keyword: 검색 키워드
         limit: 최대 결과 수
+        raise_errors: True면 호출 실패 시 CrawlError 발생 (결과 없음과 구분)
+        price_min: 최저 가격 (원, 범위 밖 상품 제외)
+        price_max: 최고 가격 (원)
+        pages: 동시에 가져올 최대 페이지 수 (None이면 가격 범위 검색만 NAVER_PRICE_RANGE_PAGES)
 
     Returns:
         list[CrawlResult]: 검색 결과 리스트
     """
-    return await naver_client.search(keyword, limit=limit)
+    try:
+        return await breaker.acall(
+            lambda timeout: naver_client.search(
+                keyword,
+                limit=limit,
+                raise_errors=True,
+                price_min=price_min,
+                price_max=price_max,
+                timeout=timeout,
+                pages=pages,
+            )
+        )
+    except CrawlError:
+        if raise_errors:
+            raise
+        return []
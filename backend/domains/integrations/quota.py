@@ -0,0 +1,272 @@
+"""
+🔌 Upstream Quota Manager
+
+클러스터 공유 업스트림 호출 한도 (Redis 토큰 버킷 + 일일 예산).
+
+- 플랫폼별 토큰 버킷(분당 호출 수, burst)과 일일 예산을 Lua 스크립트 한 번으로 원자적으로
+  차감 → 모든 Granian 워커/컨테이너가 같은 한도를 나눠 쓴다
+- 우선순위: 사용자 검색(interactive)은 버킷/예산 전체를 쓰고, 백그라운드 작업
+  (캐시 갱신/예열, 찜 가격 체크)은 QUOTA_BACKGROUND_RESERVE 비율을 남겨둬야 통과
+- 토큰이 모자라면 우선순위별 최대 대기 시간까지 기다리고, 넘으면 QuotaExceeded
+- Redis를 쓸 수 없으면 워커 메모리 버킷으로 대신 제한 (QUOTA_REDIS_RETRY초 뒤 재시도)
+- 일일 사용량/잔여 예산/소진 예상치는 get_quota_stats()로 노출 (/health/metrics/)
+
+Usage:
+    await aacquire_quota("naver")        # async 클라이언트
+    acquire_quota("gemini")              # sync 클라이언트 (interactive는 대기 없이 실패)
+    with background_priority():          # 백그라운드 작업 전체
+        ...
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.utils import timezone
+
+from .base import CrawlError
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+
+QUOTA_KEY_PREFIX = "quota"
+
+# 일일 사용량 카운터 보관 기간 (초) - 전날 값은 지표용으로 하루 더 남김
+DAILY_KEY_TTL = 60 * 60 * 48
+
+# KEYS[1]: 토큰 버킷 해시, KEYS[2]: 오늘 사용량 카운터
+# ARGV: burst, 초당 충전량, cost, 남겨둘 토큰, 일일 허용량(0이면 무제한), 카운터 TTL
+# 반환: {1, 오늘 사용량} 통과 / {0, 대기 ms} 토큰 부족 / {-1, 오늘 사용량} 일일 예산 소진
+_TAKE_SCRIPT = """
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local reserve = tonumber(ARGV[4])
+local daily_allowed = tonumber(ARGV[5])
+
+local used = tonumber(redis.call('GET', KEYS[2]) or '0')
+if daily_allowed > 0 and used + cost > daily_allowed then
+  return {-1, used}
+end
+
+if rate > 0 then
+  local clock = redis.call('TIME')
+  local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+  local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+  local tokens = burst
+  if state[1] then
+    tokens = math.min(burst, tonumber(state[1]) + math.max(now - tonumber(state[2]), 0) * rate / 1000)
+  end
+  if tokens - cost < reserve then
+    return {0, math.ceil((cost + reserve - tokens) * 1000 / rate)}
+  end
+  redis.call('HSET', KEYS[1], 'tokens', tostring(tokens - cost), 'ts', tostring(now))
+  redis.call('PEXPIRE', KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+end
+
+used = redis.call('INCRBY', KEYS[2], cost)
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[6]))
+return {1, used}
+"""
+
+_priority: ContextVar[str] = ContextVar("quota_priority", default=INTERACTIVE)
+
+_lock = threading.Lock()
+_script = None
+_redis_retry_at = 0.0
+# Redis 불가 시 워커 메모리 상태: {platform: [tokens, monotonic ts]}, {(platform, day): used}
+_local_buckets: dict[str, list[float]] = {}
+_local_daily: Counter = Counter()
+
+quota_stats: defaultdict[str, Counter] = defaultdict(Counter)
+
+
+class QuotaExceeded(CrawlError):
+    """업스트림 호출 한도 초과 - 호출하지 않고 실패 처리"""
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """이 블록(과 여기서 만든 task)의 업스트림 호출을 백그라운드 우선순위로"""
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _limits(config: dict, priority: str) -> tuple[float, float, float, int]:
+    """(burst, 초당 충전량, 남겨둘 토큰, 일일 허용량)"""
+    burst = float(config.get("burst") or 1)
+    rate = config.get("per_minute", 0) / 60
+    daily = config.get("daily", 0)
+    reserve_ratio = getattr(settings, "QUOTA_BACKGROUND_RESERVE", 0.2) if priority == BACKGROUND else 0.0
+    daily_allowed = max(int(daily * (1 - reserve_ratio)), 1) if daily else 0
+    return burst, rate, burst * reserve_ratio, daily_allowed
+
+
+def _daily_key(platform: str) -> str:
+    return f"{QUOTA_KEY_PREFIX}:{platform}:{timezone.localdate():%Y%m%d}"
+
+
+def _get_script():
+    global _script
+    if _script is None:
+        from django_redis import get_redis_connection
+
+        _script = get_redis_connection("default").register_script(_TAKE_SCRIPT)
+    return _script
+
+
+def _take_local(platform: str, cost: int, limits: tuple[float, float, float, int]) -> tuple[int, float]:
+    burst, rate, reserve, daily_allowed = limits
+    day_key = (platform, timezone.localdate())
+    with _lock:
+        if daily_allowed and _local_daily[day_key] + cost > daily_allowed:
+            return -1, _local_daily[day_key]
+        if rate > 0:
+            now = time.monotonic()
+            tokens, ts = _local_buckets.get(platform, (burst, now))
+            tokens = min(burst, tokens + (now - ts) * rate)
+            if tokens - cost < reserve:
+                return 0, (cost + reserve - tokens) * 1000 / rate
+            _local_buckets[platform] = [tokens - cost, now]
+        _local_daily[day_key] += cost
+        return 1, _local_daily[day_key]
+
+
+def _take(platform: str, cost: int, limits: tuple[float, float, float, int]) -> tuple[int, float]:
+    """토큰/일일 예산 차감 시도 (Redis → 실패 시 워커 메모리)"""
+    global _redis_retry_at
+    if time.monotonic() >= _redis_retry_at:
+        burst, rate, reserve, daily_allowed = limits
+        try:
+            status, value = _get_script()(
+                keys=[f"{QUOTA_KEY_PREFIX}:{platform}:bucket", _daily_key(platform)],
+                args=[burst, rate, cost, reserve, daily_allowed, DAILY_KEY_TTL],
+            )
+            return int(status), float(value)
+        except Exception as e:
+            _redis_retry_at = time.monotonic() + getattr(settings, "QUOTA_REDIS_RETRY", 30)
+            quota_stats[platform]["redis_errors"] += 1
+            logger.warning(f"[Quota] Redis unavailable, using per-worker buckets: {e}")
+    return _take_local(platform, cost, limits)
+
+
+def _try_acquire(platform: str, cost: int, priority: str, deadline: float) -> float:
+    """
+    한 번 차감 시도
+
+    Returns:
+        0이면 통과, 양수면 다시 시도하기 전 기다릴 초
+
+    Raises:
+        QuotaExceeded: 일일 예산 소진 또는 대기 시간이 deadline을 넘음
+    """
+    config = getattr(settings, "UPSTREAM_QUOTAS", {}).get(platform)
+    if not config:
+        return 0.0
+
+    stats = quota_stats[platform]
+    status, value = _take(platform, cost, _limits(config, priority))
+    if status == 1:
+        stats[f"granted_{priority}"] += 1
+        return 0.0
+    if status == -1:
+        stats[f"rejected_daily_{priority}"] += 1
+        raise QuotaExceeded(platform, f"daily budget exhausted ({priority})")
+
+    wait = value / 1000
+    if time.monotonic() + wait > deadline:
+        stats[f"rejected_rate_{priority}"] += 1
+        raise QuotaExceeded(platform, f"rate limited ({priority}, retry in {wait:.1f}s)")
+    stats[f"waited_{priority}"] += 1
+    return wait
+
+
+def _deadline(priority: str) -> float:
+    if priority == BACKGROUND:
+        max_wait = getattr(settings, "QUOTA_BACKGROUND_MAX_WAIT", 30.0)
+    else:
+        max_wait = getattr(settings, "QUOTA_INTERACTIVE_MAX_WAIT", 0.5)
+    return time.monotonic() + max_wait
+
+
+async def aacquire_quota(platform: str, cost: int = 1) -> None:
+    """
+    업스트림 호출 전 한도 확보 (async)
+
+    Args:
+        platform: 플랫폼 이름 (UPSTREAM_QUOTAS 키, 설정이 없으면 제한 없음)
+        cost: 차감할 호출 수
+
+    Raises:
+        QuotaExceeded: 한도 초과 (호출하지 말 것)
+    """
+    from asgiref.sync import sync_to_async
+
+    priority = _priority.get()
+    deadline = _deadline(priority)
+    # Redis 호출은 이벤트 루프 밖에서 (같은 워커의 다른 요청을 막지 않게)
+    try_acquire = sync_to_async(_try_acquire, thread_sensitive=False)
+    while wait := await try_acquire(platform, cost, priority, deadline):
+        await asyncio.sleep(wait)
+
+
+def acquire_quota(platform: str, cost: int = 1) -> None:
+    """
+    업스트림 호출 전 한도 확보 (sync, aacquire_quota 참고)
+
+    사용자 요청(interactive)은 스레드를 재우지 않고 토큰이 없으면 바로 QuotaExceeded.
+    백그라운드 우선순위만 QUOTA_BACKGROUND_MAX_WAIT까지 기다린다.
+    """
+    priority = _priority.get()
+    # interactive: deadline=지금 → 기다려야 하면 즉시 거절
+    deadline = _deadline(priority) if priority == BACKGROUND else time.monotonic()
+    while wait := _try_acquire(platform, cost, priority, deadline):
+        time.sleep(wait)
+
+
+def _used_today(platform: str) -> int:
+    if time.monotonic() >= _redis_retry_at:
+        try:
+            from django_redis import get_redis_connection
+
+            return int(get_redis_connection("default").get(_daily_key(platform)) or 0)
+        except Exception:
+            pass
+    return int(_local_daily[(platform, timezone.localdate())])
+
+
+def get_quota_stats() -> dict:
+    """
+    플랫폼별 한도 사용 현황
+
+    Returns:
+        {platform: 오늘 사용량, 일일 예산, 잔여, 소진율, 오늘 예상 사용량, 우선순위별 통과/대기/거절 수}
+    """
+    now = timezone.localtime()
+    day_elapsed = (now - now.replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds() / 86400
+    result = {}
+    for platform, config in getattr(settings, "UPSTREAM_QUOTAS", {}).items():
+        used = _used_today(platform)
+        daily = config.get("daily", 0)
+        result[platform] = {
+            "per_minute": config.get("per_minute", 0),
+            "used_today": used,
+            "daily_budget": daily or None,
+            "remaining": max(daily - used, 0) if daily else None,
+            "burn": round(used / daily, 3) if daily else None,
+            # 지금 속도가 유지되면 오늘 쓰게 될 호출 수
+            "projected_today": round(used / day_elapsed) if day_elapsed > 0 else used,
+            **dict(quota_stats[platform]),
+        }
+    return result
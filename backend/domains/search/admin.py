@@ -4,7 +4,7 @@
 
 from django.contrib import admin
 
-from .state.models import CoupangManualProduct, SearchHistory
+from .state.models import ClickLog, CoupangManualProduct, SearchHistory
 
 
 @admin.register(SearchHistory)
@@ -18,6 +18,17 @@ class SearchHistoryAdmin(admin.ModelAdmin):
     date_hierarchy = "created_at"
 
 
+@admin.register(ClickLog)
+class ClickLogAdmin(admin.ModelAdmin):
+    """Click Log Admin"""
+
+    list_display = ["product_url", "platform", "query", "created_at"]
+    list_filter = ["platform", "created_at"]
+    search_fields = ["product_url", "query"]
+    readonly_fields = ["created_at"]
+    date_hierarchy = "created_at"
+
+
 @admin.register(CoupangManualProduct)
 class CoupangManualProductAdmin(admin.ModelAdmin):
     """
@@ -11,3 +11,7 @@ class SearchConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "domains.search"
     verbose_name = "Search"
+
+    def ready(self):
+        """Import receivers to register signal handlers."""
+        from . import receivers  # noqa: F401
@@ -0,0 +1,225 @@
+"""
+🔍 Coupang Catalog Index (워커 공유)
+
+쿠팡 수동 상품 카탈로그를 DB 대신 메모리 색인(logic.catalog)에서 검색한다.
+
+- 세대(generation) 번호: Redis 카운터. Admin 저장/삭제 시 증가 + pub/sub 알림
+- 색인 파일: SEARCH_CATALOG_INDEX_DIR/coupang-<generation>.idx
+  처음 필요한 워커가 만들고, 나머지 워커는 같은 파일을 mmap (페이지 캐시 1벌 공유)
+- 각 워커는 pub/sub 구독 스레드로 세대 변경을 즉시 알고, 구독이 끊기면
+  SEARCH_CATALOG_POLL_INTERVAL마다 세대 번호를 확인
+- Redis를 쓸 수 없으면 워커 메모리에 따로 빌드 (공유 없음)
+"""
+
+import logging
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .logic.catalog import CatalogIndex, build_catalog
+
+logger = logging.getLogger(__name__)
+
+CATALOG_GENERATION_KEY = "search:catalog:generation"
+CATALOG_CHANNEL = "search:catalog:invalidate"
+PRIVATE_GENERATION = -1
+
+_lock = threading.Lock()
+_index: CatalogIndex | None = None
+_checked_at = 0.0
+_stale = threading.Event()
+_listener: threading.Thread | None = None
+
+catalog_stats: Counter = Counter()
+
+
+def _index_dir() -> Path:
+    directory = getattr(settings, "SEARCH_CATALOG_INDEX_DIR", "")
+    return Path(directory) if directory else Path(tempfile.gettempdir()) / "almaeng-catalog"
+
+
+def get_catalog_generation() -> int | None:
+    """현재 카탈로그 세대 번호 (Redis 불가 시 None)"""
+    try:
+        return int(cache.get(CATALOG_GENERATION_KEY) or 0)
+    except Exception as e:
+        logger.debug(f"Catalog generation read failed: {e}")
+        return None
+
+
+def bump_catalog_generation() -> None:
+    """
+    카탈로그 변경 알림 (CoupangManualProduct 저장/삭제 커밋 후 호출)
+
+    세대 번호를 올리고 pub/sub으로 모든 워커에 알린다.
+    """
+    _stale.set()  # 이 워커는 Redis 없이도 바로 반영
+    try:
+        cache.add(CATALOG_GENERATION_KEY, 0, timeout=None)
+        generation = cache.incr(CATALOG_GENERATION_KEY)
+    except Exception as e:
+        logger.debug(f"Catalog generation bump failed: {e}")
+        return
+    try:
+        from django_redis import get_redis_connection
+
+        get_redis_connection("default").publish(CATALOG_CHANNEL, generation)
+    except Exception as e:
+        # 구독 중인 워커는 폴링으로 반영
+        logger.debug(f"Catalog invalidation publish failed: {e}")
+
+
+def _listen() -> None:
+    """세대 변경 pub/sub 구독 (워커당 데몬 스레드 1개)"""
+    try:
+        from django_redis import get_redis_connection
+
+        pubsub = get_redis_connection("default").pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(CATALOG_CHANNEL)
+        for _message in pubsub.listen():
+            _stale.set()
+    except Exception as e:
+        logger.info(f"[Catalog] Invalidation listener stopped, falling back to polling: {e}")
+
+
+def _ensure_listener() -> None:
+    global _listener
+    # 구독이 끊겼으면 폴링 주기마다 재연결 시도
+    if _listener is None or not _listener.is_alive():
+        _listener = threading.Thread(target=_listen, name="catalog-invalidation", daemon=True)
+        _listener.start()
+
+
+def _needs_check() -> bool:
+    if _index is None or _stale.is_set():
+        return True
+    if _listener is not None and _listener.is_alive():
+        return False
+    return time.monotonic() - _checked_at >= getattr(settings, "SEARCH_CATALOG_POLL_INTERVAL", 30.0)
+
+
+def _remove_old_files(directory: Path, generation: int) -> None:
+    # 이전 세대를 mmap 중인 워커가 있어도 Linux에서는 unlink 안전 (Windows는 실패 → 다음에 재시도)
+    # 늦게 끝난 빌드가 더 새로운 세대 파일을 지우지 않도록 낮은 세대만 삭제
+    for path in directory.glob("coupang-*.idx"):
+        try:
+            file_generation = int(path.stem.removeprefix("coupang-"))
+        except ValueError:
+            continue
+        if file_generation < generation:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _open_or_build(generation: int | None) -> CatalogIndex:
+    from .state.interface import get_coupang_catalog_rows
+
+    if generation is None:
+        # 공유 불가 → 워커 메모리에 빌드 (세대 -1: 다음 확인 때 공유 파일로 복귀)
+        catalog_stats["builds"] += 1
+        return CatalogIndex.from_rows(get_coupang_catalog_rows(), generation=PRIVATE_GENERATION)
+
+    directory = _index_dir()
+    path = directory / f"coupang-{generation}.idx"
+    if not path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        data = build_catalog(get_coupang_catalog_rows(), generation)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)  # 다른 워커가 동시에 만들어도 같은 내용으로 덮어씀
+        catalog_stats["builds"] += 1
+        _remove_old_files(directory, generation)
+
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    catalog_stats["loads"] += 1
+    return CatalogIndex(buffer)
+
+
+def load_catalog_index() -> CatalogIndex:
+    """
+    현재 세대의 카탈로그 색인 (필요하면 파일을 열거나 빌드)
+
+    ⚠️ DB 조회가 있을 수 있으므로 async 코드에서는 sync_to_async로 호출
+    """
+    global _index, _checked_at
+    with _lock:
+        if not _needs_check():
+            return _index
+        local_change = _stale.is_set()
+        _stale.clear()
+        _checked_at = time.monotonic()
+        _ensure_listener()
+
+        generation = get_catalog_generation()
+        if _index is not None and generation == _index.generation:
+            if not local_change:
+                return _index
+            # 이 워커의 변경인데 세대 번호가 그대로 (증가 실패) → 공유 파일은 옛 내용
+            generation = None
+        _index = _open_or_build(generation)
+        logger.info(f"[Catalog] Loaded generation {generation} ({_index.count} products)")
+        return _index
+
+
+def warm_catalog_index() -> None:
+    """워커 시작 시 색인 준비 (실패해도 첫 검색에서 다시 시도)"""
+    try:
+        load_catalog_index()
+    except Exception as e:
+        logger.warning(f"[Catalog] Warm-up failed: {e}")
+
+
+async def asearch_coupang_catalog(
+    keywords: list[str],
+    limit: int = 20,
+    price_min: int | None = None,
+    price_max: int | None = None,
+) -> list:
+    """
+    쿠팡 상품 키워드 검색 (색인 사용, 실패 시 DB 조회)
+
+    Args:
+        keywords: 검색 키워드
+        limit: 최대 결과 수
+        price_min: 최저 가격 (원)
+        price_max: 최고 가격 (원)
+
+    Returns:
+        list[CatalogProduct | CoupangManualProduct]: 관련도 순 (transform_coupang_manual_results 입력)
+    """
+    from asgiref.sync import sync_to_async
+
+    from .state.interface import get_coupang_products_by_keywords, normalize_search_text
+
+    try:
+        # 최신 색인이면 스레드 전환 없이 바로 검색
+        index = _index if not _needs_check() else await sync_to_async(load_catalog_index)()
+        terms = [term for term in dict.fromkeys(normalize_search_text(keyword) for keyword in keywords) if term]
+        catalog_stats["searches"] += 1
+        return index.search(terms, limit=limit, price_min=price_min, price_max=price_max)
+    except Exception:
+        logger.exception("[Catalog] Index search failed, falling back to DB")
+        catalog_stats["fallbacks"] += 1
+        return await sync_to_async(get_coupang_products_by_keywords)(
+            keywords, limit=limit, price_min=price_min, price_max=price_max
+        )
+
+
+def get_catalog_index_stats() -> dict:
+    """색인 세대/크기/빌드·로드 횟수"""
+    return {
+        "generation": _index.generation if _index is not None else None,
+        "products": _index.count if _index is not None else 0,
+        "listener_alive": _listener is not None and _listener.is_alive(),
+        **dict(catalog_stats),
+    }
@@ -0,0 +1,278 @@
+"""
+🔍 Search Fan-out
+
+여러 업스트림 소스(플랫폼 x 키워드, 쿠팡 DB 조회)를 동시에 실행하는 엔진.
+
+- 워커 전체 in-flight 상한 (SEARCH_UPSTREAM_MAX_INFLIGHT)
+- 요청 단위 데드라인 (SEARCH_FANOUT_DEADLINE) - 도착한 결과만으로 응답
+- 소스별 호출/타임아웃/에러/지각 도착 카운터
+- 데드라인 이후 도착한 플랫폼 결과도 백그라운드 큐로 ProductCache에 저장
+"""
+
+import asyncio
+import logging
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Hashable
+from functools import partial
+from typing import Any
+
+from django.conf import settings
+
+from .logic.schemas import ProductResult
+from .logic.services import price_cache_keyword, transform_elevenst_results, transform_naver_results
+
+logger = logging.getLogger(__name__)
+
+_inflight_semaphore: asyncio.Semaphore | None = None
+_inflight_loop: asyncio.AbstractEventLoop | None = None
+
+# 데드라인 이후에도 계속 실행 중인 호출 (GC 방지용 강한 참조)
+_late_tasks: set[asyncio.Task] = set()
+
+# 소스별 카운터: {"naver": Counter(calls=, timeouts=, errors=, late_arrivals=)}
+source_stats: dict[str, Counter] = defaultdict(Counter)
+
+
+def _get_inflight_semaphore() -> asyncio.Semaphore:
+    """워커(이벤트 루프)당 업스트림 동시 호출 상한"""
+    global _inflight_semaphore, _inflight_loop
+    loop = asyncio.get_running_loop()
+    if _inflight_semaphore is None or _inflight_loop is not loop:
+        limit = getattr(settings, "SEARCH_UPSTREAM_MAX_INFLIGHT", 16)
+        _inflight_semaphore = asyncio.Semaphore(max(1, limit))
+        _inflight_loop = loop
+    return _inflight_semaphore
+
+
+async def _bounded(factory: Callable[[], Awaitable[Any]]) -> Any:
+    async with _get_inflight_semaphore():
+        return await factory()
+
+
+def _source_name(key: Hashable) -> str:
+    """호출 키의 첫 요소를 소스 이름으로 사용 (("naver", "루테인") → "naver")"""
+    return str(key[0]) if isinstance(key, tuple) else str(key)
+
+
+def _handle_late(key: Hashable, on_late: Callable[[Hashable, Any], None], task: asyncio.Task) -> None:
+    _late_tasks.discard(task)
+    if task.cancelled() or task.exception() is not None:
+        return
+    source_stats[_source_name(key)]["late_arrivals"] += 1
+    try:
+        on_late(key, task.result())
+    except Exception:
+        logger.exception(f"[Fan-out] Late result handler failed for {key}")
+
+
+async def iter_fan_out(
+    calls: dict[Hashable, Callable[[], Awaitable[Any]]],
+    deadline: float | None = None,
+    on_late: Callable[[Hashable, Any], None] | None = None,
+) -> AsyncIterator[tuple[Hashable, Any]]:
+    """
+    업스트림 호출을 동시에 실행하고 끝나는 순서대로 (키, 결과) 반환
+
+    Args:
+        calls: {키: 코루틴 팩토리} (예: {("naver", "루테인"): partial(search_naver_products, "루테인")})
+        deadline: 전체 대기 시간(초). None이면 settings.SEARCH_FANOUT_DEADLINE
+        on_late: 지정하면 데드라인을 넘긴 호출을 취소하지 않고, 끝나는 대로
+            on_late(키, 결과)를 호출 (캐시 워밍용). None이면 취소
+
+    Yields:
+        (키, 결과 | 예외). 데드라인을 넘긴 호출은 마지막에 TimeoutError로 반환
+    """
+    if not calls:
+        return
+
+    if deadline is None:
+        deadline = getattr(settings, "SEARCH_FANOUT_DEADLINE", 1.5)
+
+    loop = asyncio.get_running_loop()
+    expires_at = loop.time() + max(deadline, 0)
+    tasks = {asyncio.create_task(_bounded(factory)): key for key, factory in calls.items()}
+    pending = set(tasks)
+    try:
+        while pending:
+            timeout = expires_at - loop.time()
+            if timeout <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = tasks[task]
+                stats = source_stats[_source_name(key)]
+                stats["calls"] += 1
+                if task.exception() is not None:
+                    stats["errors"] += 1
+                    yield key, task.exception()
+                else:
+                    yield key, task.result()
+
+        for task in [task for task in tasks if task in pending]:
+            pending.discard(task)
+            key = tasks[task]
+            stats = source_stats[_source_name(key)]
+            stats["calls"] += 1
+            stats["timeouts"] += 1
+            logger.info(f"[Fan-out] {key} exceeded {deadline:.2f}s deadline")
+            if on_late is None:
+                task.cancel()
+            else:
+                _late_tasks.add(task)
+                task.add_done_callback(partial(_handle_late, key, on_late))
+            yield key, TimeoutError(f"{key} exceeded {deadline:.2f}s deadline")
+    finally:
+        # 호출자가 중간에 멈춘 경우 (예: 스트리밍 클라이언트 연결 종료)
+        for task in pending:
+            task.cancel()
+
+
+async def fan_out(
+    calls: dict[Hashable, Callable[[], Awaitable[Any]]],
+    deadline: float | None = None,
+    on_late: Callable[[Hashable, Any], None] | None = None,
+) -> dict[Hashable, Any]:
+    """
+    업스트림 호출을 동시에 실행하고 데드라인까지 도착한 결과만 반환
+
+    Args:
+        calls, deadline, on_late: iter_fan_out()과 동일
+
+    Returns:
+        {키: 결과 | 예외} (calls 순서). 데드라인을 넘긴 호출은 TimeoutError
+    """
+    results = {key: result async for key, result in iter_fan_out(calls, deadline=deadline, on_late=on_late)}
+    return {key: results[key] for key in calls}
+
+
+def get_fanout_stats() -> dict:
+    """소스별 호출/타임아웃/에러/지각 도착 통계"""
+    return {
+        "late_inflight": len(_late_tasks),
+        "sources": {name: dict(counter) for name, counter in source_stats.items()},
+    }
+
+
+# =============================================================================
+# Platform sources (네이버/11번가 BaseCrawler 클라이언트)
+# =============================================================================
+
+
+def platform_sources() -> dict[str, tuple[Callable[..., Awaitable[list]], Callable[[list], list[ProductResult]]]]:
+    """
+    플랫폼별 (검색 함수, 변환 함수)
+
+    ✅ DAEMON: 통합 도메인은 interface.py를 통해서만 호출
+    """
+    from domains.integrations.elevenst.interface import search_elevenst_products
+    from domains.integrations.naver.interface import search_naver_products
+
+    return {
+        "naver": (search_naver_products, transform_naver_results),
+        "11st": (search_elevenst_products, transform_elevenst_results),
+    }
+
+
+def _enqueue_cache_fill(fetched: dict[tuple[str, str], list[ProductResult]]) -> None:
+    """가져온 결과를 백그라운드 큐에서 플랫폼당 bulk upsert"""
+    from .tasks import JOB_PRODUCT_CACHE, background_jobs
+
+    platforms = {platform for platform, _ in fetched}
+    for platform_name in platforms:
+        batch = {
+            term: products[:10]  # 키워드당 상위 10개만 캐시
+            for (platform, term), products in fetched.items()
+            if platform == platform_name and products
+        }
+        if batch:
+            background_jobs.enqueue(JOB_PRODUCT_CACHE, (platform_name, batch))
+
+
+async def iter_platform_products(
+    search_terms: list[str],
+    deadline: float | None = None,
+    price_range: tuple[int | None, int | None] = (None, None),
+    pairs: Collection[tuple[str, str]] | None = None,
+) -> AsyncIterator[tuple[tuple[str, str], list[ProductResult]]]:
+    """
+    네이버/11번가를 키워드별로 동시 검색하고 도착하는 순서대로 반환
+
+    도착한 결과는 바로 캐시 큐에 적재하고, 데드라인 이후에 도착한 결과는
+    응답에는 빠지지만 ProductCache는 채운다. 최근에 결과 없음/실패였던
+    (platform, keyword)는 negative cache로 호출을 건너뛴다.
+
+    Args:
+        search_terms: 검색 키워드 목록
+        deadline: fan-out 데드라인(초)
+        price_range: (최저, 최고) 가격 구간 (price_range_bucket 결과). 업스트림
+            검색에 전달하고, 캐시/negative cache 키워드에 포함
+        pairs: 검색할 (platform, keyword) 조합 (None이면 전체). 캐시가 있는 플랫폼은
+            건너뛰고 빠진 플랫폼만 검색할 때 사용
+
+    Yields:
+        ((platform, keyword), ProductResult 목록). 실패/타임아웃은 빈 목록
+    """
+    from .negative_cache import NEGATIVE_EMPTY, NEGATIVE_ERROR, aget_negative_entries, aset_negative_entry
+
+    sources = platform_sources()
+    price_kwargs = {}
+    if price_range != (None, None):
+        price_kwargs = {"price_min": price_range[0], "price_max": price_range[1]}
+    # 캐시/negative cache는 가격 구간별로 따로 저장
+    cache_keywords = {term: price_cache_keyword(term, price_range) for term in search_terms}
+
+    calls = {}
+    for term in search_terms:
+        for platform, (search, _) in sources.items():
+            if pairs is None or (platform, term) in pairs:
+                calls[(platform, term)] = partial(search, term, raise_errors=True, **price_kwargs)
+
+    # 최근 결과 없음/실패 → 업스트림 호출 생략
+    negative = await aget_negative_entries([(platform, cache_keywords[term]) for platform, term in calls])
+    for platform, term in list(calls):
+        if (platform, cache_keywords[term]) in negative:
+            del calls[(platform, term)]
+            yield (platform, term), []
+
+    def cache_fill(key: tuple[str, str], products: list[ProductResult]) -> None:
+        platform, term = key
+        _enqueue_cache_fill({(platform, cache_keywords[term]): products})
+
+    def warm_late(key: tuple[str, str], raw: list) -> None:
+        cache_fill(key, sources[key[0]][1](raw))
+
+    async for key, raw in iter_fan_out(calls, deadline=deadline, on_late=warm_late):
+        platform, term = key
+        # Handle errors / deadline (데드라인 초과는 늦게 도착할 수 있으므로 기록하지 않음)
+        if isinstance(raw, BaseException):
+            if not isinstance(raw, TimeoutError):
+                await aset_negative_entry(platform, cache_keywords[term], NEGATIVE_ERROR)
+            raw = []
+        elif not raw:
+            await aset_negative_entry(platform, cache_keywords[term], NEGATIVE_EMPTY)
+        products = sources[platform][1](raw)
+        # Save to cache - 응답 후 백그라운드 큐에서 플랫폼당 bulk upsert
+        cache_fill(key, products)
+        yield key, products
+
+
+async def fetch_platform_products(
+    search_terms: list[str],
+    deadline: float | None = None,
+    price_range: tuple[int | None, int | None] = (None, None),
+    pairs: Collection[tuple[str, str]] | None = None,
+) -> dict[tuple[str, str], list[ProductResult]]:
+    """
+    네이버/11번가를 키워드별로 동시 검색하고 결과를 캐시 큐에 적재
+
+    Args:
+        search_terms: 검색 키워드 목록
+        deadline: fan-out 데드라인(초)
+        price_range: (최저, 최고) 가격 구간
+        pairs: 검색할 (platform, keyword) 조합 (None이면 전체)
+
+    Returns:
+        {(platform, keyword): ProductResult 목록}. 실패/타임아웃은 빈 목록
+    """
+    platform_results = iter_platform_products(search_terms, deadline=deadline, price_range=price_range, pairs=pairs)
+    return {key: products async for key, products in platform_results}
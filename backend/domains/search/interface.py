@@ -7,10 +7,20 @@ External domains should only import from this file.
 ✅ DAEMON Rule: This is the ONLY file external domains can import from.
 """
 
+import logging
+from collections import Counter
+from collections.abc import AsyncIterator
+from typing import Any
+
+from .logic.ranking import rank_search_results, score_products
 from .logic.schemas import CompareResult, ProductResult
 from .logic.services import (
     aggregate_search_results,
-    mix_search_results,
+    dedupe_products,
+    filter_by_price,
+    price_cache_keyword,
+    price_range_bucket,
+    transform_cached_products,
     transform_coupang_manual_results,
     transform_elevenst_results,
     transform_naver_results,
@@ -30,157 +40,224 @@ __all__ = [
     "aggregate_search_results",
     # State Services (DB Operations)
     "create_search_history",
+    "dedupe_products",
+    "drain_background_jobs",
+    "filter_by_price",
     "get_active_coupang_products",
+    "get_background_job_stats",
     "get_coupang_products_by_keywords",
+    "get_search_snapshot",
     "get_search_suggestions",
-    "mix_search_results",
+    "log_product_click",
+    "price_range_bucket",
+    "rank_search_results",
     "save_search_history",
+    "save_search_snapshot",
+    "score_products",
     # High-level Services (Orchestration)
     "search_products",
+    "start_background_jobs",
+    "stream_search_products",
+    "transform_cached_products",
     "transform_coupang_manual_results",
     "transform_elevenst_results",
     # Logic Services (Pure Functions)
     "transform_naver_results",
+    "warm_search_catalog",
 ]
 
+logger = logging.getLogger(__name__)
+
+# ProductCache 키워드 조회 결과: hits / stale_hits / misses
+product_cache_stats: Counter = Counter()
+
 
 # ============================================
 # High-level Orchestration Services
 # ============================================
 
-async def search_products(query: str) -> CompareResult:
+async def _extract_search_terms(query: str):
     """
-    Search products from multiple platforms
+    Extract keywords (Gemini, single-flight) and pick the fan-out terms
 
-    ✅ DAEMON Pattern: Orchestration layer
-    - Extracts keywords using Gemini AI (Intention Extraction)
-    - Calls integrations (Naver, 11st, Coupang) in parallel
-    - Transforms results via logic services
-    - Returns frozen Pydantic model
+    Returns:
+        (KeywordExtractionResult, keywords, search_terms)
+    """
+    from functools import partial
 
-    Args:
-        query: Natural language search query (e.g., "피로 회복에 좋은 영양제")
+    from django.conf import settings
 
-    Returns:
-        CompareResult with products from all platforms
+    from domains.integrations.gemini.interface import aextract_keywords
+
+    from .singleflight import search_flight
+
+    # 동일 쿼리 동시 요청은 Gemini 호출 1회로 합침
+    keyword_result = await search_flight.do(f"keywords:{' '.join(query.split())}", partial(aextract_keywords, query))
+    keywords = keyword_result.keywords if keyword_result.keywords else [query]
+
+    # Fan-out 대상: 상위 N개 키워드 (중복 제거, 순서 유지)
+    max_keywords = getattr(settings, "SEARCH_FANOUT_MAX_KEYWORDS", 3)
+    search_terms = list(dict.fromkeys(keywords))[:max_keywords] or [query]
+    return keyword_result, keywords, search_terms
+
+
+def _start_coupang_lookup(keywords: list[str], deadline: float, keyword_result):
     """
+    Start the Coupang lookup as a task (runs concurrently with platform fetches)
+
+    SEARCH_CATALOG_INDEX_ENABLED면 DB 대신 워커 공유 카탈로그 색인에서 검색
+    """
+    import asyncio
+    from functools import partial
+
     from asgiref.sync import sync_to_async
+    from django.conf import settings
 
-    from domains.integrations.elevenst.interface import search_elevenst_products
-    from domains.integrations.gemini.interface import extract_keywords
-    from domains.integrations.naver.interface import search_naver_products
+    from .fanout import fan_out
 
-    # Step 1: Extract keywords using Gemini AI (Intention Extraction)
-    keyword_result = extract_keywords(query)
-    keywords = keyword_result.keywords if keyword_result.keywords else [query]
-    
-    # Use first keyword as main search term
-    search_term = keywords[0] if keywords else query
+    if getattr(settings, "SEARCH_CATALOG_INDEX_ENABLED", False):
+        from .catalog_index import asearch_coupang_catalog
+
+        lookup = asearch_coupang_catalog
+    else:
+        lookup = sync_to_async(get_coupang_products_by_keywords)
+
+    return asyncio.ensure_future(
+        fan_out(
+            {
+                ("coupang", "db"): partial(
+                    lookup,
+                    keywords,
+                    limit=20,
+                    # 가격 범위는 SQL에서 필터링
+                    price_min=keyword_result.price_min,
+                    price_max=keyword_result.price_max,
+                )
+            },
+            deadline=deadline,
+        )
+    )
 
-    # Check cache first (24시간)
+
+async def _await_coupang_products(coupang_task) -> list[ProductResult]:
+    # 쿠팡 DB 조회 결과 (실패/데드라인 초과 시 빈 리스트)
+    coupang_models = (await coupang_task)[("coupang", "db")]
+    if isinstance(coupang_models, BaseException):
+        return []
+    return transform_coupang_manual_results(coupang_models)
+
+
+async def _load_cached_products(search_terms: list[str], price_range: tuple[int | None, int | None]):
+    """
+    Read ProductCache for the search terms (hard TTL) and schedule stale refreshes
+
+    캐시 키워드에는 가격 구간이 포함된다 (price_cache_keyword).
+
+    신선도는 (플랫폼, 키워드) 단위로 판단한다. 한 플랫폼만 캐시돼 있으면 그 결과로
+    응답하고 빠진 플랫폼만 검색하며, soft TTL도 플랫폼별로 확인해 오래된 플랫폼만 갱신한다.
+
+    Returns:
+        ({(platform, keyword): [ProductResult]}, missing_pairs) - missing_pairs는 캐시에
+        없는 (platform, keyword) 목록 (키워드 순)
+    """
     from datetime import timedelta
+
+    from asgiref.sync import sync_to_async
+    from django.conf import settings
     from django.utils import timezone
-    
+
+    from .fanout import platform_sources
+
     # ✅ DAEMON: state/interface.py를 통한 DB 접근
-    from .state.interface import get_cached_products
-    
-    cache_cutoff = timezone.now() - timedelta(hours=24)
-    
+    from .state.interface import get_cached_products_for_keywords
+    from .tasks import schedule_cache_refresh
+
+    # Check cache first - 키워드별 (hard TTL 이내만 사용)
+    now = timezone.now()
+    hard_cutoff = now - timedelta(seconds=getattr(settings, "PRODUCT_CACHE_HARD_TTL", 60 * 60 * 24))
+    soft_cutoff = now - timedelta(seconds=getattr(settings, "PRODUCT_CACHE_SOFT_TTL", 60 * 60 * 6))
+
     # Try to get cached products (graceful fallback if table doesn't exist)
+    cache_keywords = {price_cache_keyword(term, price_range): term for term in search_terms}
     try:
-        cached_products = await sync_to_async(get_cached_products)(search_term, cache_cutoff)
+        cached_rows = await sync_to_async(get_cached_products_for_keywords)(list(cache_keywords), hard_cutoff)
     except Exception:
         # Cache table doesn't exist or other DB error - skip cache
-        cached_products = []
-    
-    # Search from multiple platforms (parallel) - 캐시 없을 때만
-    import asyncio
+        cached_rows = {}
 
-    if cached_products:
-        # 캐시 사용
-        naver_products = []
-        elevenst_products = []
-        for cache in cached_products:
-            if cache.platform == "naver":
-                naver_products.append(cache)
-            elif cache.platform == "11st":
-                elevenst_products.append(cache)
-    else:
-        # API 호출
-        naver_task = search_naver_products(search_term)
-        elevenst_task = search_elevenst_products(search_term)
-
-        naver_results, elevenst_results = await asyncio.gather(
-            naver_task,
-            elevenst_task,
-            return_exceptions=True,
-        )
+    # (플랫폼, 키워드)별 마지막 캐시 시각
+    cached_at: dict[tuple[str, str], Any] = {}
+    for keyword, rows in cached_rows.items():
+        term = cache_keywords[keyword]
+        for row in rows:
+            key = (row.platform, term)
+            if key not in cached_at or row.cached_at > cached_at[key]:
+                cached_at[key] = row.cached_at
 
-        # Handle errors
-        if isinstance(naver_results, Exception):
-            naver_results = []
-        if isinstance(elevenst_results, Exception):
-            elevenst_results = []
-
-        # Transform results
-        naver_products = transform_naver_results(naver_results)
-        elevenst_products = transform_elevenst_results(elevenst_results)
-        
-        # Save to cache (async-safe) - 테이블이 없으면 스킵
-        async def save_to_cache(products, platform_name):
-            """캐시 저장 (실패해도 검색은 계속 진행)"""
-            try:
-                from .state.models import ProductCache
-                
-                for p in products[:10]:  # 상위 10개만 캐시
-                    try:
-                        await sync_to_async(ProductCache.objects.update_or_create)(
-                            platform=platform_name,
-                            product_id=p.id,
-                            defaults={
-                                "product_name": p.name,
-                                "price": p.price,
-                                "original_price": p.original_price,
-                                "discount_percent": p.discount_rate,
-                                "image_url": p.image_url,
-                                "product_url": p.product_url,
-                                "mall_name": p.mall_name,
-                                "rating": p.rating,
-                                "review_count": p.review_count,
-                                "search_keyword": search_term,
-                            }
-                        )
-                    except Exception:
-                        # 개별 상품 저장 실패는 무시
-                        pass
-            except Exception:
-                # ProductCache 테이블이 없거나 다른 DB 에러 - 스킵
-                pass
-        
-        # 백그라운드로 캐시 저장 (에러 무시)
-        try:
-            await asyncio.gather(
-                save_to_cache(naver_products, "naver"),
-                save_to_cache(elevenst_products, "11st"),
-                return_exceptions=True
-            )
-        except Exception:
-            # 캐시 저장 실패해도 검색은 계속 진행
-            pass
+    # 키워드 순서대로 플랫폼별 결과 수집
+    products_by_term: dict[tuple[str, str], list[ProductResult]] = {}
+    for keyword, rows in cached_rows.items():
+        for product in transform_cached_products(rows):
+            products_by_term.setdefault((product.platform, cache_keywords[keyword]), []).append(product)
 
-    # Get Coupang manual products (DB 조회를 async-safe하게)
-    try:
-        coupang_models = await sync_to_async(get_coupang_products_by_keywords)(keywords, limit=20)
-        coupang_products = transform_coupang_manual_results(coupang_models)
-    except Exception:
-        # DB 조회 실패 시 빈 리스트
-        coupang_products = []
+    missing_pairs: list[tuple[str, str]] = []
+    for term in search_terms:
+        stale_platforms = []
+        for platform in platform_sources():
+            key = (platform, term)
+            if key not in cached_at:
+                # 캐시에 없는 플랫폼만 API 호출
+                missing_pairs.append(key)
+                product_cache_stats["misses"] += 1
+            elif cached_at[key] < soft_cutoff:
+                stale_platforms.append(platform)
+                product_cache_stats["stale_hits"] += 1
+            else:
+                product_cache_stats["hits"] += 1
+
+        # Stale-while-revalidate: soft TTL이 지난 플랫폼은 캐시로 응답하고 백그라운드 갱신
+        if stale_platforms:
+            schedule_cache_refresh(term, price_range=price_range, platforms=stale_platforms)
+
+    return products_by_term, missing_pairs
+
+
+def get_product_cache_stats() -> dict:
+    """ProductCache (플랫폼, 키워드) 단위 적중률 (stale 응답도 적중으로 계산)"""
+    hits = product_cache_stats["hits"] + product_cache_stats["stale_hits"]
+    lookups = hits + product_cache_stats["misses"]
+    return {**dict(product_cache_stats), "hit_rate": round(hits / lookups, 3) if lookups else None}
+
+
+def _build_compare_result(
+    query: str,
+    keyword_result,
+    keywords: list[str],
+    search_terms: list[str],
+    products_by_term: dict[tuple[str, str], list[ProductResult]],
+    coupang_products: list[ProductResult],
+) -> CompareResult:
+    """Merge per-keyword platform results, rank with Coupang and aggregate"""
+    price_min, price_max = keyword_result.price_min, keyword_result.price_max
+
+    # 키워드 우선순위대로 병합 후 중복 제거 (캐시/업스트림은 가격 구간 단위 → 정확한 범위로 필터)
+    naver_products = dedupe_products(
+        filter_by_price(
+            [p for term in search_terms for p in products_by_term.get(("naver", term), [])], price_min, price_max
+        )
+    )
+    elevenst_products = dedupe_products(
+        filter_by_price(
+            [p for term in search_terms for p in products_by_term.get(("11st", term), [])], price_min, price_max
+        )
+    )
 
-    # Mix results (70% Coupang, 20% Naver, 10% 11st)
-    mixed_products = mix_search_results(
+    # Rank results (관련도/가격/평점/플랫폼 점수, 쿼터 70% Coupang, 20% Naver, 10% 11st)
+    mixed_products = rank_search_results(
         coupang_products=coupang_products,
         naver_products=naver_products,
         elevenst_products=elevenst_products,
+        keywords=keywords,
     )
 
     # Aggregate
@@ -201,39 +278,283 @@ async def search_products(query: str) -> CompareResult:
     )
 
 
+async def search_products(query: str) -> CompareResult:
+    """
+    Search products from multiple platforms
+
+    ✅ DAEMON Pattern: Orchestration layer
+    - Extracts keywords using Gemini AI (Intention Extraction)
+    - Fans out Naver/11st searches across the extracted keywords in parallel
+    - Serves stale (soft TTL) cache immediately and refreshes it in the background
+    - Coalesces identical concurrent Gemini/upstream calls (single-flight)
+    - Transforms, merges and dedupes results via logic services
+    - Returns frozen Pydantic model
+
+    Args:
+        query: Natural language search query (e.g., "피로 회복에 좋은 영양제")
+
+    Returns:
+        CompareResult with products from all platforms
+    """
+    import asyncio
+    from functools import partial
+
+    from django.conf import settings
+
+    from .fanout import fetch_platform_products
+    from .singleflight import search_flight
+
+    # Step 1: Extract keywords using Gemini AI (Intention Extraction)
+    keyword_result, keywords, search_terms = await _extract_search_terms(query)
+    # 추출된 가격 범위 ("3만원 이하") → 업스트림/캐시는 구간 단위로 공유
+    price_range = price_range_bucket(keyword_result.price_min, keyword_result.price_max)
+
+    # 요청 단위 데드라인: 이 시점부터 플랫폼/쿠팡 조회 전체가 공유
+    loop = asyncio.get_running_loop()
+    deadline_at = loop.time() + getattr(settings, "SEARCH_FANOUT_DEADLINE", 1.5)
+
+    # Get Coupang manual products - 캐시 조회/플랫폼 검색과 동시에 실행
+    coupang_task = _start_coupang_lookup(keywords, deadline_at - loop.time(), keyword_result)
+
+    try:
+        products_by_term, missing_pairs = await _load_cached_products(search_terms, price_range)
+
+        # 캐시에 없는 (플랫폼, 키워드)만 API 호출 (동시 실행)
+        # 같은 키워드/플랫폼을 동시에 찾는 요청은 업스트림 호출 1회로 합침 (single-flight)
+        missing_platforms: dict[str, list[str]] = {}
+        for platform, term in missing_pairs:
+            missing_platforms.setdefault(term, []).append(platform)
+        if missing_platforms:
+            fetched_by_term = await asyncio.gather(
+                *(
+                    search_flight.do(
+                        f"fetch:{price_cache_keyword(term, price_range)}:{','.join(platforms)}",
+                        partial(
+                            fetch_platform_products,
+                            [term],
+                            deadline=max(deadline_at - loop.time(), 0),
+                            price_range=price_range,
+                            pairs={(platform, term) for platform in platforms},
+                        ),
+                    )
+                    for term, platforms in missing_platforms.items()
+                )
+            )
+            for fetched in fetched_by_term:
+                products_by_term.update(fetched)
+
+        coupang_products = await _await_coupang_products(coupang_task)
+    finally:
+        # 캐시 조회/플랫폼 검색이 실패한 경우 쿠팡 조회도 정리
+        if not coupang_task.done():
+            coupang_task.cancel()
+
+    return _build_compare_result(query, keyword_result, keywords, search_terms, products_by_term, coupang_products)
+
+
+async def stream_search_products(query: str) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Progressive variant of search_products
+
+    Yields product batches as soon as each source answers, so the page can
+    render the fastest source first instead of waiting for the slowest one.
+
+    Yields:
+        ("products", list[ProductResult]) - cached / Coupang results first,
+            then one batch per (platform, keyword) in arrival order
+        ("done", CompareResult) - final mixed result (same as search_products)
+    """
+    import asyncio
+    from contextlib import aclosing
+
+    from django.conf import settings
+
+    from .fanout import iter_platform_products
+
+    keyword_result, keywords, search_terms = await _extract_search_terms(query)
+    price_min, price_max = keyword_result.price_min, keyword_result.price_max
+    price_range = price_range_bucket(price_min, price_max)
+
+    loop = asyncio.get_running_loop()
+    deadline_at = loop.time() + getattr(settings, "SEARCH_FANOUT_DEADLINE", 1.5)
+    coupang_task = _start_coupang_lookup(keywords, deadline_at - loop.time(), keyword_result)
+
+    try:
+        products_by_term, missing_pairs = await _load_cached_products(search_terms, price_range)
+
+        # 1) 캐시 + 쿠팡 (가장 빠른 소스) 먼저
+        coupang_products = await _await_coupang_products(coupang_task)
+        cached = [p for products in products_by_term.values() for p in products]
+        first_batch = coupang_products + filter_by_price(cached, price_min, price_max)
+        if first_batch:
+            yield "products", first_batch
+
+        # 2) 플랫폼 결과는 도착하는 순서대로
+        if missing_pairs:
+            platform_results = iter_platform_products(
+                list(dict.fromkeys(term for _, term in missing_pairs)),
+                deadline=max(deadline_at - loop.time(), 0),
+                price_range=price_range,
+                pairs=set(missing_pairs),
+            )
+            async with aclosing(platform_results):
+                async for key, products in platform_results:
+                    products_by_term[key] = products
+                    products = filter_by_price(products, price_min, price_max)
+                    if products:
+                        yield "products", products
+
+        yield "done", _build_compare_result(
+            query, keyword_result, keywords, search_terms, products_by_term, coupang_products
+        )
+    finally:
+        # 클라이언트가 중간에 연결을 끊은 경우
+        coupang_task.cancel()
+
+
+async def get_search_snapshot(snapshot_id: str, query: str) -> CompareResult | None:
+    """
+    Load a stored search result snapshot (for pagination / sort / filter)
+
+    Args:
+        snapshot_id: Snapshot ID from the first results page
+        query: Current query (snapshots of other queries are ignored)
+
+    Returns:
+        CompareResult or None if expired / missing
+    """
+    from .snapshots import aget_snapshot
+
+    return await aget_snapshot(snapshot_id, query)
+
+
+async def save_search_snapshot(result: CompareResult) -> str:
+    """
+    Store a full search result as a short-lived snapshot
+
+    Args:
+        result: Full (unpaginated) search result
+
+    Returns:
+        Snapshot ID ("" if the cache is unavailable)
+    """
+    from .snapshots import asave_snapshot
+
+    return await asave_snapshot(result)
+
+
 def save_search_history(
-    user_id: int,
+    user_id: int | None,
     query: str,
     keywords: list[str],
     category: str = "",
 ) -> None:
     """
-    Save search history for authenticated users
+    Save search history (queued, written in bulk by the background worker)
 
     Args:
-        user_id: User ID
+        user_id: User ID (None for anonymous)
         query: Search query
         keywords: Extracted keywords
         category: Category (optional)
     """
-    create_search_history(
-        user_id=user_id,
-        query=query,
-        keywords=keywords,
-        category=category,
+    from .tasks import JOB_SEARCH_HISTORY, background_jobs
+
+    background_jobs.enqueue(
+        JOB_SEARCH_HISTORY,
+        {
+            "user_id": user_id,
+            "query": query,
+            "keywords": keywords,
+            "category": category,
+        },
+    )
+
+
+def log_product_click(product_url: str, platform: str = "", query: str = "") -> None:
+    """
+    Log a product click (queued, written in bulk by the background worker)
+
+    Args:
+        product_url: Clicked product URL
+        platform: Product platform (optional)
+        query: Search query the click came from (optional)
+    """
+    from .tasks import JOB_CLICK_LOG, background_jobs
+
+    background_jobs.enqueue(
+        JOB_CLICK_LOG,
+        {
+            "product_url": product_url,
+            "platform": platform,
+            "query": query,
+        },
     )
 
 
-async def get_search_suggestions(query: str) -> list[str]:
+def get_background_job_stats() -> dict:
+    """
+    Background job queue metrics (queue depth, flush latency, drops)
+
+    Returns:
+        dict: depth, enqueued, processed, dropped, failed, flush latency (ms)
+    """
+    from .catalog_index import get_catalog_index_stats
+    from .fanout import get_fanout_stats
+    from .negative_cache import get_negative_cache_stats
+    from .singleflight import search_flight
+    from .suggestions import get_suggestion_stats
+    from .tasks import background_jobs, get_refresh_stats
+
+    return {
+        **background_jobs.stats(),
+        "cache_refresh": get_refresh_stats(),
+        "single_flight": search_flight.get_stats(),
+        "fanout": get_fanout_stats(),
+        "negative_cache": get_negative_cache_stats(),
+        "product_cache": get_product_cache_stats(),
+        "catalog_index": get_catalog_index_stats(),
+        "suggestions": get_suggestion_stats(),
+    }
+
+
+def warm_search_catalog() -> None:
+    """Build or map the shared Coupang catalog index at worker startup (if enabled)"""
+    from django.conf import settings
+
+    if getattr(settings, "SEARCH_CATALOG_INDEX_ENABLED", False):
+        from .catalog_index import warm_catalog_index
+
+        warm_catalog_index()
+
+
+async def start_background_jobs() -> None:
+    """Run the background job queue on the current (long-lived) event loop (startup hook)"""
+    from .tasks import background_jobs
+
+    await background_jobs.start()
+
+
+async def drain_background_jobs() -> None:
+    """Flush all queued background jobs now (shutdown hook)"""
+    from .tasks import background_jobs
+
+    await background_jobs.drain()
+
+
+async def get_search_suggestions(query: str, limit: int = 5) -> list[str]:
     """
     Get search suggestions based on query
 
+    검색 기록 빈도/Gemini 키워드/쿠팡 상품명으로 만든 워커 메모리 접두어 색인에서 조회
+
     Args:
         query: Partial query
+        limit: Max suggestions
 
     Returns:
         List of suggestions
     """
-    # TODO: Implement autocomplete logic
-    # For now, return empty list
-    return []
+    from .suggestions import aget_suggestions
+
+    return await aget_suggestions(query, limit=limit)
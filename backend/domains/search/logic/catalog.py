@@ -0,0 +1,220 @@
+"""
+🔍 Coupang Catalog Index
+
+쿠팡 수동 상품 카탈로그용 읽기 전용 역색인 (순수 함수 + 바이너리 포맷).
+
+- 행(row)은 최신 등록순으로 정렬 → 행 번호가 작을수록 최신
+- 역색인: search_text의 문자 bigram(+ 1글자 검색어용 unigram) → 행 번호 목록
+- 모든 열은 배열(array) 기반 섹션으로 직렬화 → 파일을 mmap하면 워커들이
+  같은 페이지를 공유 (프로세스별로 올리는 것은 gram → 섹션 위치 사전뿐)
+
+검색 결과는 state.interface.get_coupang_products_by_keywords와 같다
+(LIKE '%검색어%' 매칭, 정확 일치 3 / 상품명 2 / 부분 일치 1 관련도, 같으면 최신순).
+
+파일 포맷:
+    MAGIC(8) | header 길이(u32) | header JSON | 패딩 | 섹션들 (8바이트 정렬)
+    섹션: prices(i32 x n), gram_offsets(u32 x k+1), postings(u32),
+          text_offsets(u32 x n+1), texts(utf-8), row_offsets(u32 x n+1), rows(JSON)
+"""
+
+import json
+import struct
+from array import array
+from typing import NamedTuple
+
+MAGIC = b"CPCAT01\n"
+SEPARATOR = "|"
+
+_SECTIONS = ("prices", "gram_offsets", "postings", "text_offsets", "texts", "row_offsets", "rows")
+
+
+class CatalogProduct(NamedTuple):
+    """색인된 쿠팡 상품 (transform_coupang_manual_results 입력과 같은 속성)"""
+
+    product_id: str
+    name: str
+    price: int
+    image_url: str
+    affiliate_url: str
+    category: str
+
+
+def text_grams(text: str) -> set[str]:
+    """문자열의 unigram + bigram (구분자가 들어간 gram 제외)"""
+    grams = {char for char in text if char != SEPARATOR}
+    grams.update(text[i : i + 2] for i in range(len(text) - 1) if SEPARATOR not in text[i : i + 2])
+    return grams
+
+
+def _query_grams(term: str) -> set[str]:
+    """검색어가 들어있는 행이 반드시 가진 gram (1글자는 unigram, 그 외 bigram)"""
+    if len(term) == 1:
+        return {term}
+    return {term[i : i + 2] for i in range(len(term) - 1)}
+
+
+def build_catalog(rows: list[dict], generation: int = 0) -> bytes:
+    """
+    카탈로그 행 목록 → 직렬화된 색인
+
+    Args:
+        rows: 활성 상품 (최신순). product_id, name, price, image_url,
+            affiliate_url, category, search_text 키
+        generation: 카탈로그 세대 번호 (헤더에 기록)
+
+    Returns:
+        CatalogIndex.from_buffer()로 여는 바이트열
+    """
+    postings: dict[str, list[int]] = {}
+    for row_id, row in enumerate(rows):
+        for gram in text_grams(row["search_text"]):
+            postings.setdefault(gram, []).append(row_id)
+
+    grams = sorted(postings)
+    gram_offsets = array("I", [0])
+    flat_postings = array("I")
+    for gram in grams:
+        flat_postings.extend(postings[gram])
+        gram_offsets.append(len(flat_postings))
+
+    texts, text_offsets = _pack_blobs(row["search_text"] for row in rows)
+    payloads, row_offsets = _pack_blobs(
+        json.dumps(
+            [row["product_id"], row["name"], row["image_url"], row["affiliate_url"], row["category"]],
+            ensure_ascii=False,
+        )
+        for row in rows
+    )
+    sections = {
+        "prices": array("i", [row["price"] for row in rows]).tobytes(),
+        "gram_offsets": gram_offsets.tobytes(),
+        "postings": flat_postings.tobytes(),
+        "text_offsets": text_offsets.tobytes(),
+        "texts": texts,
+        "row_offsets": row_offsets.tobytes(),
+        "rows": payloads,
+    }
+
+    # 섹션 위치는 header 길이에 따라 달라지므로 상대 위치로 기록 (본문 시작 기준)
+    layout = {}
+    body = bytearray()
+    for name in _SECTIONS:
+        body.extend(b"\0" * (-len(body) % 8))
+        layout[name] = [len(body), len(sections[name])]
+        body.extend(sections[name])
+
+    header = json.dumps(
+        {"generation": generation, "count": len(rows), "grams": grams, "sections": layout},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    return prefix + b"\0" * (-len(prefix) % 8) + bytes(body)
+
+
+def _pack_blobs(values) -> tuple[bytes, array]:
+    blob = bytearray()
+    offsets = array("I", [0])
+    for value in values:
+        blob.extend(value.encode("utf-8"))
+        offsets.append(len(blob))
+    return bytes(blob), offsets
+
+
+class CatalogIndex:
+    """
+    직렬화된 카탈로그 색인 (읽기 전용)
+
+    buffer는 bytes 또는 mmap. 배열 섹션은 memoryview.cast로 복사 없이 읽는다.
+    """
+
+    def __init__(self, buffer) -> None:
+        view = memoryview(buffer)
+        if bytes(view[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a catalog index")
+        (header_length,) = struct.unpack_from("<I", view, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(bytes(view[header_start : header_start + header_length]))
+        body_start = header_start + header_length
+        body_start += -body_start % 8
+
+        self.generation: int = header["generation"]
+        self.count: int = header["count"]
+        self._buffer = buffer
+        self._gram_ids = {gram: i for i, gram in enumerate(header["grams"])}
+
+        def section(name: str) -> memoryview:
+            offset, length = header["sections"][name]
+            return view[body_start + offset : body_start + offset + length]
+
+        self._prices = section("prices").cast("i")
+        self._gram_offsets = section("gram_offsets").cast("I")
+        self._postings = section("postings").cast("I")
+        self._text_offsets = section("text_offsets").cast("I")
+        self._texts = section("texts")
+        self._row_offsets = section("row_offsets").cast("I")
+        self._rows = section("rows")
+
+    @classmethod
+    def from_rows(cls, rows: list[dict], generation: int = 0) -> "CatalogIndex":
+        return cls(build_catalog(rows, generation))
+
+    def _posting(self, gram: str) -> memoryview | None:
+        gram_id = self._gram_ids.get(gram)
+        if gram_id is None:
+            return None
+        return self._postings[self._gram_offsets[gram_id] : self._gram_offsets[gram_id + 1]]
+
+    def _text(self, row_id: int) -> str:
+        return str(self._texts[self._text_offsets[row_id] : self._text_offsets[row_id + 1]], "utf-8")
+
+    def product(self, row_id: int) -> CatalogProduct:
+        payload = json.loads(bytes(self._rows[self._row_offsets[row_id] : self._row_offsets[row_id + 1]]))
+        product_id, name, image_url, affiliate_url, category = payload
+        return CatalogProduct(product_id, name, self._prices[row_id], image_url, affiliate_url, category)
+
+    def _candidates(self, term: str) -> set[int]:
+        """term의 gram을 모두 가진 행 (짧은 posting부터 교집합)"""
+        postings = [self._posting(gram) for gram in _query_grams(term)]
+        if any(posting is None for posting in postings):
+            return set()
+        postings.sort(key=len)
+        rows = set(postings[0])
+        for posting in postings[1:]:
+            rows.intersection_update(posting)
+            if not rows:
+                break
+        return rows
+
+    def search(
+        self,
+        terms: list[str],
+        limit: int = 20,
+        price_min: int | None = None,
+        price_max: int | None = None,
+    ) -> list[CatalogProduct]:
+        """
+        검색어(normalize_search_text 결과)로 상품 검색
+
+        Returns:
+            관련도 높은 순 (같으면 최신순) 상위 limit개
+        """
+        relevance: dict[int, int] = {}
+        for term in terms:
+            exact = f"{SEPARATOR}{term}{SEPARATOR}"
+            for row_id in self._candidates(term):
+                text = self._text(row_id)
+                if term not in text:
+                    continue  # gram은 모두 있지만 연속 부분 문자열은 아님
+                price = self._prices[row_id]
+                if (price_min is not None and price < price_min) or (price_max is not None and price > price_max):
+                    continue
+                if exact in text:
+                    score = 3
+                elif term in text[1 : text.find(SEPARATOR, 1)]:  # 첫 필드 = 정규화된 상품명
+                    score = 2
+                else:
+                    score = 1
+                relevance[row_id] = relevance.get(row_id, 0) + score
+
+        ranked = sorted(relevance, key=lambda row_id: (-relevance[row_id], row_id))[:limit]
+        return [self.product(row_id) for row_id in ranked]
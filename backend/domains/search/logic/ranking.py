@@ -0,0 +1,208 @@
+"""
+🔍 Search Ranking
+
+상품 점수화 + 플랫폼 쿼터 제약 정렬 (순수 함수).
+
+점수 = 가중합(키워드 관련도, 가격 위치, 평점/리뷰, 플랫폼 가중치)
+
+- 관련도: 상품명에 대한 BM25 (한국어 복합어를 위해 토큰 대신 부분 문자열 빈도 사용)
+- 가격 위치: 후보 집합 내 가격 순위 (쌀수록 1에 가까움)
+- 평점: 리뷰 수로 보정한 베이지안 평균 (리뷰가 적으면 사전 평균 쪽으로)
+- 플랫폼: 고정 가중치
+
+후보 전체를 열(column) 단위로 한 번에 계산한다 (상품 수백 개 기준 1ms 미만).
+"""
+
+import math
+import re
+from dataclasses import dataclass
+
+from .schemas import ProductResult
+
+_TERM_RE = re.compile(r"[0-9a-z가-힣]+")
+
+
+@dataclass(frozen=True)
+class RankingWeights:
+    """점수 구성 요소별 가중치"""
+
+    relevance: float = 0.5
+    price: float = 0.2
+    rating: float = 0.2
+    platform: float = 0.1
+
+
+DEFAULT_WEIGHTS = RankingWeights()
+
+# 플랫폼 가중치 (0~1)
+PLATFORM_WEIGHTS = {"coupang": 1.0, "naver": 0.8, "11st": 0.7}
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 베이지안 평점 보정: 리뷰 RATING_PRIOR_REVIEWS개 분량의 사전 평균 RATING_PRIOR_MEAN
+RATING_PRIOR_MEAN = 3.5
+RATING_PRIOR_REVIEWS = 20
+
+
+def query_terms(keywords: list[str]) -> list[str]:
+    """키워드 목록 → 중복 없는 소문자 검색어 목록 ("눈 영양제" → ["눈", "영양제"])"""
+    return list(dict.fromkeys(term for keyword in keywords for term in _TERM_RE.findall(keyword.lower())))
+
+
+def relevance_scores(names: list[str], terms: list[str]) -> list[float]:
+    """
+    상품명 BM25 점수 (0~1로 정규화)
+
+    Args:
+        names: 소문자 상품명 목록
+        terms: 검색어 목록
+    """
+    count = len(names)
+    if not count or not terms:
+        return [0.0] * count
+
+    lengths = [len(name) or 1 for name in names]
+    avg_length = sum(lengths) / count
+    norms = [BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length) for length in lengths]
+
+    scores = [0.0] * count
+    for term in terms:
+        # 검색어가 들어있는 상품만 갱신 (대부분의 후보는 0)
+        hits = [(i, tf) for i, name in enumerate(names) if (tf := name.count(term))]
+        if not hits:
+            continue
+        idf = math.log(1 + (count - len(hits) + 0.5) / (len(hits) + 0.5))
+        boost = idf * (BM25_K1 + 1)
+        for i, tf in hits:
+            scores[i] += boost * tf / (tf + norms[i])
+
+    top = max(scores)
+    return [score / top for score in scores] if top else scores
+
+
+def price_scores(prices: list[int]) -> list[float]:
+    """후보 집합 내 가격 순위 (최저가 1.0 ~ 최고가 0.0, 같은 가격은 같은 점수)"""
+    count = len(prices)
+    if count < 2:
+        return [1.0] * count
+    # 내림차순 마지막 위치 = 오름차순 첫 위치의 반대편 (같은 가격은 같은 순위)
+    position = {price: i for i, price in enumerate(sorted(prices, reverse=True))}
+    scale = 1 / (count - 1)
+    return [position[price] * scale for price in prices]
+
+
+def rating_scores(ratings: list[float | None], review_counts: list[int]) -> list[float]:
+    """리뷰 수 보정 평점 (0~1, 5점 만점 기준). 평점이 없으면 사전 평균"""
+    prior = RATING_PRIOR_MEAN * RATING_PRIOR_REVIEWS
+    return [
+        # 5점 척도가 아닌 평점이 섞여도 다른 구성 요소를 덮지 않게 0~1로 제한
+        min(max((prior + rating * reviews) / (RATING_PRIOR_REVIEWS + reviews) / 5, 0.0), 1.0)
+        if rating
+        else RATING_PRIOR_MEAN / 5
+        for rating, reviews in zip(ratings, review_counts, strict=True)
+    ]
+
+
+def score_products(
+    products: list[ProductResult],
+    terms: list[str],
+    weights: RankingWeights = DEFAULT_WEIGHTS,
+) -> list[float]:
+    """
+    후보 전체 점수 계산 (열 단위 일괄 계산)
+
+    Args:
+        products: 후보 상품 (모든 플랫폼)
+        terms: 검색어 목록 (query_terms 결과)
+        weights: 구성 요소별 가중치
+
+    Returns:
+        products와 같은 순서의 점수 목록
+    """
+    relevance = relevance_scores([p.name.lower() for p in products], terms)
+    price = price_scores([p.price for p in products])
+    rating = rating_scores([p.rating for p in products], [p.review_count for p in products])
+    platform = [PLATFORM_WEIGHTS.get(p.platform, 0.5) for p in products]
+
+    return [
+        weights.relevance * r + weights.price * pr + weights.rating * q + weights.platform * pl
+        for r, pr, q, pl in zip(relevance, price, rating, platform, strict=True)
+    ]
+
+
+def rank_search_results(
+    coupang_products: list[ProductResult],
+    naver_products: list[ProductResult],
+    elevenst_products: list[ProductResult],
+    keywords: list[str],
+    coupang_ratio: float = 0.7,
+    naver_ratio: float = 0.2,
+    elevenst_ratio: float = 0.1,
+    weights: RankingWeights = DEFAULT_WEIGHTS,
+) -> list[ProductResult]:
+    """
+    점수순 정렬 + 플랫폼 쿼터 제약
+
+    플랫폼별 개수는 쿠팡 70% / 네이버 20% / 11번가 10% 비율로 정하고, 각 플랫폼에서
+    점수 상위 상품을 고른다. 출력의 어느 앞부분에서도 플랫폼 비율이 쿼터를
+    넘지 않는 범위에서 매 슬롯 가장 높은 점수의 상품을 배치한다.
+    같은 입력이면 항상 같은 순서 (동점은 원래 순서).
+
+    Args:
+        coupang_products: Coupang products
+        naver_products: Naver products
+        elevenst_products: 11st products
+        keywords: 추출된 검색 키워드
+        coupang_ratio: Coupang ratio (default: 0.7)
+        naver_ratio: Naver ratio (default: 0.2)
+        elevenst_ratio: 11st ratio (default: 0.1)
+        weights: 점수 가중치
+
+    Returns:
+        list[ProductResult]: Ranked product results
+    """
+    platforms = [coupang_products, naver_products, elevenst_products]
+    total_count = sum(len(items) for items in platforms)
+    if total_count == 0:
+        return []
+
+    # 각 플랫폼별 목표 개수 계산
+    coupang_count = int(total_count * coupang_ratio)
+    naver_count = int(total_count * naver_ratio)
+    quotas = [coupang_count, naver_count, total_count - coupang_count - naver_count]
+
+    # 후보 전체를 한 번에 점수화한 뒤 플랫폼별로 다시 나눔
+    scores = score_products([p for items in platforms for p in items], query_terms(keywords), weights)
+    selected: list[list[ProductResult]] = []
+    selected_scores: list[list[float]] = []
+    offset = 0
+    for items, quota in zip(platforms, quotas, strict=True):
+        platform_scores = scores[offset : offset + len(items)]
+        offset += len(items)
+        # 안정 정렬 (reverse도 동점은 원래 순서 유지)
+        order = sorted(range(len(items)), key=platform_scores.__getitem__, reverse=True)[:quota]
+        selected.append([items[i] for i in order])
+        selected_scores.append([platform_scores[i] for i in order])
+
+    # 쿼터 제약 병합: 앞부분 slot개 중 플랫폼 i는 (비율 x slot)개 미만일 때만 추가 가능
+    # taken < len_i x slot / output_count 를 정수 연산으로 비교
+    output_count = sum(len(items) for items in selected)
+    lengths = [len(items) for items in selected]
+    taken = [0] * len(selected)
+    ranked: list[ProductResult] = []
+    for slot in range(1, output_count + 1):
+        best = -1
+        best_score = 0.0
+        for i, length in enumerate(lengths):
+            count = taken[i]
+            if count >= length or count * output_count >= length * slot:
+                continue
+            score = selected_scores[i][count]
+            if best < 0 or score > best_score:
+                best, best_score = i, score
+        ranked.append(selected[best][taken[best]])
+        taken[best] += 1
+
+    return ranked
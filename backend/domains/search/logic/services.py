@@ -5,8 +5,6 @@ Pure business logic for search operations (Stateless Processor).
 This module contains pure functions without external dependencies.
 """
 
-import random
-
 from .schemas import ProductResult
 
 
@@ -117,69 +115,120 @@ def transform_coupang_manual_results(coupang_products: list) -> list[ProductResu
     return products
 
 
-def aggregate_search_results(
-    products: list[ProductResult],
-) -> tuple[ProductResult | None, ProductResult | None]:
+def transform_cached_products(cached_products: list) -> list[ProductResult]:
     """
-    Aggregate search results and find cheapest/best rated products
+    Transform ProductCache rows to ProductResult schema
 
     Args:
-        products: List of products
+        cached_products: ProductCache models
 
     Returns:
-        tuple: (cheapest, best_rated)
+        list[ProductResult]: Transformed product results
     """
-    products_by_price = sorted(products, key=lambda x: x.price)
-    products_by_rating = sorted([p for p in products if p.rating], key=lambda x: x.rating or 0, reverse=True)
-
-    cheapest = products_by_price[0] if products_by_price else None
-    best_rated = products_by_rating[0] if products_by_rating else None
-
-    return cheapest, best_rated
+    products: list[ProductResult] = []
+    for item in cached_products:
+        try:
+            products.append(
+                ProductResult(
+                    id=item.product_id,
+                    platform=item.platform,
+                    name=item.product_name,
+                    price=item.price,
+                    original_price=item.original_price,
+                    discount_rate=item.discount_percent,
+                    image_url=item.image_url,
+                    product_url=item.product_url,
+                    mall_name=item.mall_name,
+                    rating=item.rating,
+                    review_count=item.review_count or 0,
+                )
+            )
+        except (AttributeError, ValueError, TypeError):
+            continue
+    return products
 
 
-def mix_search_results(
-    coupang_products: list[ProductResult],
-    naver_products: list[ProductResult],
-    elevenst_products: list[ProductResult],
-    coupang_ratio: float = 0.7,
-    naver_ratio: float = 0.2,
-    elevenst_ratio: float = 0.1,
-) -> list[ProductResult]:
+def dedupe_products(products: list[ProductResult]) -> list[ProductResult]:
     """
-    Mix search results from different platforms with specified ratios
+    Remove duplicate products (same product URL or id), keeping the first occurrence
 
-    쿠팡: 70% (수동 DB + API 혼합)
-    네이버: 20%
-    11번가: 10%
+    여러 키워드로 fan-out 하면 같은 상품이 반복해서 나오므로 mix 전에 제거.
 
     Args:
-        coupang_products: Coupang products
-        naver_products: Naver products
-        elevenst_products: 11st products
-        coupang_ratio: Coupang ratio (default: 0.7)
-        naver_ratio: Naver ratio (default: 0.2)
-        elevenst_ratio: 11st ratio (default: 0.1)
+        products: Products in priority order
 
     Returns:
-        list[ProductResult]: Mixed product results
+        list[ProductResult]: Unique products
     """
-    total_count = len(coupang_products) + len(naver_products) + len(elevenst_products)
-    if total_count == 0:
-        return []
+    seen: set[str] = set()
+    unique: list[ProductResult] = []
+    for product in products:
+        keys = {product.id, product.product_url} - {""}
+        if keys & seen:
+            continue
+        seen |= keys
+        unique.append(product)
+    return unique
 
-    # 각 플랫폼별 목표 개수 계산
-    coupang_count = int(total_count * coupang_ratio)
-    naver_count = int(total_count * naver_ratio)
-    elevenst_count = total_count - coupang_count - naver_count
 
-    # 각 플랫폼에서 랜덤 샘플링
-    selected_coupang = random.sample(coupang_products, min(coupang_count, len(coupang_products)))
-    selected_naver = random.sample(naver_products, min(naver_count, len(naver_products)))
-    selected_elevenst = random.sample(elevenst_products, min(elevenst_count, len(elevenst_products)))
+PRICE_BUCKET = 10000  # 가격 범위 캐시 구간 (원)
 
-    # 결과 합치기 및 섞기
-    mixed_results = selected_coupang + selected_naver + selected_elevenst
-    random.shuffle(mixed_results)
 
-    return mixed_results
+def price_range_bucket(price_min: int | None, price_max: int | None) -> tuple[int | None, int | None]:
+    """
+    가격 범위를 PRICE_BUCKET 단위로 넓힘 (하한 내림, 상한 올림)
+
+    비슷한 범위("2만9천원 이하", "3만원 이하")가 같은 캐시/업스트림 호출을 공유하고,
+    정확한 범위는 filter_by_price로 마지막에 적용한다.
+    """
+    low = price_min // PRICE_BUCKET * PRICE_BUCKET if price_min else None
+    high = -(-price_max // PRICE_BUCKET) * PRICE_BUCKET if price_max else None
+    return low, high
+
+
+def price_cache_keyword(keyword: str, price_range: tuple[int | None, int | None]) -> str:
+    """
+    가격 범위 구간을 포함한 캐시 키워드 ("루테인" + (None, 30000) → "루테인 @-30000")
+
+    범위가 없으면 키워드 그대로 (기존 캐시와 호환)
+    """
+    low, high = price_range
+    if low is None and high is None:
+        return keyword
+    return f"{keyword} @{low or ''}-{high or ''}"
+
+
+def filter_by_price(
+    products: list[ProductResult],
+    price_min: int | None,
+    price_max: int | None,
+) -> list[ProductResult]:
+    """가격 범위 밖의 상품 제외 (범위가 없으면 그대로)"""
+    if price_min is None and price_max is None:
+        return products
+    return [
+        p
+        for p in products
+        if (price_min is None or p.price >= price_min) and (price_max is None or p.price <= price_max)
+    ]
+
+
+def aggregate_search_results(
+    products: list[ProductResult],
+) -> tuple[ProductResult | None, ProductResult | None]:
+    """
+    Aggregate search results and find cheapest/best rated products
+
+    Args:
+        products: List of products
+
+    Returns:
+        tuple: (cheapest, best_rated)
+    """
+    products_by_price = sorted(products, key=lambda x: x.price)
+    products_by_rating = sorted([p for p in products if p.rating], key=lambda x: x.rating or 0, reverse=True)
+
+    cheapest = products_by_price[0] if products_by_price else None
+    best_rated = products_by_rating[0] if products_by_rating else None
+
+    return cheapest, best_rated
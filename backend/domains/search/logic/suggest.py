@@ -0,0 +1,98 @@
+"""
+🔍 Search Suggestions (자동완성 색인)
+
+정규화된 키 정렬 배열 + 이분 탐색 기반 접두어 색인 (순수 함수).
+
+- 제안 문구마다 전체 문구와 각 단어 시작 위치를 키로 등록
+  ("눈 영양제" → "눈 영양제", "영양제"). 단어 중간 일치는 가중치를 낮춤
+- 1~2글자 접두어는 후보 범위가 넓으므로 빌드 시 상위 결과를 미리 계산
+- 3글자 이상은 bisect로 범위를 찾고 범위 안에서만 정렬
+"""
+
+import bisect
+from array import array
+
+# 단어 시작 위치 일치 (전체 문구 접두어가 아닌 경우) 가중치 배율
+TOKEN_MATCH_FACTOR = 0.5
+
+# 이 길이 이하의 접두어는 상위 결과를 미리 계산
+PRECOMPUTED_PREFIX_LENGTH = 2
+
+# 접두어별로 보관하는 최대 제안 수 (요청 limit 상한)
+MAX_SUGGESTIONS = 10
+
+_MAX_CHAR = "\U0010ffff"
+
+
+def normalize_query(text: str) -> str:
+    """자동완성 키 정규화: 소문자 + 공백 하나로 통일"""
+    return " ".join(text.lower().split())
+
+
+class SuggestionIndex:
+    """
+    읽기 전용 접두어 색인
+
+    Args:
+        weights: {정규화 키: (표시 문구, 가중치)}
+    """
+
+    def __init__(self, weights: dict[str, tuple[str, float]]) -> None:
+        # 가중치 내림차순으로 번호를 매겨 (-점수, 번호) 정렬이 곧 순위가 되게 함
+        ordered = sorted(weights.items(), key=lambda item: (-item[1][1], item[0]))
+        self.texts: list[str] = [display for _, (display, _) in ordered]
+
+        entries: list[tuple[str, int, float]] = []
+        for suggestion_id, (key, (_, weight)) in enumerate(ordered):
+            entries.append((key, suggestion_id, weight))
+            position = key.find(" ")
+            while position != -1:
+                entries.append((key[position + 1 :], suggestion_id, weight * TOKEN_MATCH_FACTOR))
+                position = key.find(" ", position + 1)
+        entries.sort()
+
+        self._keys = [key for key, _, _ in entries]
+        self._ids = array("I", [suggestion_id for _, suggestion_id, _ in entries])
+        self._scores = array("d", [score for _, _, score in entries])
+
+        # 짧은 접두어 → 상위 제안 번호
+        candidates: dict[str, list[int]] = {}
+        for i, key in enumerate(self._keys):
+            for length in range(1, min(len(key), PRECOMPUTED_PREFIX_LENGTH) + 1):
+                candidates.setdefault(key[:length], []).append(i)
+        self._top = {prefix: self._rank(positions, MAX_SUGGESTIONS) for prefix, positions in candidates.items()}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _rank(self, positions, limit: int) -> tuple[int, ...]:
+        scores, ids = self._scores, self._ids
+        ranked: list[int] = []
+        seen: set[int] = set()
+        for i in sorted(positions, key=lambda i: (-scores[i], ids[i])):
+            suggestion_id = ids[i]
+            if suggestion_id not in seen:
+                seen.add(suggestion_id)
+                ranked.append(suggestion_id)
+                if len(ranked) == limit:
+                    break
+        return tuple(ranked)
+
+    def suggest(self, prefix: str, limit: int = 5) -> list[str]:
+        """
+        접두어로 시작하는 제안 (가중치 순)
+
+        Args:
+            prefix: normalize_query() 결과
+            limit: 최대 개수 (MAX_SUGGESTIONS 이하)
+        """
+        if not prefix:
+            return []
+        limit = min(limit, MAX_SUGGESTIONS)
+        if len(prefix) <= PRECOMPUTED_PREFIX_LENGTH:
+            ranked = self._top.get(prefix, ())
+        else:
+            low = bisect.bisect_left(self._keys, prefix)
+            high = bisect.bisect_left(self._keys, prefix + _MAX_CHAR, low)
+            ranked = self._rank(range(low, high), limit)
+        return [self.texts[suggestion_id] for suggestion_id in ranked[:limit]]
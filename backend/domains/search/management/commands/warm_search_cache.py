@@ -0,0 +1,53 @@
+"""
+🔥 warm_search_cache
+
+인기 검색어로 키워드 캐시/ProductCache를 미리 채운다.
+
+Usage:
+    python backend/manage.py warm_search_cache
+    python backend/manage.py warm_search_cache --limit 100 --rate 2
+    python backend/manage.py warm_search_cache --seed          # SEED_QUERIES만
+    python backend/manage.py warm_search_cache --every 3600    # 주기 실행 (스케줄러 컨테이너)
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from domains.integrations.interface import run_with_http_clients
+from domains.search.warmer import select_warm_queries, warm_search_cache
+
+
+class Command(BaseCommand):
+    help = "Warm keyword and product caches for the most popular search queries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=getattr(settings, "SEARCH_WARM_LIMIT", 50), help="Number of queries"
+        )
+        parser.add_argument("--days", type=int, default=7, help="Popularity window in days")
+        parser.add_argument("--seed", action="store_true", help="Use only the built-in seed query list")
+        parser.add_argument("--rate", type=float, default=None, help="Max queries per second")
+        parser.add_argument(
+            "--deadline", type=float, default=None, help="Platform fan-out deadline per query (seconds)"
+        )
+        parser.add_argument("--every", type=int, default=0, help="Repeat every N seconds (0 = run once)")
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.monotonic()
+            queries = select_warm_queries(options["limit"], options["days"], seed_only=options["seed"])
+            self.stdout.write(f"🔥 Warming {len(queries)} queries...")
+            report = run_with_http_clients(
+                warm_search_cache(queries, rate=options["rate"], deadline=options["deadline"])
+            )
+
+            style = self.style.SUCCESS if not report.failed_queries else self.style.WARNING
+            self.stdout.write(style(f"✅ {report.summary()}"))
+            for query in report.failed_queries:
+                self.stdout.write(self.style.WARNING(f"   ❌ {query}"))
+
+            if options["every"] <= 0:
+                return
+            time.sleep(max(options["every"] - (time.monotonic() - started), 0))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0004_productcache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClickLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('product_url', models.URLField(max_length=1000, verbose_name='상품 URL')),
+                ('platform', models.CharField(blank=True, db_index=True, max_length=20, verbose_name='플랫폼')),
+                ('query', models.TextField(blank=True, verbose_name='검색어')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'Click Log',
+                'verbose_name_plural': 'Click Logs',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:47
+
+from django.db import migrations, models
+
+TRGM_INDEX_NAME = "search_coup_search_trgm_idx"
+
+
+# 마이그레이션 작성 시점의 build_search_text() 사본 (이후 모델 코드가 바뀌어도 이 마이그레이션은 그대로)
+SEARCH_TEXT_SEPARATOR = "|"
+
+
+def normalize_search_text(value):
+    return " ".join(value.lower().replace(SEARCH_TEXT_SEPARATOR, " ").split())
+
+
+def build_search_text(name, category, keywords):
+    values = [name, category, *(str(keyword) for keyword in keywords or [])]
+    normalized = [text for value in values if (text := normalize_search_text(value))]
+    return SEARCH_TEXT_SEPARATOR + SEARCH_TEXT_SEPARATOR.join(normalized) + SEARCH_TEXT_SEPARATOR
+
+
+def backfill_search_text(apps, schema_editor):
+    """기존 상품의 search_text 채우기"""
+    CoupangManualProduct = apps.get_model("search", "CoupangManualProduct")
+    products = list(CoupangManualProduct.objects.only("id", "name", "category", "keywords"))
+    for product in products:
+        product.search_text = build_search_text(product.name, product.category, product.keywords)
+    CoupangManualProduct.objects.bulk_update(products, ["search_text"], batch_size=1000)
+
+
+def create_trgm_index(apps, schema_editor):
+    """PostgreSQL에서만 pg_trgm GIN 인덱스 생성 (SQLite 개발 환경은 그대로 스캔)"""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {TRGM_INDEX_NAME} ON search_coupangmanualproduct "
+        "USING gin (search_text gin_trgm_ops) WHERE is_active"
+    )
+
+
+def drop_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {TRGM_INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0005_clicklog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coupangmanualproduct',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False, help_text='상품명/카테고리/키워드 정규화 (저장 시 자동 갱신, PostgreSQL pg_trgm GIN 인덱스)', verbose_name='검색 텍스트'),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trgm_index, drop_trgm_index),
+    ]
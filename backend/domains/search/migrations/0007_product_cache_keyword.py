@@ -0,0 +1,86 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:56
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_search_keywords(apps, schema_editor):
+    """기존 ProductCache.search_keyword → 멤버십 행 (키워드 안에서는 최근 캐시 순으로 순위)"""
+    ProductCache = apps.get_model("search", "ProductCache")
+    ProductCacheKeyword = apps.get_model("search", "ProductCacheKeyword")
+
+    ranks: dict[str, int] = {}
+    links = []
+    for product_id, keyword, cached_at in (
+        ProductCache.objects.exclude(search_keyword="")
+        .order_by("search_keyword", "-cached_at")
+        .values_list("id", "search_keyword", "cached_at")
+    ):
+        rank = ranks.get(keyword, 0)
+        ranks[keyword] = rank + 1
+        links.append(ProductCacheKeyword(keyword=keyword, product_id=product_id, rank=rank, cached_at=cached_at))
+    ProductCacheKeyword.objects.bulk_create(links, batch_size=1000)
+
+
+def restore_search_keywords(apps, schema_editor):
+    """되돌리기: 상품마다 가장 최근 멤버십 키워드를 search_keyword로"""
+    ProductCache = apps.get_model("search", "ProductCache")
+    ProductCacheKeyword = apps.get_model("search", "ProductCacheKeyword")
+
+    keywords = dict(ProductCacheKeyword.objects.order_by("cached_at").values_list("product_id", "keyword"))
+    products = list(ProductCache.objects.filter(id__in=list(keywords)))
+    for product in products:
+        product.search_keyword = keywords[product.id]
+    ProductCache.objects.bulk_update(products, ["search_keyword"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0006_coupang_search_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductCacheKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword', models.CharField(help_text='가격 구간 포함 캐시 키워드 (예: 루테인 @-30000)', max_length=200, verbose_name='검색 키워드')),
+                ('rank', models.PositiveSmallIntegerField(default=0, verbose_name='순위')),
+                ('cached_at', models.DateTimeField(default=django.utils.timezone.now, help_text='이 키워드로 마지막으로 검색한 시각', verbose_name='캐시 시간')),
+            ],
+            options={
+                'verbose_name': '상품 캐시 키워드',
+                'verbose_name_plural': '상품 캐시 키워드 목록',
+            },
+        ),
+        migrations.AddField(
+            model_name='productcachekeyword',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keyword_links', to='search.productcache', verbose_name='상품'),
+        ),
+        migrations.AddIndex(
+            model_name='productcachekeyword',
+            index=models.Index(fields=['keyword', '-cached_at'], name='search_prod_keyword_9a21ab_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='productcachekeyword',
+            unique_together={('keyword', 'product')},
+        ),
+        migrations.RunPython(copy_search_keywords, restore_search_keywords),
+        # 되돌릴 때 기존 행에 컬럼을 다시 추가할 수 있도록 먼저 기본값 지정
+        migrations.AlterField(
+            model_name='productcache',
+            name='search_keyword',
+            field=models.CharField(db_index=True, default='', help_text='이 상품을 찾은 검색어', max_length=200, verbose_name='검색 키워드'),
+        ),
+        migrations.RemoveIndex(
+            model_name='productcache',
+            name='search_prod_search__4ddb02_idx',
+        ),
+        migrations.RemoveField(
+            model_name='productcache',
+            name='search_keyword',
+        ),
+    ]
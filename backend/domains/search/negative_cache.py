@@ -0,0 +1,93 @@
+"""
+🔍 Search Negative Cache
+
+(platform, keyword) 단위로 "결과 없음"과 "호출 실패"를 짧게 기억해서
+오타/잡음 검색어 반복이 네이버/11번가 쿼터를 다시 쓰지 않게 한다.
+
+- empty: 정상 응답인데 상품 0개 → SEARCH_NEGATIVE_EMPTY_TTL
+- error: 타임아웃/HTTP 에러/API 에러 → SEARCH_NEGATIVE_ERROR_TTL (장애가
+  "결과 없음"으로 오래 고정되지 않도록 훨씬 짧게)
+- 데드라인 초과는 늦게라도 도착할 수 있으므로 기록하지 않음
+"""
+
+import hashlib
+import logging
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+NEGATIVE_KEY_PREFIX = "search:negative:v1"
+
+NEGATIVE_EMPTY = "empty"
+NEGATIVE_ERROR = "error"
+
+negative_stats: Counter = Counter()
+
+
+def _key(platform: str, keyword: str) -> str:
+    normalized = " ".join(keyword.lower().split())
+    return f"{NEGATIVE_KEY_PREFIX}:{platform}:{hashlib.sha1(normalized.encode('utf-8')).hexdigest()}"
+
+
+async def aget_negative_entries(keys: list[tuple[str, str]]) -> dict[tuple[str, str], str]:
+    """
+    여러 (platform, keyword)의 negative 항목을 한 번에 조회
+
+    Args:
+        keys: [(platform, keyword)]
+
+    Returns:
+        {(platform, keyword): NEGATIVE_EMPTY | NEGATIVE_ERROR} (항목이 있는 것만)
+    """
+    if not keys:
+        return {}
+    cache_keys = {_key(platform, keyword): (platform, keyword) for platform, keyword in keys}
+    try:
+        found = await cache.aget_many(list(cache_keys))
+    except Exception as e:
+        # Redis unavailable - negative cache 미사용
+        logger.debug(f"Negative cache read failed: {e}")
+        return {}
+
+    entries = {cache_keys[cache_key]: kind for cache_key, kind in found.items()}
+    for kind in entries.values():
+        negative_stats[f"hits_{kind}"] += 1
+    return entries
+
+
+async def aset_negative_entry(platform: str, keyword: str, kind: str) -> None:
+    """
+    (platform, keyword)의 negative 항목 저장
+
+    Args:
+        platform: "naver" | "11st"
+        keyword: 검색 키워드
+        kind: NEGATIVE_EMPTY | NEGATIVE_ERROR
+    """
+    if kind == NEGATIVE_EMPTY:
+        ttl = getattr(settings, "SEARCH_NEGATIVE_EMPTY_TTL", 600)
+    else:
+        ttl = getattr(settings, "SEARCH_NEGATIVE_ERROR_TTL", 30)
+    if ttl <= 0:
+        return
+    try:
+        await cache.aset(_key(platform, keyword), kind, timeout=ttl)
+        negative_stats[f"stored_{kind}"] += 1
+    except Exception as e:
+        logger.debug(f"Negative cache write failed: {e}")
+
+
+def get_negative_cache_stats() -> dict:
+    """negative cache 통계 (hits = 절약한 업스트림 호출 수)"""
+    hits_empty = negative_stats[f"hits_{NEGATIVE_EMPTY}"]
+    hits_error = negative_stats[f"hits_{NEGATIVE_ERROR}"]
+    return {
+        "hits_empty": hits_empty,
+        "hits_error": hits_error,
+        "stored_empty": negative_stats[f"stored_{NEGATIVE_EMPTY}"],
+        "stored_error": negative_stats[f"stored_{NEGATIVE_ERROR}"],
+        "saved_calls": hits_empty + hits_error,
+    }
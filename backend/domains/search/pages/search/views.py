@@ -1,17 +1,51 @@
+import logging
+from collections.abc import AsyncIterator
+from urllib.parse import urlencode
+
+from django.conf import settings
 from django.core.cache import cache
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.shortcuts import redirect, render
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+
+from ...interface import (
+    get_search_snapshot,
+    get_search_suggestions,
+    log_product_click,
+    save_search_history,
+    save_search_snapshot,
+    search_products,
+    stream_search_products,
+)
+
+logger = logging.getLogger(__name__)
 
-from ...interface import get_search_suggestions, save_search_history, search_products
+
+def _is_rate_limited(request: HttpRequest) -> bool:
+    """IP당 분당 30회 제한 (Redis 없으면 비활성)"""
+    try:
+        ip_address = request.META.get("REMOTE_ADDR", "")
+        rate_limit_key = f"search_rate_limit:{ip_address}"
+        request_count = cache.get(rate_limit_key, 0)
+        if request_count >= 30:  # Max 30 requests per minute
+            return True
+        cache.set(rate_limit_key, request_count + 1, 60)  # 1 minute window
+    except Exception:
+        # Redis unavailable, skip rate limiting
+        pass
+    return False
 
 
 async def search_page(request: HttpRequest) -> HttpResponse:
     """Search page view - also serves as home page"""
     query = request.GET.get("q", "").strip()
-    sort_by = request.GET.get("sort", "price")  # price, rating, name
+    sort_by = request.GET.get("sort", "relevance")  # relevance, price, rating, name
     filter_platform = request.GET.get("platform", "")  # naver, 11st
     page = int(request.GET.get("page", 1))
     view_mode = request.GET.get("view", "list")  # list, grid
+    snapshot_id = request.GET.get("sid", "")  # 첫 페이지 결과 스냅샷 ID
     per_page = 20
 
     # No query = show home page with categories
@@ -24,36 +58,56 @@ async def search_page(request: HttpRequest) -> HttpResponse:
             },
         )
 
+    from ...logic.schemas import CompareResult
+
+    # 스트리밍 모드: 새 검색 첫 페이지는 셸만 렌더링하고 결과는 search_stream(SSE)으로 채움
+    is_htmx = hasattr(request, "htmx") and request.htmx
+    if (
+        getattr(settings, "SEARCH_STREAMING_ENABLED", False)
+        and not snapshot_id
+        and page == 1
+        and not is_htmx
+        and request.GET.get("stream") != "0"
+    ):
+        return render(
+            request,
+            "pages/search/results.html",
+            {
+                "page_title": f'"{query}" Search Results',
+                "result": CompareResult(
+                    query=query, keywords=[], products=[], recommendation="", cheapest=None, best_rated=None
+                ),
+                "streaming": True,
+                "sort_by": sort_by,
+                "filter_platform": filter_platform,
+                "page": 1,
+                "total_products": 0,
+            },
+        )
+
     # Rate limiting check (disabled if Redis unavailable)
-    try:
-        ip_address = request.META.get("REMOTE_ADDR", "")
-        rate_limit_key = f"search_rate_limit:{ip_address}"
-        request_count = cache.get(rate_limit_key, 0)
-        if request_count >= 30:  # Max 30 requests per minute
-            return render(
-                request,
-                "pages/search/search.html",
-                {
-                    "page_title": "AI Shopping Assistant | Search",
-                    "error": "Too many requests. Please wait a moment and try again.",
-                },
-            )
-        cache.set(rate_limit_key, request_count + 1, 60)  # 1 minute window
-    except Exception:
-        # Redis unavailable, skip rate limiting
-        pass
+    if _is_rate_limited(request):
+        return render(
+            request,
+            "pages/search/search.html",
+            {
+                "page_title": "AI Shopping Assistant | Search",
+                "error": "Too many requests. Please wait a moment and try again.",
+            },
+        )
+
+    # 2페이지 이후/정렬/필터 변경: 스냅샷이 있으면 파이프라인 재실행 없이 재사용
+    result = await get_search_snapshot(snapshot_id, query) if snapshot_id else None
+    is_new_search = result is None
 
     # Execute search (pure async)
     try:
-        result = await search_products(query)
+        if is_new_search:
+            result = await search_products(query)
+            snapshot_id = await save_search_snapshot(result)
     except Exception:
-        import logging
-
-        logger = logging.getLogger(__name__)
         logger.exception(f"Search failed for query: {query}")
 
-        from ...logic.schemas import CompareResult
-
         return render(
             request,
             "pages/search/results.html",
@@ -81,12 +135,17 @@ async def search_page(request: HttpRequest) -> HttpResponse:
             },
         )
 
+    # 검색 기록 (새 검색만, 백그라운드 큐로 bulk insert)
+    # 로그인 기능 제거 상태이므로 user_id 없이 기록
+    if is_new_search and page == 1:
+        save_search_history(user_id=None, query=query, keywords=result.keywords)
+
     # Apply filters
     filtered_products = result.products
     if filter_platform:
         filtered_products = [p for p in filtered_products if p.platform.lower() == filter_platform.lower()]
 
-    # Apply sorting
+    # Apply sorting (relevance: 랭킹 순서 그대로)
     if sort_by == "price":
         filtered_products = sorted(filtered_products, key=lambda x: x.price)
     elif sort_by == "rating":
@@ -110,8 +169,6 @@ async def search_page(request: HttpRequest) -> HttpResponse:
     has_prev = page > 1
 
     # Create new CompareResult with paginated products (frozen model)
-    from ...logic.schemas import CompareResult
-    
     paginated_result = CompareResult(
         query=result.query,
         keywords=result.keywords,
@@ -128,6 +185,7 @@ async def search_page(request: HttpRequest) -> HttpResponse:
         "product_wishlist_map": product_wishlist_map,
         "sort_by": sort_by,
         "filter_platform": filter_platform,
+        "snapshot_id": snapshot_id,
         "page": page,
         "has_next": has_next,
         "has_prev": has_prev,
@@ -146,14 +204,70 @@ async def search_page(request: HttpRequest) -> HttpResponse:
     return render(request, "pages/search/results.html", context)
 
 
-def autocomplete(request: HttpRequest) -> HttpResponse:
-    """Search autocomplete suggestions (HTMX endpoint)"""
+def _sse(event: str, data: str) -> str:
+    """Server-Sent Events 메시지 (여러 줄 데이터는 data: 줄로 분할)"""
+    lines = "".join(f"data: {line}\n" for line in data.splitlines() or [""])
+    return f"event: {event}\n{lines}\n"
+
+
+async def _search_events(query: str) -> AsyncIterator[str]:
+    """
+    검색 결과를 소스별로 SSE 이벤트로 변환
+
+    - products: 상품 카드 HTML (도착 순서대로 append)
+    - done: 최종 결과 페이지 URL (스냅샷 ID 포함)
+    - search-error: 오류 메시지
+    """
+    try:
+        async for event, payload in stream_search_products(query):
+            if event == "products":
+                yield _sse("products", render_to_string("pages/search/_table_row.html", {"result": {"products": payload}}))
+                continue
+
+            snapshot_id = await save_search_snapshot(payload)
+            save_search_history(user_id=None, query=query, keywords=payload.keywords)
+            # 스냅샷이 없으면(캐시 불가) 일반 렌더링으로 다시 검색
+            params = {"q": query, "sid": snapshot_id} if snapshot_id else {"q": query, "stream": "0"}
+            yield _sse("done", f"{reverse('search:search')}?{urlencode(params)}")
+    except Exception:
+        logger.exception(f"Streaming search failed for query: {query}")
+        yield _sse("search-error", "검색 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
+
+
+async def search_stream(request: HttpRequest) -> HttpResponse:
+    """
+    Streaming search results (SSE endpoint)
+
+    캐시/쿠팡 결과를 먼저 보내고, 네이버/11번가 결과는 도착하는 대로 전송.
+    마지막 done 이벤트로 최종(믹스/정렬) 결과 페이지 URL을 전달한다.
+    """
+    query = request.GET.get("q", "").strip()
+    if not query:
+        return HttpResponse(status=400)
+    if _is_rate_limited(request):
+        return HttpResponse(status=429)
+
+    return StreamingHttpResponse(
+        _search_events(query),
+        content_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def autocomplete(request: HttpRequest) -> HttpResponse:
+    """
+    Search autocomplete suggestions (HTMX endpoint)
+
+    같은 접두어 재입력(지우고 다시 입력 등)은 브라우저 캐시에서 응답하도록 짧은 max-age
+    """
     query = request.GET.get("q", "").strip()
     if not query or len(query) < 2:
         return render(request, "pages/search/_autocomplete.html", {"suggestions": [], "query": ""})
 
-    suggestions = get_search_suggestions(query, user_id=None, limit=5)
-    return render(request, "pages/search/_autocomplete.html", {"suggestions": suggestions, "query": query})
+    suggestions = await get_search_suggestions(query, limit=5)
+    response = render(request, "pages/search/_autocomplete.html", {"suggestions": suggestions, "query": query})
+    patch_cache_control(response, public=True, max_age=getattr(settings, "SEARCH_SUGGEST_CACHE_SECONDS", 60))
+    return response
 
 
 def track_click(request: HttpRequest) -> HttpResponse:
@@ -161,6 +275,11 @@ def track_click(request: HttpRequest) -> HttpResponse:
     product_url = request.GET.get("url", "")
     if not product_url:
         return redirect("/")
+    log_product_click(
+        product_url=product_url,
+        platform=request.GET.get("platform", ""),
+        query=request.GET.get("q", ""),
+    )
     return redirect(product_url)
 
 
@@ -0,0 +1,18 @@
+"""
+🔍 Search Signal Receivers
+
+쿠팡 수동 상품이 바뀌면 (Admin 저장/삭제) 카탈로그 색인 세대 번호를 올린다.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+
+@receiver(post_save, sender="search.CoupangManualProduct")
+@receiver(post_delete, sender="search.CoupangManualProduct")
+def invalidate_coupang_catalog(sender, **kwargs) -> None:
+    """커밋 후 세대 번호 증가 → 모든 워커가 새 색인으로 교체"""
+    from .catalog_index import bump_catalog_generation
+
+    transaction.on_commit(bump_catalog_generation)
@@ -0,0 +1,153 @@
+"""
+🔍 Search Single-flight
+
+동일한 키의 동시 업스트림 호출을 하나로 합친다.
+
+- 워커 내: 같은 키의 호출은 하나의 asyncio Future를 공유
+- 워커 간: Redis 락(짧은 lease)을 잡은 워커만 호출하고 결과를 Redis에 게시,
+  나머지 워커는 결과가 올라올 때까지 대기 (lease 만료 시 직접 호출)
+- 결과 키는 락 값(flight 토큰)별로 따로 둔다 - 이전 flight가 남긴 결과를
+  다음 flight의 대기자가 읽지 않도록
+"""
+
+import asyncio
+import hashlib
+import logging
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """키 단위 호출 합치기 (Go의 singleflight와 같은 방식)"""
+
+    def __init__(self, namespace: str, lease: float, poll_interval: float):
+        self.namespace = namespace
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.stats: Counter = Counter()
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.namespace}:lock:{hashlib.sha1(key.encode('utf-8')).hexdigest()}"
+
+    def _result_key(self, token: str) -> str:
+        return f"{self.namespace}:result:{token}"
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키당 하나의 fn()만 실행하고 나머지 호출자는 그 결과를 공유
+
+        Args:
+            key: 합치기 기준 키 (예: "fetch:루테인")
+            fn: 실제 업스트림 호출 (코루틴 팩토리)
+
+        Returns:
+            fn()의 결과
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["shared_local"] += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 리더가 취소된 경우 → 직접 다시 시도 (자신이 취소된 경우는 전파)
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    return await self.do(key, fn)
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            result = await self._do_cluster(key, fn)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _do_cluster(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        lock_key = self._lock_key(key)
+        token = uuid.uuid4().hex
+        try:
+            acquired = await cache.aadd(lock_key, token, timeout=int(self.lease) or 1)
+        except Exception:
+            # Redis unavailable - 워커 내 합치기만 적용
+            self.stats["leader"] += 1
+            return await fn()
+
+        if acquired:
+            self.stats["leader"] += 1
+            try:
+                result = await fn()
+                try:
+                    await cache.aset(self._result_key(token), result, timeout=int(self.lease) or 1)
+                except Exception as e:
+                    logger.debug(f"Single-flight result publish failed: {e}")
+                return result
+            finally:
+                try:
+                    await cache.adelete(lock_key)
+                except Exception:
+                    pass
+
+        # 다른 워커가 호출 중 → 그 flight의 결과 게시를 기다림
+        try:
+            token = await cache.aget(lock_key)
+        except Exception:
+            token = None
+        # 락이 그새 풀렸으면 (리더 종료 직후) 어느 flight의 결과인지 알 수 없으므로 직접 호출
+        result_key = self._result_key(token) if token else None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lease
+        while result_key and loop.time() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                result = await cache.aget(result_key)
+                if result is not None:
+                    self.stats["shared_cluster"] += 1
+                    return result
+                if await cache.aget(lock_key) != token:
+                    # 리더 종료 - 결과가 없으면 (실패) 직접 호출
+                    result = await cache.aget(result_key)
+                    if result is not None:
+                        self.stats["shared_cluster"] += 1
+                        return result
+                    break
+            except Exception:
+                break
+
+        self.stats["fallback"] += 1
+        return await fn()
+
+    def get_stats(self) -> dict:
+        """합치기 통계"""
+        return {
+            "inflight": len(self._inflight),
+            "leader": self.stats["leader"],
+            "shared_local": self.stats["shared_local"],
+            "shared_cluster": self.stats["shared_cluster"],
+            "fallback": self.stats["fallback"],
+        }
+
+
+# Singleton instance (검색 오케스트레이션용)
+search_flight = SingleFlight(
+    namespace="search:flight",
+    lease=getattr(settings, "SEARCH_SINGLEFLIGHT_LEASE", 10.0),
+    poll_interval=getattr(settings, "SEARCH_SINGLEFLIGHT_POLL_INTERVAL", 0.05),
+)
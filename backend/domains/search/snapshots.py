@@ -0,0 +1,74 @@
+"""
+🔍 Search Snapshots
+
+검색 결과(CompareResult) 전체를 짧은 TTL로 Redis에 보관.
+
+무한 스크롤 2페이지 이후, 정렬/플랫폼 필터 변경은 파이프라인(Gemini, 캐시 조회,
+플랫폼 검색, 믹스)을 다시 돌리지 않고 스냅샷을 잘라서 렌더링한다.
+"""
+
+import logging
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .logic.schemas import CompareResult
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY_PREFIX = "search:snapshot:v1"
+
+
+def _key(snapshot_id: str) -> str:
+    return f"{SNAPSHOT_KEY_PREFIX}:{snapshot_id}"
+
+
+async def asave_snapshot(result: CompareResult) -> str:
+    """
+    검색 결과 스냅샷 저장
+
+    Args:
+        result: 전체 검색 결과
+
+    Returns:
+        스냅샷 ID (저장 실패 시 빈 문자열)
+    """
+    snapshot_id = uuid.uuid4().hex[:16]
+    try:
+        await cache.aset(
+            _key(snapshot_id),
+            result.model_dump_json(),
+            timeout=getattr(settings, "SEARCH_SNAPSHOT_TTL", 600),
+        )
+    except Exception as e:
+        logger.debug(f"Search snapshot save failed: {e}")
+        return ""
+    return snapshot_id
+
+
+async def aget_snapshot(snapshot_id: str, query: str) -> CompareResult | None:
+    """
+    검색 결과 스냅샷 조회
+
+    Args:
+        snapshot_id: 스냅샷 ID
+        query: 현재 검색어 (다른 검색어의 스냅샷이면 무시)
+
+    Returns:
+        CompareResult 또는 None (만료/불일치)
+    """
+    if not snapshot_id or not snapshot_id.isalnum():
+        return None
+    try:
+        data = await cache.aget(_key(snapshot_id))
+    except Exception as e:
+        logger.debug(f"Search snapshot read failed: {e}")
+        return None
+    if not data:
+        return None
+
+    result = CompareResult.model_validate_json(data)
+    if result.query != query:
+        return None
+    return result
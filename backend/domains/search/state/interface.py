@@ -7,9 +7,19 @@ This is the ONLY file that should import from .models
 
 from datetime import datetime
 
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Case, Count, Q, Value, When
+from django.utils import timezone
 
-from .models import CoupangManualProduct, ProductCache, SearchHistory
+from .models import (
+    SEARCH_TEXT_SEPARATOR,
+    ClickLog,
+    CoupangManualProduct,
+    ProductCache,
+    ProductCacheKeyword,
+    SearchHistory,
+    normalize_search_text,
+)
 
 
 def create_search_history(
@@ -39,6 +49,76 @@ def create_search_history(
     return history.id
 
 
+def bulk_create_search_history(entries: list[dict]) -> int:
+    """
+    Create many search history records with a single INSERT
+
+    Args:
+        entries: dicts with user_id, query, keywords, category
+
+    Returns:
+        Number of rows created
+    """
+    if not entries:
+        return 0
+    SearchHistory.objects.bulk_create([SearchHistory(**entry) for entry in entries])
+    return len(entries)
+
+
+def get_search_history_since(after_id: int, since: datetime) -> list[tuple[int, str, list]]:
+    """
+    Get search history rows newer than a given id (autocomplete index source)
+
+    Args:
+        after_id: Only rows with a larger id (incremental refresh)
+        since: Only rows created after this datetime
+
+    Returns:
+        [(id, query, keywords)] ordered by id
+    """
+    return list(
+        SearchHistory.objects.filter(id__gt=after_id, created_at__gte=since)
+        .order_by("id")
+        .values_list("id", "query", "keywords")
+    )
+
+
+def get_top_search_queries(limit: int, since: datetime) -> list[str]:
+    """
+    Get the most frequent search queries (cache warmer source)
+
+    Args:
+        limit: Max queries
+        since: Only history created after this datetime
+
+    Returns:
+        Queries, most frequent first
+    """
+    return list(
+        SearchHistory.objects.filter(created_at__gte=since)
+        .values("query")
+        .annotate(count=Count("id"))
+        .order_by("-count", "query")
+        .values_list("query", flat=True)[:limit]
+    )
+
+
+def bulk_create_click_logs(entries: list[dict]) -> int:
+    """
+    Create many click log records with a single INSERT
+
+    Args:
+        entries: dicts with product_url, platform, query
+
+    Returns:
+        Number of rows created
+    """
+    if not entries:
+        return 0
+    ClickLog.objects.bulk_create([ClickLog(**entry) for entry in entries])
+    return len(entries)
+
+
 def get_active_coupang_products(limit: int = 100) -> list[CoupangManualProduct]:
     """
     Get active Coupang manual products
@@ -49,61 +129,223 @@ def get_active_coupang_products(limit: int = 100) -> list[CoupangManualProduct]:
     Returns:
         List of active products
     """
-    return list(
-        CoupangManualProduct.objects.filter(is_active=True).order_by("-created_at")[:limit]
-    )
+    return list(CoupangManualProduct.objects.filter(is_active=True).order_by("-created_at")[:limit])
 
 
 def get_coupang_products_by_keywords(
     keywords: list[str],
     limit: int = 20,
+    price_min: int | None = None,
+    price_max: int | None = None,
 ) -> list[CoupangManualProduct]:
     """
-    Search Coupang products by keywords
+    Search Coupang products by keywords (relevance-ordered)
+
+    search_text에 대한 LIKE '%키워드%' 조회 → PostgreSQL에서는 pg_trgm GIN
+    인덱스(부분 인덱스, is_active)를 사용한다.
+
+    관련도 (키워드별 합산):
+    - 카테고리/등록 키워드와 정확히 일치: 3
+    - 상품명에 포함: 2
+    - 카테고리/등록 키워드에 부분 포함: 1
 
     Args:
         keywords: Search keywords
         limit: Result limit
+        price_min: Minimum price (inclusive, SQL filter)
+        price_max: Maximum price (inclusive, SQL filter)
 
     Returns:
-        Matching products
+        Matching products (관련도 높은 순, 같으면 최신순)
     """
-    if not keywords:
+    terms = [term for term in dict.fromkeys(normalize_search_text(keyword) for keyword in keywords) if term]
+    if not terms:
         return []
 
-    # Build OR query for keywords
-    q = Q()
-    for keyword in keywords:
-        q |= (
-            Q(name__icontains=keyword)
-            | Q(category__icontains=keyword)
-            | Q(keywords__icontains=keyword)
+    # search_text는 소문자로 저장되므로 icontains(UPPER) 대신 contains → 트라이그램 인덱스 사용 가능
+    match = Q()
+    relevance = Value(0)
+    for term in terms:
+        match |= Q(search_text__contains=term)
+        relevance += Case(
+            When(search_text__contains=f"{SEARCH_TEXT_SEPARATOR}{term}{SEARCH_TEXT_SEPARATOR}", then=Value(3)),
+            When(name__icontains=term, then=Value(2)),
+            When(search_text__contains=term, then=Value(1)),
+            default=Value(0),
         )
 
+    queryset = CoupangManualProduct.objects.filter(match, is_active=True)
+    if price_min is not None:
+        queryset = queryset.filter(price__gte=price_min)
+    if price_max is not None:
+        queryset = queryset.filter(price__lte=price_max)
+
+    return list(queryset.annotate(relevance=relevance).order_by("-relevance", "-created_at")[:limit])
+
+
+def get_coupang_catalog_rows() -> list[dict]:
+    """
+    Get every active Coupang product for the in-memory catalog index
+
+    Returns:
+        Rows (newest first) with product_id, name, price, image_url,
+        affiliate_url, category, search_text
+    """
     return list(
-        CoupangManualProduct.objects.filter(q).filter(is_active=True).order_by("-created_at")[:limit]
+        CoupangManualProduct.objects.filter(is_active=True)
+        .order_by("-created_at", "-id")
+        .values("product_id", "name", "price", "image_url", "affiliate_url", "category", "search_text")
     )
 
 
+def get_coupang_suggestion_sources() -> list[tuple[str, list]]:
+    """
+    Get active Coupang product names and keywords (autocomplete index source)
+
+    Returns:
+        [(name, keywords)]
+    """
+    return list(CoupangManualProduct.objects.filter(is_active=True).values_list("name", "keywords"))
+
+
 def get_cached_products(search_keyword: str, cache_cutoff: datetime) -> list[ProductCache]:
     """
     Get cached products by search keyword
-    
+
     ✅ DAEMON Pattern: DB 접근은 state/interface.py를 통해서만
-    
+
     Args:
         search_keyword: Search keyword
         cache_cutoff: Cache cutoff datetime (24시간 전)
-    
+
     Returns:
         List of cached products
     """
-    return list(
-        ProductCache.objects.filter(
-            search_keyword=search_keyword,
-            cached_at__gte=cache_cutoff
-        )[:20]
+    return get_cached_products_for_keywords([search_keyword], cache_cutoff).get(search_keyword, [])
+
+
+def get_cached_products_for_keywords(
+    search_keywords: list[str],
+    cache_cutoff: datetime,
+    limit_per_keyword: int = 20,
+) -> dict[str, list[ProductCache]]:
+    """
+    Get cached products for several search keywords in one query
+
+    키워드 멤버십(ProductCacheKeyword) 기준으로 조회하므로 다른 키워드 검색이
+    이 키워드의 결과를 덮어쓰지 않는다. 반환되는 행의 cached_at은 상품 갱신
+    시각이 아니라 키워드 멤버십 시각 (stale-while-revalidate 판단용).
+
+    Args:
+        search_keywords: Search keywords
+        cache_cutoff: Cache cutoff datetime (24시간 전)
+        limit_per_keyword: Max rows per keyword
+
+    Returns:
+        {keyword: cached products (rank order)}. Keywords without fresh cache are omitted.
+    """
+    grouped: dict[str, list[ProductCache]] = {}
+    links = (
+        ProductCacheKeyword.objects.filter(keyword__in=search_keywords, cached_at__gte=cache_cutoff)
+        .select_related("product")
+        .order_by("keyword", "rank", "id")
     )
+    for link in links:
+        bucket = grouped.setdefault(link.keyword, [])
+        if len(bucket) < limit_per_keyword:
+            product = link.product
+            product.cached_at = link.cached_at
+            bucket.append(product)
+    return grouped
+
+
+CACHE_UPDATE_FIELDS = [
+    "product_name",
+    "price",
+    "original_price",
+    "discount_percent",
+    "image_url",
+    "product_url",
+    "mall_name",
+    "rating",
+    "review_count",
+    "cached_at",
+]
+
+
+def bulk_save_products_to_cache(
+    platform: str,
+    products_by_keyword: dict[str, list],
+) -> int:
+    """
+    Upsert a whole platform batch into the cache
+
+    ✅ DAEMON Pattern: DB 쓰기는 state/interface.py를 통해서만
+
+    1. 상품: INSERT ... ON CONFLICT (platform, product_id) DO UPDATE 한 번
+    2. 키워드 멤버십: upsert 후 이 플랫폼의 해당 키워드에서 빠진 상품만 삭제 (순위 = 결과 순서)
+    같은 상품이 여러 키워드에 나오면 키워드마다 멤버십이 생긴다.
+
+    Args:
+        platform: Platform name ("naver", "11st")
+        products_by_keyword: {search keyword: ProductResult list}
+
+    Returns:
+        Number of product rows written
+    """
+    rows: dict[str, ProductCache] = {}
+    for products in products_by_keyword.values():
+        for p in products:
+            rows[p.id] = ProductCache(
+                platform=platform,
+                product_id=p.id,
+                product_name=p.name,
+                price=p.price,
+                original_price=p.original_price,
+                discount_percent=p.discount_rate,
+                image_url=p.image_url,
+                product_url=p.product_url,
+                mall_name=p.mall_name,
+                rating=p.rating,
+                review_count=p.review_count,
+            )
+
+    if not rows:
+        return 0
+
+    now = timezone.now()
+    with transaction.atomic():
+        ProductCache.objects.bulk_create(
+            list(rows.values()),
+            update_conflicts=True,
+            unique_fields=["platform", "product_id"],
+            update_fields=CACHE_UPDATE_FIELDS,
+        )
+        # bulk_create의 PK 반환 여부는 DB마다 다르므로 한 번 더 조회
+        pks = dict(
+            ProductCache.objects.filter(platform=platform, product_id__in=list(rows)).values_list("product_id", "id")
+        )
+        # 동시 갱신이 delete → insert 사이에 끼어들면 (keyword, product) 유니크 충돌 →
+        # 멤버십도 upsert한 뒤 이번 결과에 없는 행만 지운다
+        links = {
+            keyword: list(dict.fromkeys(pks[p.id] for p in products))
+            for keyword, products in products_by_keyword.items()
+        }
+        ProductCacheKeyword.objects.bulk_create(
+            [
+                ProductCacheKeyword(keyword=keyword, product_id=product_pk, rank=rank, cached_at=now)
+                for keyword, product_pks in links.items()
+                for rank, product_pk in enumerate(product_pks)
+            ],
+            update_conflicts=True,
+            unique_fields=["keyword", "product"],
+            update_fields=["rank", "cached_at"],
+        )
+        for keyword, product_pks in links.items():
+            ProductCacheKeyword.objects.filter(keyword=keyword, product__platform=platform).exclude(
+                product_id__in=product_pks
+            ).delete()
+    return len(rows)
 
 
 def save_product_to_cache(
@@ -119,13 +361,14 @@ def save_product_to_cache(
     rating: float | None,
     review_count: int,
     search_keyword: str,
+    rank: int = 0,
 ) -> None:
     """
     Save product to cache
-    
+
     ✅ DAEMON Pattern: DB 쓰기는 state/interface.py를 통해서만
     """
-    ProductCache.objects.update_or_create(
+    product, _ = ProductCache.objects.update_or_create(
         platform=platform,
         product_id=product_id,
         defaults={
@@ -138,6 +381,10 @@ def save_product_to_cache(
             "mall_name": mall_name,
             "rating": rating,
             "review_count": review_count,
-            "search_keyword": search_keyword,
-        }
+        },
+    )
+    ProductCacheKeyword.objects.update_or_create(
+        keyword=search_keyword,
+        product=product,
+        defaults={"rank": rank, "cached_at": timezone.now()},
     )
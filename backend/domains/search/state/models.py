@@ -5,6 +5,27 @@ Search history model & Coupang manual products.
 """
 
 from django.db import models
+from django.utils import timezone
+
+# search_text 필드 구분자 (값 안의 구분자는 공백으로 치환)
+SEARCH_TEXT_SEPARATOR = "|"
+
+
+def normalize_search_text(value: str) -> str:
+    """검색용 정규화: 소문자 + 공백 하나로 통일 + 구분자 제거"""
+    return " ".join(value.lower().replace(SEARCH_TEXT_SEPARATOR, " ").split())
+
+
+def build_search_text(name: str, category: str, keywords: list) -> str:
+    """
+    상품명/카테고리/키워드를 하나의 검색 문자열로 합침
+
+    "|루테인 지아잔틴 60캡슐|건강식품|루테인|눈 영양제|" 형태. 양끝까지 구분자로
+    감싸서 "|키워드|" 포함 여부로 카테고리/키워드 정확 일치를 판별한다.
+    """
+    values = [name, category, *(str(keyword) for keyword in keywords or [])]
+    normalized = [text for value in values if (text := normalize_search_text(value))]
+    return SEARCH_TEXT_SEPARATOR + SEARCH_TEXT_SEPARATOR.join(normalized) + SEARCH_TEXT_SEPARATOR
 
 
 class SearchHistory(models.Model):
@@ -25,6 +46,23 @@ class SearchHistory(models.Model):
         return f"{self.query} ({self.created_at})"
 
 
+class ClickLog(models.Model):
+    """상품 클릭 로그 (track_click 리다이렉트 시 기록)"""
+
+    product_url = models.URLField(max_length=1000, verbose_name="상품 URL")
+    platform = models.CharField(max_length=20, blank=True, db_index=True, verbose_name="플랫폼")
+    query = models.TextField(blank=True, verbose_name="검색어")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="Created At")
+
+    class Meta:
+        verbose_name = "Click Log"
+        verbose_name_plural = "Click Logs"
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"[{self.platform}] {self.product_url[:50]}"
+
+
 class CoupangManualProduct(models.Model):
     """
     쿠팡 수동 등록 상품 (15만원 달성 전까지 사용)
@@ -73,6 +111,13 @@ class CoupangManualProduct(models.Model):
         db_index=True,
         verbose_name="활성화",
     )
+    search_text = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="검색 텍스트",
+        help_text="상품명/카테고리/키워드 정규화 (저장 시 자동 갱신, PostgreSQL pg_trgm GIN 인덱스)",
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name="등록일",
@@ -94,6 +139,14 @@ class CoupangManualProduct(models.Model):
     def __str__(self) -> str:
         return f"{self.name} ({self.price:,}원)"
 
+    def save(self, *args, **kwargs) -> None:
+        # search_text는 항상 name/category/keywords에서 다시 계산 (bulk_create는 직접 채워야 함)
+        self.search_text = build_search_text(self.name, self.category, self.keywords)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "search_text"}
+        super().save(*args, **kwargs)
+
 
 class ProductCache(models.Model):
     """
@@ -133,13 +186,7 @@ class ProductCache(models.Model):
     rating = models.FloatField(null=True, blank=True, verbose_name="평점")
     review_count = models.IntegerField(default=0, verbose_name="리뷰 수")
     
-    # 캐시 메타데이터
-    search_keyword = models.CharField(
-        max_length=200,
-        db_index=True,
-        verbose_name="검색 키워드",
-        help_text="이 상품을 찾은 검색어",
-    )
+    # 캐시 메타데이터 (상품 정보 갱신 시각, 키워드별 시각은 ProductCacheKeyword)
     cached_at = models.DateTimeField(
         auto_now=True,
         db_index=True,
@@ -152,9 +199,46 @@ class ProductCache(models.Model):
         ordering = ["-cached_at"]
         unique_together = ("platform", "product_id")
         indexes = [
-            models.Index(fields=["search_keyword", "-cached_at"]),
             models.Index(fields=["platform", "-cached_at"]),
         ]
     
     def __str__(self) -> str:
         return f"[{self.platform}] {self.product_name[:30]}"
+
+
+class ProductCacheKeyword(models.Model):
+    """
+    검색 키워드 → 캐시 상품 멤버십
+
+    같은 상품이 여러 키워드에서 나와도 키워드마다 자기 결과 집합(순위, 캐시 시각)을
+    따로 가진다. 키워드의 결과는 그 키워드를 다시 검색했을 때만 교체된다.
+    """
+
+    keyword = models.CharField(
+        max_length=200,
+        verbose_name="검색 키워드",
+        help_text="가격 구간 포함 캐시 키워드 (예: 루테인 @-30000)",
+    )
+    product = models.ForeignKey(
+        ProductCache,
+        on_delete=models.CASCADE,
+        related_name="keyword_links",
+        verbose_name="상품",
+    )
+    rank = models.PositiveSmallIntegerField(default=0, verbose_name="순위")
+    cached_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="캐시 시간",
+        help_text="이 키워드로 마지막으로 검색한 시각",
+    )
+
+    class Meta:
+        verbose_name = "상품 캐시 키워드"
+        verbose_name_plural = "상품 캐시 키워드 목록"
+        unique_together = ("keyword", "product")
+        indexes = [
+            models.Index(fields=["keyword", "-cached_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.keyword} #{self.rank}"
@@ -0,0 +1,143 @@
+"""
+🔍 Search Suggestions (자동완성 엔진)
+
+워커 메모리의 접두어 색인(logic.suggest)에서 키 입력마다 응답한다.
+
+소스:
+- SearchHistory 검색어 빈도 (최근 SEARCH_SUGGEST_HISTORY_DAYS일)
+- SearchHistory에 저장된 Gemini 추출 키워드 빈도
+- 활성 쿠팡 수동 상품명/등록 키워드
+
+갱신:
+- SEARCH_SUGGEST_REFRESH_INTERVAL마다 백그라운드에서 새 SearchHistory 행만 읽어
+  빈도를 더하고 색인을 교체 (응답은 기존 색인으로 계속)
+- 하루에 한 번은 기간 밖 기록을 빼기 위해 처음부터 다시 집계
+- 검색어/키워드는 SEARCH_SUGGEST_MIN_COUNT번 이상 나온 것만 제안 (개인 검색어 노출 방지)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .logic.suggest import SuggestionIndex, normalize_query
+
+logger = logging.getLogger(__name__)
+
+# 검색어/키워드 최대 길이 (문장형 질문은 제안하지 않음)
+MAX_SUGGESTION_LENGTH = 40
+
+# 쿠팡 상품명/키워드 기본 가중치 (검색 기록 1회 = 1)
+PRODUCT_SUGGESTION_WEIGHT = 1.0
+
+# 전체 재집계 주기 (초)
+FULL_REBUILD_INTERVAL = 60 * 60 * 24
+
+_build_lock = threading.Lock()
+_index: SuggestionIndex | None = None
+_built_at = 0.0
+_full_built_at = 0.0
+_last_history_id = 0
+_history_counts: Counter = Counter()
+_display: dict[str, str] = {}
+_refresh_task: asyncio.Task | None = None
+
+suggestion_stats: Counter = Counter()
+
+
+def _add(counts: Counter, text: str, weight: float = 1) -> None:
+    key = normalize_query(text)
+    if 2 <= len(key) <= MAX_SUGGESTION_LENGTH:
+        counts[key] += weight
+        _display.setdefault(key, " ".join(text.split()))
+
+
+def refresh_suggestion_index(full: bool = False) -> SuggestionIndex:
+    """
+    자동완성 색인 갱신 (sync, DB 스레드에서 실행)
+
+    Args:
+        full: True면 검색 기록을 처음부터 다시 집계
+    """
+    from .state.interface import get_coupang_suggestion_sources, get_search_history_since
+
+    global _index, _built_at, _full_built_at, _last_history_id
+    with _build_lock:
+        started = time.perf_counter()
+        now = time.monotonic()
+        if full or _index is None or now - _full_built_at >= FULL_REBUILD_INTERVAL:
+            _history_counts.clear()
+            _display.clear()
+            _last_history_id = 0
+            _full_built_at = now
+
+        since = timezone.now() - timedelta(days=getattr(settings, "SEARCH_SUGGEST_HISTORY_DAYS", 30))
+        for history_id, query, keywords in get_search_history_since(_last_history_id, since):
+            _add(_history_counts, query)
+            for keyword in keywords or []:
+                _add(_history_counts, str(keyword))
+            _last_history_id = history_id
+
+        min_count = getattr(settings, "SEARCH_SUGGEST_MIN_COUNT", 2)
+        weights = Counter({key: count for key, count in _history_counts.items() if count >= min_count})
+        # 상품은 카탈로그가 작으므로 매번 전체 반영 (삭제/비활성 즉시 제외)
+        products: Counter = Counter()
+        for name, keywords in get_coupang_suggestion_sources():
+            _add(products, name, PRODUCT_SUGGESTION_WEIGHT)
+            for keyword in keywords or []:
+                _add(products, str(keyword), PRODUCT_SUGGESTION_WEIGHT)
+        weights.update(products)
+
+        _index = SuggestionIndex({key: (_display[key], weight) for key, weight in weights.items()})
+        _built_at = now
+        suggestion_stats["builds"] += 1
+        suggestion_stats["last_build_ms"] = round((time.perf_counter() - started) * 1000)
+        return _index
+
+
+async def _refresh_in_background() -> None:
+    from asgiref.sync import sync_to_async
+
+    try:
+        await sync_to_async(refresh_suggestion_index)()
+    except Exception:
+        suggestion_stats["refresh_errors"] += 1
+        logger.exception("[Suggest] Index refresh failed")
+
+
+async def aget_suggestions(query: str, limit: int = 5) -> list[str]:
+    """
+    검색어 접두어 자동완성
+
+    첫 호출은 색인 빌드를 기다리고, 이후에는 갱신 주기가 지나도 기존 색인으로
+    바로 응답하면서 백그라운드에서 갱신한다.
+
+    Args:
+        query: 입력 중인 검색어
+        limit: 최대 제안 수
+
+    Returns:
+        제안 문구 목록 (가중치 순)
+    """
+    global _refresh_task
+    from asgiref.sync import sync_to_async
+
+    index = _index
+    if index is None:
+        index = await sync_to_async(refresh_suggestion_index)()
+    elif time.monotonic() - _built_at >= getattr(settings, "SEARCH_SUGGEST_REFRESH_INTERVAL", 300):
+        if _refresh_task is None or _refresh_task.done():
+            _refresh_task = asyncio.create_task(_refresh_in_background())
+
+    suggestion_stats["requests"] += 1
+    return index.suggest(normalize_query(query), limit=limit)
+
+
+def get_suggestion_stats() -> dict:
+    """자동완성 색인 크기/빌드 통계"""
+    return {"suggestions": len(_index) if _index is not None else 0, **dict(suggestion_stats)}
@@ -0,0 +1,401 @@
+"""
+🔍 Search Background Jobs
+
+응답 이후에 처리해도 되는 부수 작업(캐시 채우기, 검색 기록, 클릭 로그)을
+워커 내 asyncio 큐에 쌓았다가 배치로 모아 한 번에 flush.
+soft TTL이 지난 ProductCache 키워드의 백그라운드 갱신도 여기서 예약한다.
+
+✅ DAEMON Pattern: DB 쓰기는 state/interface.py를 통해서만
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+JOB_PRODUCT_CACHE = "product_cache"  # payload: (platform, {keyword: [ProductResult]})
+JOB_SEARCH_HISTORY = "search_history"  # payload: {user_id, query, keywords, category}
+JOB_CLICK_LOG = "click_log"  # payload: {product_url, platform, query}
+
+
+@dataclass(frozen=True)
+class Job:
+    """큐 작업 단위"""
+
+    kind: str
+    payload: Any
+
+
+def flush_jobs(jobs: list[Job]) -> Counter:
+    """
+    작업 배치를 종류별로 묶어 bulk 쓰기 (sync, DB 스레드에서 실행)
+
+    Returns:
+        Counter: 종류별 실패 건수
+    """
+    from .state.interface import (
+        bulk_create_click_logs,
+        bulk_create_search_history,
+        bulk_save_products_to_cache,
+    )
+
+    cache_batches: dict[str, dict[str, list]] = {}
+    history: list[dict] = []
+    clicks: list[dict] = []
+    for job in jobs:
+        if job.kind == JOB_PRODUCT_CACHE:
+            platform, products_by_keyword = job.payload
+            merged = cache_batches.setdefault(platform, {})
+            # 같은 플랫폼/키워드가 여러 번 쌓였으면 가장 최근 결과로 저장
+            merged.update(products_by_keyword)
+        elif job.kind == JOB_SEARCH_HISTORY:
+            history.append(job.payload)
+        elif job.kind == JOB_CLICK_LOG:
+            clicks.append(job.payload)
+
+    failed: Counter = Counter()
+    writers = [
+        *(
+            (JOB_PRODUCT_CACHE, bulk_save_products_to_cache, (platform, batch))
+            for platform, batch in cache_batches.items()
+        ),
+        (JOB_SEARCH_HISTORY, bulk_create_search_history, (history,)),
+        (JOB_CLICK_LOG, bulk_create_click_logs, (clicks,)),
+    ]
+    for kind, writer, args in writers:
+        try:
+            writer(*args)
+        except Exception:
+            # 테이블이 없거나 DB 에러 - 해당 종류만 실패 처리
+            logger.exception(f"[Background] {kind} flush failed")
+            failed[kind] += sum(1 for job in jobs if job.kind == kind)
+    return failed
+
+
+class BackgroundJobQueue:
+    """
+    워커(이벤트 루프)당 하나의 작업 큐 + flush 워커 태스크
+
+    - 첫 작업이 들어오면 flush_interval 동안 batch_size까지 모아서 flush
+    - 큐가 가득 차면 작업을 버리고 dropped 카운트 (검색 응답이 우선)
+    - 큐는 start()로 등록한 오래 사는 루프(ASGI lifespan, 캐시 예열)에서만 사용.
+      등록되지 않은 루프(runserver/WSGI의 async_to_sync 요청마다 생기는 임시 루프)는
+      닫힐 때 대기 작업이 취소되므로, 그 작업은 flush 전용 스레드에서 바로 처리
+    - 이벤트 루프가 없는 곳(sync 뷰, management command)에서는 즉시 처리
+    """
+
+    def __init__(self, max_size: int, batch_size: int, flush_interval: float):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker: asyncio.Task | None = None
+        self._pending: list[Job] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._threaded: set[Future] = set()
+        # wait_flushed 대기: 큐에 넣은 작업 수 / flush한 작업 수 (큐는 FIFO)
+        self._queued = 0
+        self._flushed = 0
+        self._flush_waiters: list[tuple[int, asyncio.Future]] = []
+
+        # Metrics
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    async def start(self) -> None:
+        """현재 이벤트 루프를 큐의 루프로 등록하고 flush 워커 시작 (lifespan.startup)"""
+        self._ensure_worker(asyncio.get_running_loop())
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is not loop or self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+            self._pending = []
+            self._loop = loop
+            self._worker = None
+            self._queued = self._flushed = 0
+            self._flush_waiters = []
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+    def _put(self, job: Job) -> None:
+        try:
+            self._queue.put_nowait(job)
+            self.enqueued += 1
+            self._queued += 1
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"[Background] Queue full, dropped {job.kind} job")
+
+    def enqueue(self, kind: str, payload: Any) -> None:
+        """
+        작업 추가 (non-blocking, 스레드 안전)
+
+        Args:
+            kind: JOB_PRODUCT_CACHE | JOB_SEARCH_HISTORY | JOB_CLICK_LOG
+            payload: 작업 데이터
+        """
+        job = Job(kind=kind, payload=payload)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None and loop is self._loop:
+            self._ensure_worker(loop)
+            self._put(job)
+        elif self._loop is not None and self._loop.is_running():
+            # sync 뷰(스레드)나 다른 루프에서 호출 → 워커 루프로 전달
+            self._loop.call_soon_threadsafe(self._put, job)
+        elif loop is not None:
+            # 등록되지 않은 임시 루프 - 루프가 닫혀도 작업이 남도록 flush 스레드에서 처리
+            self._flush_threaded([job])
+        else:
+            self._flush_inline([job])
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._pending.append(await self._queue.get())
+            deadline = loop.time() + self.flush_interval
+            while len(self._pending) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._pending.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            batch, self._pending = self._pending, []
+            await self._flush(batch)
+
+    def _record(self, batch: list[Job], failed: int, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.flushes += 1
+        self.processed += len(batch) - failed
+        self.failed += failed
+        self.last_flush_ms = round(elapsed_ms, 2)
+        self.max_flush_ms = max(self.max_flush_ms, self.last_flush_ms)
+        self._total_flush_ms += elapsed_ms
+
+    async def _flush(self, batch: list[Job]) -> None:
+        started = time.perf_counter()
+        try:
+            failed = sum((await sync_to_async(flush_jobs)(batch)).values())
+        except Exception:
+            logger.exception("[Background] Flush failed")
+            failed = len(batch)
+        self._record(batch, failed, started)
+
+        self._flushed += len(batch)
+        waiting = []
+        for target, waiter in self._flush_waiters:
+            if target > self._flushed:
+                waiting.append((target, waiter))
+            elif not waiter.done():
+                waiter.set_result(None)
+        self._flush_waiters = waiting
+
+    async def wait_flushed(self) -> None:
+        """
+        지금까지 넣은 작업이 DB에 쓰일 때까지 대기
+
+        쓰기가 끝난 뒤에 해야 하는 일(예: 갱신 lease 반환)이 있을 때 사용.
+        큐의 루프에서 넣은 작업과 flush 스레드로 넘긴 작업만 기다린다.
+        """
+        waits = [asyncio.wrap_future(future) for future in list(self._threaded)]
+        if self._loop is asyncio.get_running_loop() and self._flushed < self._queued:
+            waiter = self._loop.create_future()
+            self._flush_waiters.append((self._queued, waiter))
+            waits.append(waiter)
+        if waits:
+            await asyncio.gather(*waits)
+
+    def _flush_inline(self, batch: list[Job]) -> None:
+        started = time.perf_counter()
+        failed = sum(flush_jobs(batch).values())
+        self._record(batch, failed, started)
+
+    def _flush_threaded(self, batch: list[Job]) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="background-flush")
+        self.enqueued += len(batch)
+        future = self._executor.submit(self._flush_in_thread, batch)
+        self._threaded.add(future)
+        future.add_done_callback(self._threaded.discard)
+
+    def _flush_in_thread(self, batch: list[Job]) -> None:
+        from django.db import close_old_connections
+
+        try:
+            self._flush_inline(batch)
+        except Exception:
+            logger.exception("[Background] Flush failed")
+            self.failed += len(batch)
+        finally:
+            close_old_connections()
+
+    async def drain(self) -> None:
+        """
+        남은 작업을 즉시 flush하고 워커 종료 (shutdown/테스트용)
+        """
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+        batch, self._pending = self._pending, []
+        if self._queue is not None:
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+        if batch:
+            await self._flush(batch)
+        # flush 스레드로 넘긴 작업도 끝날 때까지 대기
+        for future in list(self._threaded):
+            await asyncio.wrap_future(future)
+        # 취소된 워커가 들고 있던 배치는 세지 못하므로 남은 wait_flushed 대기도 해제
+        for _, waiter in self._flush_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._flush_waiters = []
+
+    def stats(self) -> dict:
+        """큐 깊이 및 flush 지연 통계"""
+        depth = (self._queue.qsize() if self._queue is not None else 0) + len(self._pending) + len(self._threaded)
+        return {
+            "depth": depth,
+            "max_size": self.max_size,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "flushes": self.flushes,
+            "last_flush_ms": self.last_flush_ms,
+            "avg_flush_ms": round(self._total_flush_ms / self.flushes, 2) if self.flushes else 0.0,
+            "max_flush_ms": self.max_flush_ms,
+        }
+
+
+# Singleton instance (워커 프로세스당 1개)
+background_jobs = BackgroundJobQueue(
+    max_size=getattr(settings, "BACKGROUND_QUEUE_MAX_SIZE", 10000),
+    batch_size=getattr(settings, "BACKGROUND_BATCH_SIZE", 200),
+    flush_interval=getattr(settings, "BACKGROUND_FLUSH_INTERVAL", 0.5),
+)
+
+
+# =============================================================================
+# Stale-while-revalidate refresh
+# =============================================================================
+
+REFRESH_LOCK_PREFIX = "search:refresh"
+
+_refresh_tasks: dict[tuple[str, tuple[int | None, int | None], tuple[str, ...] | None], asyncio.Task] = {}
+refresh_stats: Counter = Counter()
+
+
+async def _refresh_keyword(
+    keyword: str,
+    price_range: tuple[int | None, int | None],
+    platforms: tuple[str, ...] | None,
+) -> None:
+    """키워드 하나(가격 구간별)의 플랫폼 결과를 다시 가져와 캐시에 저장한 뒤 lease 반환"""
+    from domains.integrations.interface import background_priority
+
+    from .fanout import fetch_platform_products
+    from .logic.services import price_cache_keyword
+
+    # 워커/컨테이너 간 중복 갱신 방지 (짧은 lease)
+    lock_name = price_cache_keyword(keyword, price_range)
+    if platforms is not None:
+        lock_name += f" [{','.join(platforms)}]"
+    lock_key = f"{REFRESH_LOCK_PREFIX}:{hashlib.sha1(lock_name.encode('utf-8')).hexdigest()}"
+    try:
+        acquired = await cache.aadd(lock_key, 1, timeout=getattr(settings, "SEARCH_REFRESH_LOCK_TTL", 60))
+    except Exception:
+        # Redis unavailable - 워커 내 중복 방지만 적용
+        acquired = True
+    if not acquired:
+        refresh_stats["skipped_locked"] += 1
+        return
+
+    try:
+        pairs = {(platform, keyword) for platform in platforms} if platforms is not None else None
+        # 사용자 검색보다 낮은 우선순위로 호출 한도 사용
+        # 기다리는 사용자가 없으므로 요청 데드라인(1.5초) 대신 백그라운드 데드라인 사용
+        deadline = getattr(settings, "SEARCH_REFRESH_DEADLINE", 10.0)
+        with background_priority():
+            await fetch_platform_products([keyword], deadline=deadline, price_range=price_range, pairs=pairs)
+        # 캐시 쓰기 전에 lease를 반환하면 다른 워커가 아직 stale인 캐시를 보고 다시 갱신
+        await background_jobs.wait_flushed()
+        refresh_stats["completed"] += 1
+    except Exception:
+        refresh_stats["failed"] += 1
+        logger.exception(f"[Background] Cache refresh failed for {keyword}")
+    finally:
+        # 다음 soft TTL 만료 때 바로 다시 갱신할 수 있도록 lease 반환
+        try:
+            await cache.adelete(lock_key)
+        except Exception:
+            pass
+
+
+def schedule_cache_refresh(
+    keyword: str,
+    price_range: tuple[int | None, int | None] = (None, None),
+    platforms: list[str] | None = None,
+) -> bool:
+    """
+    soft TTL이 지난 키워드의 백그라운드 갱신 예약 (키워드 + 가격 구간 + 플랫폼당 1회)
+
+    Args:
+        keyword: 검색 키워드
+        price_range: (최저, 최고) 가격 구간
+        platforms: 갱신할 플랫폼 (None이면 전체)
+
+    Returns:
+        True if a new refresh was scheduled
+    """
+    platform_key = tuple(sorted(platforms)) if platforms is not None else None
+    refresh_key = (keyword, price_range, platform_key)
+    task = _refresh_tasks.get(refresh_key)
+    if task is not None and not task.done():
+        refresh_stats["skipped_inflight"] += 1
+        return False
+
+    task = asyncio.get_running_loop().create_task(_refresh_keyword(keyword, price_range, platform_key))
+    _refresh_tasks[refresh_key] = task
+    task.add_done_callback(lambda _: _refresh_tasks.pop(refresh_key, None))
+    refresh_stats["scheduled"] += 1
+    return True
+
+
+def get_refresh_stats() -> dict:
+    """백그라운드 캐시 갱신 통계"""
+    return {
+        "inflight": len(_refresh_tasks),
+        "scheduled": refresh_stats["scheduled"],
+        "completed": refresh_stats["completed"],
+        "failed": refresh_stats["failed"],
+        "skipped_inflight": refresh_stats["skipped_inflight"],
+        "skipped_locked": refresh_stats["skipped_locked"],
+    }
@@ -6,6 +6,7 @@ app_name = "search"
 
 urlpatterns = [
     path("", views.search_page, name="search"),
+    path("stream/", views.search_stream, name="stream"),
     path("autocomplete/", views.autocomplete, name="autocomplete"),
     path("track-click/", views.track_click, name="track_click"),
     path("explain/", views.explain_supplement, name="explain"),
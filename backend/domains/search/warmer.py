@@ -0,0 +1,191 @@
+"""
+🔍 Search Cache Warmer
+
+인기 검색어를 미리 돌려서 캐시가 만료되기 전에 채운다 (배포 직후/24시간 만료 대비).
+
+- 대상: 최근 SearchHistory 상위 N개 검색어 (부족하면 SEED_QUERIES로 채움)
+- 키워드 캐시: 있으면 TTL만 연장, 없으면 Gemini 추출
+- ProductCache: soft TTL 만료까지 SEARCH_WARM_AHEAD초 이내로 남은 (플랫폼, 키워드)만 플랫폼 검색
+- 요청 속도: SEARCH_WARM_RATE (검색어/초) 이하로 조절, 업스트림 호출 한도는 백그라운드 우선순위
+
+검색 결과 스냅샷은 방문마다 새 ID로 저장되어 미리 만들어도 재사용되지 않으므로 예열하지 않는다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# 검색 기록이 부족할 때(배포 직후/새 환경) 사용하는 대표 영양제 검색어
+SEED_QUERIES = [
+    "루테인",
+    "오메가3",
+    "비타민D",
+    "유산균",
+    "마그네슘",
+    "종합비타민",
+    "비타민C",
+    "밀크씨슬",
+    "콜라겐",
+    "단백질 보충제",
+    "철분",
+    "아연",
+    "코엔자임Q10",
+    "프로폴리스",
+    "홍삼",
+]
+
+
+@dataclass
+class WarmReport:
+    """예열 결과"""
+
+    queries: int = 0
+    terms: int = 0
+    fresh_terms: int = 0  # 이미 충분히 신선해서 건너뜀
+    refreshed_terms: int = 0  # 플랫폼 검색으로 새로 채움
+    empty_terms: int = 0  # 검색했지만 결과 없음/실패
+    products: int = 0
+    failed_queries: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def coverage(self) -> float:
+        """예열 후 ProductCache가 있는 키워드 비율"""
+        return (self.fresh_terms + self.refreshed_terms) / self.terms if self.terms else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.queries} queries, {self.terms} terms: {self.fresh_terms} fresh, "
+            f"{self.refreshed_terms} refreshed ({self.products} products), {self.empty_terms} empty, "
+            f"{len(self.failed_queries)} failed | coverage {self.coverage:.0%} in {self.elapsed:.1f}s"
+        )
+
+
+def select_warm_queries(limit: int, days: int, seed_only: bool = False) -> list[str]:
+    """
+    예열할 검색어 (인기순, 부족하면 SEED_QUERIES로 채움)
+
+    Args:
+        limit: 최대 검색어 수
+        days: 인기 검색어 집계 기간 (일)
+        seed_only: True면 SEED_QUERIES만 사용
+    """
+    from .state.interface import get_top_search_queries
+
+    queries = [] if seed_only else get_top_search_queries(limit, timezone.now() - timedelta(days=days))
+    seen = {" ".join(query.lower().split()) for query in queries}
+    for query in SEED_QUERIES:
+        if len(queries) >= limit:
+            break
+        if query.lower() not in seen:
+            queries.append(query)
+    return queries[:limit]
+
+
+async def _warm_query(query: str, report: WarmReport, refresh_cutoff, deadline: float) -> None:
+    from asgiref.sync import sync_to_async
+
+    from domains.integrations.gemini.interface import awarm_keywords
+
+    from .fanout import fetch_platform_products, platform_sources
+    from .interface import _extract_search_terms
+    from .logic.services import price_cache_keyword, price_range_bucket
+    from .state.interface import get_cached_products_for_keywords
+
+    await awarm_keywords(query)
+    keyword_result, _, search_terms = await _extract_search_terms(query)
+    price_range = price_range_bucket(keyword_result.price_min, keyword_result.price_max)
+
+    # 만료가 가까운(또는 없는) (플랫폼, 키워드)만 플랫폼 검색 - 신선도는 플랫폼별
+    cache_keywords = {price_cache_keyword(term, price_range): term for term in search_terms}
+    fresh_rows = await sync_to_async(get_cached_products_for_keywords)(list(cache_keywords), refresh_cutoff)
+    fresh_pairs = {(row.platform, cache_keywords[keyword]) for keyword, rows in fresh_rows.items() for row in rows}
+    stale_pairs = [
+        (platform, term)
+        for term in search_terms
+        for platform in platform_sources()
+        if (platform, term) not in fresh_pairs
+    ]
+    stale_terms = list(dict.fromkeys(term for _, term in stale_pairs))
+    report.terms += len(search_terms)
+    report.fresh_terms += len(search_terms) - len(stale_terms)
+    if not stale_pairs:
+        return
+
+    fetched = await fetch_platform_products(
+        stale_terms, deadline=deadline, price_range=price_range, pairs=set(stale_pairs)
+    )
+    for term in stale_terms:
+        count = sum(len(products) for (_, fetched_term), products in fetched.items() if fetched_term == term)
+        report.products += count
+        if count:
+            report.refreshed_terms += 1
+        elif any(fresh_term == term for _, fresh_term in fresh_pairs):
+            # 빠진 플랫폼은 결과가 없었지만 다른 플랫폼 캐시는 신선함
+            report.fresh_terms += 1
+        else:
+            report.empty_terms += 1
+
+
+async def warm_search_cache(
+    queries: list[str],
+    rate: float | None = None,
+    deadline: float | None = None,
+) -> WarmReport:
+    """
+    검색어 목록으로 키워드 캐시/ProductCache 예열
+
+    Args:
+        queries: 예열할 검색어 (select_warm_queries 결과)
+        rate: 초당 최대 검색어 수 (None이면 settings.SEARCH_WARM_RATE)
+        deadline: 검색어당 플랫폼 fan-out 데드라인 (None이면 settings.SEARCH_WARM_DEADLINE)
+
+    Returns:
+        WarmReport
+    """
+    from domains.integrations.interface import background_priority
+
+    from .interface import drain_background_jobs, start_background_jobs
+
+    if rate is None:
+        rate = getattr(settings, "SEARCH_WARM_RATE", 1.0)
+    if deadline is None:
+        deadline = getattr(settings, "SEARCH_WARM_DEADLINE", 10.0)
+    interval = 1 / rate if rate > 0 else 0.0
+
+    # soft TTL 만료까지 SEARCH_WARM_AHEAD초 이내로 남았으면 미리 갱신
+    refresh_age = getattr(settings, "PRODUCT_CACHE_SOFT_TTL", 60 * 60 * 6) - getattr(
+        settings, "SEARCH_WARM_AHEAD", 60 * 60
+    )
+    refresh_cutoff = timezone.now() - timedelta(seconds=max(refresh_age, 0))
+
+    # ProductCache 쓰기는 이 루프에서 모아서 flush (끝나기 전에 drain)
+    await start_background_jobs()
+    report = WarmReport()
+    started = time.monotonic()
+    # 업스트림 호출 한도는 사용자 검색 몫을 남겨두고 사용
+    with background_priority():
+        for i, query in enumerate(queries):
+            # 요청 예산: i번째 검색어는 시작 후 i x interval초 이전에 시작하지 않음
+            delay = started + i * interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            report.queries += 1
+            try:
+                await _warm_query(query, report, refresh_cutoff, deadline)
+            except Exception as e:
+                logger.warning(f"[Warm] {query!r} failed: {e}")
+                report.failed_queries.append(query)
+
+    # 큐에 쌓인 ProductCache 쓰기를 마저 flush
+    await drain_background_jobs()
+    report.elapsed = time.monotonic() - started
+    logger.info(f"[Warm] {report.summary()}")
+    return report
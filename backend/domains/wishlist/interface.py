@@ -39,64 +39,65 @@ def check_price_drops(user_id: int) -> list[PriceAlert]:
     Returns:
         list[PriceAlert]: List of new price alerts created
     """
-    import asyncio
-
     from domains.integrations.elevenst.interface import search_elevenst_products
+    from domains.integrations.interface import background_priority, run_with_http_clients
     from domains.integrations.naver.interface import search_naver_products
 
     wishlist_items = WishlistItem.objects.filter(user_id=user_id)
     alerts: list[PriceAlert] = []
 
-    for item in wishlist_items:
-        try:
-            # Search for current price
-            if item.platform == "naver":
-                # Extract product ID from URL or use name
-                results = asyncio.run(search_naver_products(item.name, limit=1))
-                if results and len(results) > 0:
-                    current_price = int(results[0].price)
-                else:
-                    continue
-            elif item.platform == "11st":
-                results = asyncio.run(search_elevenst_products(item.name, limit=1))
-                if results and len(results) > 0:
-                    current_price = int(results[0].price)
+    # 가격 체크는 백그라운드 작업 - 사용자 검색 몫의 업스트림 호출 한도를 남겨둠
+    with background_priority():
+        for item in wishlist_items:
+            try:
+                # Search for current price
+                if item.platform == "naver":
+                    # Extract product ID from URL or use name
+                    results = run_with_http_clients(search_naver_products(item.name, limit=1))
+                    if results and len(results) > 0:
+                        current_price = int(results[0].price)
+                    else:
+                        continue
+                elif item.platform == "11st":
+                    results = run_with_http_clients(search_elevenst_products(item.name, limit=1))
+                    if results and len(results) > 0:
+                        current_price = int(results[0].price)
+                    else:
+                        continue
                 else:
                     continue
-            else:
-                continue
 
-            # Check if price dropped (more than 5%)
-            if current_price < item.price:
-                price_drop_percent = ((item.price - current_price) / item.price) * 100
-
-                if price_drop_percent >= 5.0:  # Only alert if drop is >= 5%
-                    # Create alert if not exists
-                    alert, created = PriceAlert.objects.get_or_create(
-                        wishlist_item=item,
-                        defaults={
-                            "user_id": user_id,
-                            "original_price": item.price,
-                            "current_price": current_price,
-                            "price_drop_percent": price_drop_percent,
-                        },
-                    )
-
-                    if created:
-                        alerts.append(alert)
-                        # Update wishlist item price
-                        item.price = current_price
-                        item.save(update_fields=["price"])
+                # Check if price dropped (more than 5%)
+                if current_price < item.price:
+                    price_drop_percent = ((item.price - current_price) / item.price) * 100
+
+                    if price_drop_percent >= 5.0:  # Only alert if drop is >= 5%
+                        # Create alert if not exists
+                        alert, created = PriceAlert.objects.get_or_create(
+                            wishlist_item=item,
+                            defaults={
+                                "user_id": user_id,
+                                "original_price": item.price,
+                                "current_price": current_price,
+                                "price_drop_percent": price_drop_percent,
+                            },
+                        )
+
+                        if created:
+                            alerts.append(alert)
+                            # Update wishlist item price
+                            item.price = current_price
+                            item.save(update_fields=["price"])
             
-            # Record price history (regardless of drop)
-            PriceHistory.objects.create(
-                wishlist_item=item,
-                price=current_price,
-            )
-
-        except Exception:
-            # Skip items that fail to check
-            continue
+                # Record price history (regardless of drop)
+                PriceHistory.objects.create(
+                    wishlist_item=item,
+                    price=current_price,
+                )
+
+            except Exception:
+                # Skip items that fail to check
+                continue
 
     return alerts
 
@@ -34,6 +34,14 @@ class TestHealthModule:
         data = response.json()
         assert "checks" in data
 
+    def test_metrics_endpoint(self, client):
+        """Test runtime metrics endpoint."""
+        response = client.get("/health/metrics/")
+        assert response.status_code == 200
+        metrics = response.json()["metrics"]
+        assert "keyword_cache" in metrics
+        assert "depth" in metrics["background_jobs"]
+
 
 @pytest.mark.django_db
 class TestCoreModule:
@@ -93,3 +101,1420 @@ class TestHealthInterface:
         assert isinstance(result, HealthStatus)
         assert "database" in result.checks
         assert "cache" in result.checks
+
+
+class TestGeminiKeywordExtraction:
+    """Tests for async Gemini keyword extraction."""
+
+    async def test_aextract_keywords_respects_concurrency_gate(self, settings):
+        """Concurrent extractions overlap but never exceed GEMINI_MAX_CONCURRENCY."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from domains.integrations.gemini.client import GeminiClient
+
+        settings.GEMINI_MAX_CONCURRENCY = 2
+        state = {"active": 0, "peak": 0}
+
+        async def fake_generate_content(model, contents):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return SimpleNamespace(text='{"keywords": ["루테인"], "category": "눈 건강", "price_range": null}')
+
+        client = GeminiClient()
+        original = (client._client, client._semaphore, client._semaphore_loop)
+        client._client = SimpleNamespace(
+            aio=SimpleNamespace(models=SimpleNamespace(generate_content=fake_generate_content))
+        )
+        client._semaphore = None
+        try:
+            results = await asyncio.gather(*(client.aextract_keywords("눈 피로") for _ in range(6)))
+        finally:
+            client._client, client._semaphore, client._semaphore_loop = original
+
+        assert state["peak"] == 2
+        assert all(r.keywords == ["루테인"] and r.category == "눈 건강" for r in results)
+
+    def test_keyword_cache_two_tier(self, settings):
+        """Second lookup is served from L1, and L2 (Redis) refills a cold L1."""
+        from domains.integrations.gemini.cache import KeywordCache
+        from domains.integrations.gemini.client import KeywordExtractionResult
+
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        kc = KeywordCache(max_entries=2, ttl=60)
+        result = KeywordExtractionResult(keywords=["루테인"], category="눈 건강", price_max=30000)
+
+        assert kc.get("눈  피로") is None
+        kc.set("눈 피로", result)
+        assert kc.get(" 눈 피로 ") == result
+
+        kc.clear_local()
+        assert kc.get("눈 피로") == result
+
+        stats = kc.stats()
+        assert (stats["local_hits"], stats["redis_hits"], stats["misses"]) == (1, 1, 1)
+
+
+class TestSearchOrchestration:
+    """Tests for the search orchestration layer (upstream calls mocked)."""
+
+    @staticmethod
+    def _crawl_result(name: str, url: str, price: int = 10000):
+        from decimal import Decimal
+
+        from domains.integrations.base import CrawlResult
+
+        return CrawlResult(product_name=name, price=Decimal(price), url=url, image_url="https://img.example/x.jpg")
+
+    async def test_search_fans_out_across_keywords(self, monkeypatch):
+        """Every extracted keyword hits both platforms and duplicates are merged."""
+        from domains.integrations.elevenst import interface as elevenst_interface
+        from domains.integrations.gemini import interface as gemini_interface
+        from domains.integrations.gemini.client import KeywordExtractionResult
+        from domains.integrations.naver import interface as naver_interface
+        from domains.search import interface as search_interface
+        from domains.search.tasks import background_jobs
+
+        searched = []
+
+        async def fake_extract(query):
+            return KeywordExtractionResult(keywords=["루테인", "빌베리"], category="눈 건강")
+
+        async def fake_naver(keyword, limit=20, raise_errors=False):
+            searched.append(("naver", keyword))
+            return [
+                self._crawl_result("공통 상품", "https://naver.example/shared"),
+                self._crawl_result(f"{keyword} 상품", f"https://naver.example/{keyword}"),
+            ]
+
+        async def fake_elevenst(keyword, limit=20, raise_errors=False):
+            searched.append(("11st", keyword))
+            return []
+
+        monkeypatch.setattr(gemini_interface, "aextract_keywords", fake_extract)
+        monkeypatch.setattr(naver_interface, "search_naver_products", fake_naver)
+        monkeypatch.setattr(elevenst_interface, "search_elevenst_products", fake_elevenst)
+        monkeypatch.setattr(background_jobs, "enqueue", lambda kind, payload: None)
+        mixed = {}
+
+        def fake_rank(coupang_products, naver_products, elevenst_products, keywords):
+            mixed["naver"] = naver_products
+            return coupang_products + naver_products + elevenst_products
+
+        monkeypatch.setattr(search_interface, "rank_search_results", fake_rank)
+
+        await search_interface.search_products("눈 피로")
+
+        assert sorted(searched) == [("11st", "루테인"), ("11st", "빌베리"), ("naver", "루테인"), ("naver", "빌베리")]
+        assert [p.name for p in mixed["naver"]] == ["공통 상품", "루테인 상품", "빌베리 상품"]
+
+    async def test_stale_cache_is_served_and_refreshed(self, monkeypatch):
+        """Rows past the soft TTL are served as-is and one refresh is scheduled."""
+        from datetime import timedelta
+        from types import SimpleNamespace
+
+        from django.utils import timezone
+
+        from domains.integrations.gemini import interface as gemini_interface
+        from domains.integrations.gemini.client import KeywordExtractionResult
+        from domains.search import fanout, tasks
+        from domains.search.state import interface as state_interface
+
+        async def fake_extract(query):
+            return KeywordExtractionResult(keywords=["루테인"], category="눈 건강")
+
+        stale_row = SimpleNamespace(
+            product_id="naver_a",
+            platform="naver",
+            product_name="루테인 상품",
+            price=10000,
+            original_price=None,
+            discount_percent=None,
+            image_url="https://img.example/x.jpg",
+            product_url="https://naver.example/a",
+            mall_name="네이버",
+            rating=None,
+            review_count=0,
+            cached_at=timezone.now() - timedelta(hours=12),
+        )
+
+        stale_elevenst_row = SimpleNamespace(**{**vars(stale_row), "product_id": "11st_a", "platform": "11st"})
+
+        async def fail_fetch(terms, **kwargs):
+            raise AssertionError("stale cache must not block on upstream")
+
+        refreshed = []
+        monkeypatch.setattr(gemini_interface, "aextract_keywords", fake_extract)
+        monkeypatch.setattr(
+            state_interface,
+            "get_cached_products_for_keywords",
+            lambda terms, cutoff: {"루테인": [stale_row, stale_elevenst_row]},
+        )
+        monkeypatch.setattr(fanout, "fetch_platform_products", fail_fetch)
+        monkeypatch.setattr(
+            tasks,
+            "schedule_cache_refresh",
+            lambda term, price_range, platforms: refreshed.append((term, sorted(platforms))),
+        )
+
+        from domains.search.interface import search_products
+
+        result = await search_products("루테인")
+
+        assert refreshed == [("루테인", ["11st", "naver"])]
+        assert result.keywords == ["루테인"]
+
+    async def test_only_uncached_platforms_are_fetched(self, monkeypatch):
+        """A keyword cached for one platform only hits the platforms it is missing."""
+        from types import SimpleNamespace
+
+        from django.utils import timezone
+
+        from domains.integrations.gemini import interface as gemini_interface
+        from domains.integrations.gemini.client import KeywordExtractionResult
+        from domains.search import fanout, tasks
+        from domains.search.state import interface as state_interface
+
+        async def fake_extract(query):
+            return KeywordExtractionResult(keywords=["루테인"], category="눈 건강")
+
+        fresh_row = SimpleNamespace(
+            product_id="naver_a",
+            platform="naver",
+            product_name="루테인 상품",
+            price=10000,
+            original_price=None,
+            discount_percent=None,
+            image_url="https://img.example/x.jpg",
+            product_url="https://naver.example/a",
+            mall_name="네이버",
+            rating=None,
+            review_count=0,
+            cached_at=timezone.now(),
+        )
+        fetched = []
+
+        async def fake_fetch(terms, deadline=None, price_range=(None, None), pairs=None):
+            fetched.append(sorted(pairs))
+            return {pair: [] for pair in pairs}
+
+        monkeypatch.setattr(gemini_interface, "aextract_keywords", fake_extract)
+        monkeypatch.setattr(
+            state_interface, "get_cached_products_for_keywords", lambda terms, cutoff: {"루테인": [fresh_row]}
+        )
+        monkeypatch.setattr(fanout, "fetch_platform_products", fake_fetch)
+        monkeypatch.setattr(
+            tasks, "schedule_cache_refresh", lambda *args, **kwargs: pytest.fail("fresh cache refreshed")
+        )
+
+        from domains.search import interface as search_interface
+
+        before = search_interface.get_product_cache_stats()
+        await search_interface.search_products("루테인")
+        after = search_interface.get_product_cache_stats()
+
+        assert fetched == [[("11st", "루테인")]]
+        assert after["hits"] - before.get("hits", 0) == 1
+        assert after["misses"] - before.get("misses", 0) == 1
+
+    async def test_slow_platform_misses_deadline_but_warms_cache(self, monkeypatch):
+        """A platform past the deadline is dropped from the response and cached when it lands."""
+        import asyncio
+
+        from domains.integrations.elevenst import interface as elevenst_interface
+        from domains.integrations.naver import interface as naver_interface
+        from domains.search import fanout
+        from domains.search.tasks import background_jobs
+
+        landed = asyncio.Event()
+        enqueued = []
+
+        async def fast_naver(keyword, limit=20, raise_errors=False):
+            return [self._crawl_result("빠른 상품", "https://naver.example/fast")]
+
+        async def slow_elevenst(keyword, limit=20, raise_errors=False):
+            await asyncio.sleep(0.1)
+            return [self._crawl_result("느린 상품", "https://11st.example/slow")]
+
+        def record(kind, payload):
+            enqueued.append(payload)
+            if payload[0] == "11st":
+                landed.set()
+
+        monkeypatch.setattr(naver_interface, "search_naver_products", fast_naver)
+        monkeypatch.setattr(elevenst_interface, "search_elevenst_products", slow_elevenst)
+        monkeypatch.setattr(background_jobs, "enqueue", record)
+        timeouts_before = fanout.source_stats["11st"]["timeouts"]
+
+        fetched = await fanout.fetch_platform_products(["루테인"], deadline=0.02)
+
+        assert [p.name for p in fetched[("naver", "루테인")]] == ["빠른 상품"]
+        assert fetched[("11st", "루테인")] == []
+        assert fanout.source_stats["11st"]["timeouts"] == timeouts_before + 1
+
+        await asyncio.wait_for(landed.wait(), timeout=1)
+        platform, batch = enqueued[-1]
+        assert platform == "11st"
+        assert [p.name for p in batch["루테인"]] == ["느린 상품"]
+
+    async def test_stream_yields_sources_in_arrival_order(self, monkeypatch):
+        """The streaming search emits the fast platform first and the mixed result last."""
+        import asyncio
+
+        from domains.integrations.elevenst import interface as elevenst_interface
+        from domains.integrations.gemini import interface as gemini_interface
+        from domains.integrations.gemini.client import KeywordExtractionResult
+        from domains.integrations.naver import interface as naver_interface
+        from domains.search import interface as search_interface
+        from domains.search.state import interface as state_interface
+        from domains.search.tasks import background_jobs
+
+        async def fake_extract(query):
+            return KeywordExtractionResult(keywords=["루테인"], category="눈 건강")
+
+        async def fast_naver(keyword, limit=20, raise_errors=False):
+            return [self._crawl_result("네이버 상품", "https://naver.example/a")]
+
+        async def slow_elevenst(keyword, limit=20, raise_errors=False):
+            await asyncio.sleep(0.05)
+            return [self._crawl_result("11번가 상품", "https://11st.example/a")]
+
+        monkeypatch.setattr(gemini_interface, "aextract_keywords", fake_extract)
+        monkeypatch.setattr(naver_interface, "search_naver_products", fast_naver)
+        monkeypatch.setattr(elevenst_interface, "search_elevenst_products", slow_elevenst)
+        monkeypatch.setattr(state_interface, "get_cached_products_for_keywords", lambda terms, cutoff: {})
+        monkeypatch.setattr(search_interface, "get_coupang_products_by_keywords", lambda keywords, limit: [])
+        monkeypatch.setattr(background_jobs, "enqueue", lambda kind, payload: None)
+
+        events = [event async for event in search_interface.stream_search_products("루테인")]
+
+        assert [(kind, [p.name for p in payload]) for kind, payload in events[:2]] == [
+            ("products", ["네이버 상품"]),
+            ("products", ["11번가 상품"]),
+        ]
+        assert events[-1][0] == "done"
+        assert events[-1][1].keywords == ["루테인"]
+
+    async def test_price_range_is_pushed_down(self, monkeypatch):
+        """The extracted price range reaches upstream, Coupang SQL and the cache key, and bounds results."""
+        from domains.integrations.elevenst import interface as elevenst_interface
+        from domains.integrations.gemini import interface as gemini_interface
+        from domains.integrations.gemini.client import KeywordExtractionResult
+        from domains.integrations.naver import interface as naver_interface
+        from domains.search import interface as search_interface
+        from domains.search.state import interface as state_interface
+        from domains.search.tasks import background_jobs
+
+        seen = {}
+
+        async def fake_extract(query):
+            return KeywordExtractionResult(keywords=["오메가3"], category="혈행 건강", price_max=29000)
+
+        async def fake_naver(keyword, limit=20, raise_errors=False, price_min=None, price_max=None):
+            seen["naver"] = (price_min, price_max)
+            return [
+                self._crawl_result("범위 안", "https://naver.example/in", price=25000),
+                self._crawl_result("구간 안, 범위 밖", "https://naver.example/out", price=29500),
+            ]
+
+        async def fake_elevenst(keyword, limit=20, raise_errors=False, price_min=None, price_max=None):
+            seen["11st"] = (price_min, price_max)
+            return []
+
+        def fake_cached(keywords, cutoff):
+            seen["cache"] = keywords
+            return {}
+
+        def fake_coupang(keywords, limit, price_min=None, price_max=None):
+            seen["coupang"] = (price_min, price_max)
+            return []
+
+        monkeypatch.setattr(gemini_interface, "aextract_keywords", fake_extract)
+        monkeypatch.setattr(naver_interface, "search_naver_products", fake_naver)
+        monkeypatch.setattr(elevenst_interface, "search_elevenst_products", fake_elevenst)
+        monkeypatch.setattr(state_interface, "get_cached_products_for_keywords", fake_cached)
+        monkeypatch.setattr(search_interface, "get_coupang_products_by_keywords", fake_coupang)
+        monkeypatch.setattr(background_jobs, "enqueue", lambda kind, payload: None)
+
+        def fake_rank(coupang_products, naver_products, elevenst_products, keywords):
+            seen["ranked"] = [p.name for p in naver_products]
+            return naver_products
+
+        monkeypatch.setattr(search_interface, "rank_search_results", fake_rank)
+
+        await search_interface.search_products("3만원 이하 오메가3")
+
+        assert seen["naver"] == seen["11st"] == (None, 30000)
+        assert seen["coupang"] == (None, 29000)
+        assert seen["cache"] == ["오메가3 @-30000"]
+        assert seen["ranked"] == ["범위 안"]
+
+    def test_sse_framing_splits_multiline_data(self):
+        """Multi-line HTML is sent as one SSE event with several data lines."""
+        from domains.search.pages.search.views import _sse
+
+        assert _sse("products", "<div>\n</div>") == "event: products\ndata: <div>\ndata: </div>\n\n"
+
+    async def test_negative_cache_skips_repeat_empty_and_failed_calls(self, monkeypatch, settings):
+        """Empty and failed platform searches are remembered separately and not retried."""
+        from domains.integrations.base import CrawlError
+        from domains.integrations.elevenst import interface as elevenst_interface
+        from domains.integrations.naver import interface as naver_interface
+        from domains.search import fanout
+        from domains.search.negative_cache import aget_negative_entries, negative_stats
+        from domains.search.tasks import background_jobs
+
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "negative-cache-test"}
+        }
+        calls = []
+
+        async def failing_naver(keyword, limit=20, raise_errors=False):
+            calls.append("naver")
+            raise CrawlError("naver", "HTTP 500")
+
+        async def empty_elevenst(keyword, limit=20, raise_errors=False):
+            calls.append("11st")
+            return []
+
+        monkeypatch.setattr(naver_interface, "search_naver_products", failing_naver)
+        monkeypatch.setattr(elevenst_interface, "search_elevenst_products", empty_elevenst)
+        monkeypatch.setattr(background_jobs, "enqueue", lambda kind, payload: None)
+        saved_before = negative_stats["hits_empty"] + negative_stats["hits_error"]
+
+        await fanout.fetch_platform_products(["루테인ㅇ"])
+        second = await fanout.fetch_platform_products(["루테인ㅇ"])
+
+        assert sorted(calls) == ["11st", "naver"]
+        assert second == {("naver", "루테인ㅇ"): [], ("11st", "루테인ㅇ"): []}
+        assert negative_stats["hits_empty"] + negative_stats["hits_error"] == saved_before + 2
+        assert await aget_negative_entries([("naver", "루테인ㅇ"), ("11st", "루테인ㅇ")]) == {
+            ("naver", "루테인ㅇ"): "error",
+            ("11st", "루테인ㅇ"): "empty",
+        }
+
+    async def test_coupang_lookup_is_cancelled_when_cache_lookup_fails(self, monkeypatch):
+        """A failure after the Coupang lookup starts cancels it instead of leaking the task."""
+        import asyncio
+
+        from domains.integrations.gemini import interface as gemini_interface
+        from domains.integrations.gemini.client import KeywordExtractionResult
+        from domains.search import interface as search_interface
+
+        started = []
+
+        async def fake_extract(query):
+            return KeywordExtractionResult(keywords=["루테인"], category="")
+
+        def fake_start(keywords, deadline, keyword_result):
+            started.append(asyncio.create_task(asyncio.sleep(60)))
+            return started[0]
+
+        async def broken_cache(search_terms, price_range):
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(gemini_interface, "aextract_keywords", fake_extract)
+        monkeypatch.setattr(search_interface, "_start_coupang_lookup", fake_start)
+        monkeypatch.setattr(search_interface, "_load_cached_products", broken_cache)
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await search_interface.search_products("루테인")
+        await asyncio.sleep(0)
+
+        assert started[0].cancelled()
+
+
+@pytest.mark.django_db
+class TestSearchState:
+    """Tests for search state (DB) operations."""
+
+    @staticmethod
+    def _product(product_id: str, price: int = 10000):
+        from domains.search.logic.schemas import ProductResult
+
+        return ProductResult(
+            id=product_id,
+            platform="naver",
+            name=f"상품 {product_id}",
+            price=price,
+            image_url="https://img.example/x.jpg",
+            product_url=f"https://naver.example/{product_id}",
+        )
+
+    def test_bulk_save_products_to_cache_upserts(self):
+        """Bulk writer inserts new rows and updates existing ones in place."""
+        from domains.search.state.interface import bulk_save_products_to_cache
+        from domains.search.state.models import ProductCache
+
+        written = bulk_save_products_to_cache("naver", {"루테인": [self._product("a"), self._product("b")]})
+        assert written == 2
+
+        bulk_save_products_to_cache("naver", {"빌베리": [self._product("a", price=9000)]})
+
+        assert ProductCache.objects.count() == 2
+        assert ProductCache.objects.get(platform="naver", product_id="a").price == 9000
+
+    def test_keyword_result_sets_do_not_evict_each_other(self):
+        """A product found by two keywords stays cached under both, each with its own rank."""
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from domains.search.state.interface import bulk_save_products_to_cache, get_cached_products_for_keywords
+
+        cutoff = timezone.now() - timedelta(hours=1)
+        bulk_save_products_to_cache("naver", {"비타민D": [self._product("a"), self._product("b")]})
+        bulk_save_products_to_cache("naver", {"칼슘": [self._product("c"), self._product("a")]})
+        bulk_save_products_to_cache("11st", {"칼슘": [self._product("z")]})
+
+        cached = get_cached_products_for_keywords(["비타민D", "칼슘"], cutoff)
+        assert [row.product_id for row in cached["비타민D"]] == ["a", "b"]
+        assert [row.product_id for row in cached["칼슘"]] == ["c", "z", "a"]  # 플랫폼별 순위 순
+
+        # 같은 키워드를 다시 검색하면 그 플랫폼의 결과 집합만 교체
+        bulk_save_products_to_cache("naver", {"칼슘": [self._product("b")]})
+        cached = get_cached_products_for_keywords(["비타민D", "칼슘"], cutoff)
+        assert [row.product_id for row in cached["비타민D"]] == ["a", "b"]
+        assert sorted(row.product_id for row in cached["칼슘"]) == ["b", "z"]
+
+    def test_resaving_a_keyword_upserts_memberships(self):
+        """Re-saving a keyword updates existing memberships in place instead of delete-then-insert."""
+        from domains.search.state.interface import bulk_save_products_to_cache
+        from domains.search.state.models import ProductCacheKeyword
+
+        bulk_save_products_to_cache("naver", {"마그네슘": [self._product("a"), self._product("b")]})
+        first = dict(ProductCacheKeyword.objects.filter(keyword="마그네슘").values_list("product__product_id", "id"))
+
+        bulk_save_products_to_cache("naver", {"마그네슘": [self._product("b"), self._product("c"), self._product("a")]})
+
+        links = ProductCacheKeyword.objects.filter(keyword="마그네슘").order_by("rank")
+        assert [link.product.product_id for link in links] == ["b", "c", "a"]
+        assert {link.product.product_id: link.id for link in links if link.product.product_id in first} == first
+
+    def test_coupang_keyword_search_orders_by_relevance(self):
+        """Exact keyword/category matches outrank name matches, which outrank partial keyword matches."""
+        from domains.search.state.interface import get_coupang_products_by_keywords
+        from domains.search.state.models import CoupangManualProduct
+
+        def create(product_id: str, name: str, keywords: list[str], **extra):
+            return CoupangManualProduct.objects.create(
+                product_id=product_id,
+                name=name,
+                price=extra.pop("price", 20000),
+                image_url="https://img.example/x.jpg",
+                affiliate_url=f"https://link.coupang.com/{product_id}",
+                keywords=keywords,
+                **extra,
+            )
+
+        create("partial", "눈 건강 캡슐", ["루테인지아잔틴"])
+        create("name", "루테인 60캡슐", [])
+        create("exact", "눈 영양제", ["Lutein", "루테인"])
+        create("inactive", "루테인 골드", ["루테인"], is_active=False)
+        create("other", "오메가3", ["오메가3"])
+
+        found = get_coupang_products_by_keywords(["루테인"])
+        assert [p.product_id for p in found] == ["exact", "name", "partial"]
+
+        # 정규화 (대소문자/공백) + 저장 시 search_text 갱신
+        product = CoupangManualProduct.objects.get(product_id="other")
+        product.keywords = ["  LUTEIN  "]
+        product.save(update_fields=["keywords"])
+        assert {p.product_id for p in get_coupang_products_by_keywords(["lutein"])} == {"exact", "other"}
+        assert [p.product_id for p in get_coupang_products_by_keywords(["루테인"], price_max=10000)] == []
+
+
+@pytest.mark.django_db
+class TestCatalogIndex:
+    """Tests for the shared in-memory Coupang catalog index."""
+
+    @staticmethod
+    def _create(product_id: str, name: str, keywords: list[str], **extra):
+        from domains.search.state.models import CoupangManualProduct
+
+        return CoupangManualProduct.objects.create(
+            product_id=product_id,
+            name=name,
+            price=extra.pop("price", 20000),
+            image_url="https://img.example/x.jpg",
+            affiliate_url=f"https://link.coupang.com/{product_id}",
+            keywords=keywords,
+            **extra,
+        )
+
+    def test_index_search_matches_db_search(self):
+        """The serialized index returns the same products in the same order as the SQL lookup."""
+        from domains.search.logic.catalog import CatalogIndex
+        from domains.search.state.interface import (
+            get_coupang_catalog_rows,
+            get_coupang_products_by_keywords,
+            normalize_search_text,
+        )
+
+        self._create("partial", "눈 건강 캡슐", ["루테인지아잔틴"], price=9000)
+        self._create("name", "루테인 60캡슐", [], category="건강식품")
+        self._create("exact", "눈 영양제", ["Lutein", "루테인"])
+        self._create("inactive", "루테인 골드", ["루테인"], is_active=False)
+        self._create("omega", "오메가3 rTG", ["오메가3", "눈 영양제"], price=35000)
+
+        index = CatalogIndex.from_rows(get_coupang_catalog_rows(), generation=7)
+        assert (index.generation, index.count) == (7, 4)
+
+        for keywords, price_range in [
+            (["루테인"], (None, None)),
+            (["눈 영양제", "LUTEIN"], (None, None)),
+            (["눈", "오메가3"], (None, 30000)),
+            (["건강"], (10000, None)),
+            (["없는상품"], (None, None)),
+        ]:
+            expected = get_coupang_products_by_keywords(keywords, price_min=price_range[0], price_max=price_range[1])
+            terms = [normalize_search_text(keyword) for keyword in keywords]
+            found = index.search(terms, price_min=price_range[0], price_max=price_range[1])
+            assert [p.product_id for p in found] == [p.product_id for p in expected], keywords
+
+    def test_generation_bump_rebuilds_shared_file(self, settings, tmp_path, monkeypatch):
+        """A catalog change bumps the generation; the next lookup maps a freshly built file."""
+        import asyncio
+
+        from domains.search import catalog_index
+
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "catalog"}
+        }
+        settings.SEARCH_CATALOG_INDEX_DIR = str(tmp_path)
+        monkeypatch.setattr(catalog_index, "_index", None)
+
+        self._create("first", "루테인 60캡슐", ["루테인"])
+        first = catalog_index.load_catalog_index()
+        assert first.generation == 0
+        assert catalog_index.load_catalog_index() is first  # 세대가 같으면 그대로
+
+        self._create("second", "루테인 골드", ["루테인"])
+        catalog_index.bump_catalog_generation()
+        second = catalog_index.load_catalog_index()
+
+        assert second.generation == 1
+        assert [p.product_id for p in second.search(["루테인"])] == ["second", "first"]
+        assert [path.name for path in tmp_path.glob("*.idx")] == ["coupang-1.idx"]
+
+        # 검색 경로: 최신 색인이 있으면 DB 없이 응답
+        from domains.search import interface as search_interface
+
+        settings.SEARCH_CATALOG_INDEX_ENABLED = True
+        keyword_result = type("KeywordResult", (), {"price_min": None, "price_max": 30000})()
+
+        async def lookup():
+            task = search_interface._start_coupang_lookup(["루테인"], 1.0, keyword_result)
+            return await search_interface._await_coupang_products(task)
+
+        assert [p.id for p in asyncio.run(lookup())] == ["coupang_second", "coupang_first"]
+
+    def test_late_build_keeps_newer_generation_files(self, tmp_path):
+        """Finishing an older generation never unlinks a newer one another worker already wrote."""
+        from domains.search import catalog_index
+
+        for generation in (3, 4, 5):
+            (tmp_path / f"coupang-{generation}.idx").write_bytes(b"")
+
+        catalog_index._remove_old_files(tmp_path, 4)
+
+        assert sorted(path.name for path in tmp_path.glob("*.idx")) == ["coupang-4.idx", "coupang-5.idx"]
+
+
+@pytest.mark.django_db
+class TestSearchSuggestions:
+    """Tests for the autocomplete engine and endpoint."""
+
+    def test_prefix_index_ranks_by_weight_and_word_starts(self):
+        """Full-phrase prefixes outrank word-start matches; short prefixes use precomputed tops."""
+        from domains.search.logic.suggest import SuggestionIndex
+
+        index = SuggestionIndex(
+            {
+                "비타민c": ("비타민C", 5),
+                "비타민d": ("비타민D", 9),
+                "비오틴": ("비오틴", 1),
+                "종합 비타민": ("종합 비타민", 12),
+            }
+        )
+
+        assert index.suggest("비") == ["비타민D", "종합 비타민", "비타민C", "비오틴"]  # 종합 비타민: 12 x 0.5
+        assert index.suggest("비타민", limit=2) == ["비타민D", "종합 비타민"]
+        assert index.suggest("비타민c") == ["비타민C"]
+        assert index.suggest("루테인") == []
+
+    def test_history_keywords_and_products_feed_the_endpoint(self, client, monkeypatch):
+        """History needs repeated queries; products are always suggested; responses are cacheable."""
+        import asyncio
+
+        from django.urls import reverse
+
+        from domains.search import suggestions
+        from domains.search.state.models import CoupangManualProduct, SearchHistory
+
+        monkeypatch.setattr(suggestions, "_index", None)
+        SearchHistory.objects.bulk_create(
+            [SearchHistory(query="루테인 추천", keywords=["루테인", "눈 영양제"]) for _ in range(3)]
+            + [SearchHistory(query="루테인 내 이름은 홍길동", keywords=[])]
+        )
+        CoupangManualProduct.objects.create(
+            product_id="p1",
+            name="루테인 지아잔틴",
+            price=20000,
+            image_url="https://img.example/x.jpg",
+            affiliate_url="https://link.coupang.com/p1",
+            keywords=[],
+        )
+
+        response = client.get(reverse("search:autocomplete"), {"q": "루테"})
+
+        assert response.status_code == 200
+        assert "max-age=60" in response["Cache-Control"]
+        body = response.content.decode()
+        assert body.index("루테인 추천") < body.index("루테인 지아잔틴")
+        assert "홍길동" not in body  # 한 번뿐인 검색어는 제안하지 않음
+
+        # 증분 갱신: 새 기록만 더해서 색인 교체
+        SearchHistory.objects.bulk_create([SearchHistory(query="눈 영양제 추천", keywords=[]) for _ in range(2)])
+        suggestions.refresh_suggestion_index()
+        assert asyncio.run(suggestions.aget_suggestions("눈 영")) == ["눈 영양제", "눈 영양제 추천"]
+
+
+class TestSearchCacheWarmer:
+    """Tests for the popular-query cache warmer."""
+
+    @pytest.mark.django_db
+    def test_popular_queries_are_padded_with_seed_list(self):
+        """Most frequent history queries come first; seeds fill the rest without duplicates."""
+        from domains.search.state.models import SearchHistory
+        from domains.search.warmer import SEED_QUERIES, select_warm_queries
+
+        SearchHistory.objects.bulk_create(
+            [SearchHistory(query="루테인") for _ in range(3)]
+            + [SearchHistory(query="눈 영양제 추천") for _ in range(5)]
+        )
+
+        queries = select_warm_queries(limit=4, days=7)
+
+        assert queries[:2] == ["눈 영양제 추천", "루테인"]
+        assert queries[2:] == [q for q in SEED_QUERIES if q != "루테인"][:2]
+        assert select_warm_queries(limit=2, days=7, seed_only=True) == SEED_QUERIES[:2]
+
+    async def test_only_platforms_near_expiry_hit_upstream(self, monkeypatch):
+        """Fresh (platform, keyword) pairs are skipped; missing platforms are fetched and reported as coverage."""
+        from types import SimpleNamespace
+
+        from domains.integrations.gemini import interface as gemini_interface
+        from domains.integrations.gemini.client import KeywordExtractionResult
+        from domains.search import fanout
+        from domains.search.state import interface as state_interface
+        from domains.search.warmer import warm_search_cache
+
+        async def fake_extract(query):
+            return KeywordExtractionResult(
+                keywords=["루테인", "빌베리", "밀크씨슬"] if query == "눈 피로" else ["오메가3"], category=""
+            )
+
+        fetched = []
+
+        async def fake_fetch(search_terms, deadline=None, price_range=(None, None), pairs=None):
+            fetched.extend(sorted(pairs))
+            return {pair: [] if pair[1] in ("오메가3", "루테인") else ["상품"] for pair in pairs}
+
+        fresh = {
+            "루테인": [SimpleNamespace(platform="naver")],
+            "밀크씨슬": [SimpleNamespace(platform="naver"), SimpleNamespace(platform="11st")],
+        }
+        monkeypatch.setattr(gemini_interface, "aextract_keywords", fake_extract)
+        monkeypatch.setattr(gemini_interface, "awarm_keywords", fake_extract)
+        monkeypatch.setattr(
+            state_interface,
+            "get_cached_products_for_keywords",
+            lambda keywords, cutoff: {keyword: fresh[keyword] for keyword in keywords if keyword in fresh},
+        )
+        monkeypatch.setattr(fanout, "fetch_platform_products", fake_fetch)
+
+        report = await warm_search_cache(["눈 피로", "오메가3"], rate=0)
+
+        assert fetched == [
+            ("11st", "루테인"),
+            ("11st", "빌베리"),
+            ("naver", "빌베리"),
+            ("11st", "오메가3"),
+            ("naver", "오메가3"),
+        ]
+        summary = (report.queries, report.terms, report.fresh_terms, report.refreshed_terms, report.empty_terms)
+        assert summary == (2, 4, 2, 1, 1)
+        assert report.coverage == pytest.approx(3 / 4)
+
+
+class TestBackgroundJobs:
+    """Tests for the in-process background job queue."""
+
+    async def test_jobs_are_batched_and_flushed(self, monkeypatch):
+        """Queued jobs are flushed together and counted in the queue metrics."""
+        from collections import Counter
+
+        from domains.search import tasks
+
+        flushed = []
+
+        def fake_flush_jobs(jobs):
+            flushed.append([job.kind for job in jobs])
+            return Counter()
+
+        monkeypatch.setattr(tasks, "flush_jobs", fake_flush_jobs)
+        queue = tasks.BackgroundJobQueue(max_size=2, batch_size=10, flush_interval=60)
+        await queue.start()
+
+        queue.enqueue(tasks.JOB_SEARCH_HISTORY, {"query": "루테인"})
+        queue.enqueue(tasks.JOB_CLICK_LOG, {"product_url": "https://naver.example/a"})
+        queue.enqueue(tasks.JOB_CLICK_LOG, {"product_url": "https://naver.example/b"})
+        await queue.drain()
+
+        assert flushed == [[tasks.JOB_SEARCH_HISTORY, tasks.JOB_CLICK_LOG]]
+        stats = queue.stats()
+        assert (stats["depth"], stats["processed"], stats["dropped"], stats["flushes"]) == (0, 2, 1, 1)
+
+    async def test_refresh_lock_is_released_after_each_run(self, monkeypatch, settings):
+        """A finished or failed refresh releases its cross-worker lease for the next soft-TTL expiry."""
+        from domains.search import fanout, tasks
+
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "refresh"}
+        }
+        outcomes = [None, RuntimeError("upstream down"), None]
+
+        async def fake_fetch(search_terms, deadline=None, price_range=(None, None), pairs=None):
+            if error := outcomes.pop(0):
+                raise error
+            return {}
+
+        monkeypatch.setattr(fanout, "fetch_platform_products", fake_fetch)
+        before = dict(tasks.refresh_stats)
+
+        for _ in range(3):
+            await tasks._refresh_keyword("루테인", (None, None), ("naver",))
+
+        assert tasks.refresh_stats["completed"] - before.get("completed", 0) == 2
+        assert tasks.refresh_stats["failed"] - before.get("failed", 0) == 1
+        assert tasks.refresh_stats["skipped_locked"] == before.get("skipped_locked", 0)
+
+    async def test_refresh_lease_is_held_until_the_cache_write(self, monkeypatch, settings):
+        """A refresh uses the background deadline and keeps its lease until the queued cache write is flushed."""
+        from collections import Counter
+
+        from django.core.cache import cache
+
+        from domains.search import fanout, tasks
+
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "refresh-lease"}
+        }
+        settings.SEARCH_REFRESH_DEADLINE = 7.0
+        queue = tasks.BackgroundJobQueue(max_size=10, batch_size=1, flush_interval=60)
+        await queue.start()
+        monkeypatch.setattr(tasks, "background_jobs", queue)
+        deadlines, locks_during_flush = [], []
+
+        async def fake_fetch(search_terms, deadline=None, price_range=(None, None), pairs=None):
+            deadlines.append(deadline)
+            queue.enqueue(tasks.JOB_PRODUCT_CACHE, ("naver", {"루테인": ["상품"]}))
+            return {}
+
+        def fake_flush_jobs(jobs):
+            locks_during_flush.append(any(tasks.REFRESH_LOCK_PREFIX in key for key in cache._cache))
+            return Counter()
+
+        monkeypatch.setattr(fanout, "fetch_platform_products", fake_fetch)
+        monkeypatch.setattr(tasks, "flush_jobs", fake_flush_jobs)
+
+        await tasks._refresh_keyword("루테인", (None, None), ("naver",))
+
+        assert deadlines == [7.0]
+        assert locks_during_flush == [True]
+        assert not any(tasks.REFRESH_LOCK_PREFIX in key for key in cache._cache)
+        await queue.drain()
+
+    def test_jobs_from_a_throwaway_loop_are_not_lost(self, monkeypatch):
+        """Outside the lifespan loop (runserver's per-request loops) jobs still get written after the loop closes."""
+        import asyncio
+        from collections import Counter
+
+        from domains.search import tasks
+
+        flushed = []
+
+        def fake_flush_jobs(jobs):
+            flushed.extend(job.payload["query"] for job in jobs)
+            return Counter()
+
+        monkeypatch.setattr(tasks, "flush_jobs", fake_flush_jobs)
+        queue = tasks.BackgroundJobQueue(max_size=10, batch_size=10, flush_interval=60)
+
+        async def view(query):
+            queue.enqueue(tasks.JOB_SEARCH_HISTORY, {"query": query})
+
+        asyncio.run(view("루테인"))
+        asyncio.run(view("오메가3"))
+        asyncio.run(queue.drain())
+
+        assert flushed == ["루테인", "오메가3"]
+        assert queue.stats()["processed"] == 2
+
+    def test_latest_cache_batch_wins_within_a_flush(self, monkeypatch):
+        """The same platform/keyword queued twice is written once with the newest products."""
+        from domains.search import tasks
+        from domains.search.state import interface as state_interface
+
+        saved = []
+        monkeypatch.setattr(state_interface, "bulk_save_products_to_cache", lambda *args: saved.append(args))
+        monkeypatch.setattr(state_interface, "bulk_create_search_history", lambda rows: None)
+        monkeypatch.setattr(state_interface, "bulk_create_click_logs", lambda rows: None)
+
+        tasks.flush_jobs(
+            [
+                tasks.Job(tasks.JOB_PRODUCT_CACHE, ("naver", {"루테인": ["old"], "빌베리": ["b"]})),
+                tasks.Job(tasks.JOB_PRODUCT_CACHE, ("naver", {"루테인": ["new"]})),
+            ]
+        )
+
+        assert saved == [("naver", {"루테인": ["new"], "빌베리": ["b"]})]
+
+
+class TestHttpPools:
+    """Tests for the shared per-platform HTTP client pools."""
+
+    async def test_platform_client_is_reused_until_closed(self):
+        """One client per platform per loop; closing the pools forces a fresh one."""
+        from domains.integrations import http_pool
+
+        client = http_pool.get_http_client("naver")
+        assert http_pool.get_http_client("naver") is client
+        assert http_pool.get_http_client("11st") is not client
+
+        await http_pool.close_http_clients()
+
+        assert client.is_closed
+        assert http_pool.get_http_client("naver") is not client
+        assert http_pool.get_http_pool_stats()["naver"]["open"] == 0
+        await http_pool.close_http_clients()
+
+    def test_sync_runs_close_their_pool(self):
+        """asyncio.run() paths close the pool they opened before the loop goes away."""
+        from domains.integrations import http_pool
+
+        async def search():
+            return http_pool.get_http_client("naver")
+
+        client = http_pool.run_with_http_clients(search())
+
+        assert client.is_closed
+        assert "naver" not in http_pool._clients
+
+    def test_unmanaged_loops_do_not_keep_connections_alive(self, settings):
+        """Per-request loops (runserver/WSGI) get clients without keep-alive; managed runs keep the pool."""
+        import asyncio
+
+        from domains.integrations import http_pool
+
+        settings.HTTP_POOL_MAX_KEEPALIVE = 16
+
+        async def keepalive_limit():
+            return http_pool.get_http_client("naver")._transport._pool._max_keepalive_connections
+
+        assert asyncio.run(keepalive_limit()) == 0
+        assert http_pool.run_with_http_clients(keepalive_limit()) == 16
+        assert http_pool.get_http_pool_stats()["naver"]["unpooled_clients_created"] >= 1
+
+    async def test_fetch_sends_rotating_user_agent(self, monkeypatch, settings):
+        """BaseCrawler.fetch goes through the pool with per-request browser headers."""
+        import asyncio
+
+        import httpx
+
+        from domains.integrations import http_pool
+        from domains.integrations.naver.client import NaverClient
+
+        settings.UPSTREAM_QUOTAS = {}
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["User-Agent"])
+            return httpx.Response(200, text="<html>ok</html>")
+
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_pool, "get_http_client", lambda platform: pooled)
+        client = NaverClient()
+        monkeypatch.setattr(client, "delay", lambda: asyncio.sleep(0))
+
+        assert await client.fetch("https://naver.example/item") == "<html>ok</html>"
+        assert seen[0] in NaverClient.USER_AGENTS
+        await pooled.aclose()
+
+    async def test_naver_search_uses_shared_client(self, monkeypatch, settings):
+        """Searches go through the pooled client instead of opening one per call."""
+        import httpx
+
+        from domains.integrations import http_pool
+        from domains.integrations.naver.client import NaverClient
+
+        settings.NAVER_CLIENT_ID = "id"
+        settings.NAVER_CLIENT_SECRET = "secret"
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            item = {"title": "<b>루테인</b>", "lprice": "10000", "link": "https://naver.example/a"}
+            return httpx.Response(200, json={"items": [item]})
+
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_pool, "get_http_client", lambda platform: pooled)
+        client = NaverClient()
+
+        await client.search("루테인")
+        results = await client.search("루테인")
+
+        assert len(requests) == 2
+        assert [r.product_name for r in results] == ["루테인"]
+        assert not pooled.is_closed
+        await pooled.aclose()
+
+
+class TestNaverPagination:
+    """Tests for the concurrent multi-page Naver shopping fetch."""
+
+    @pytest.fixture
+    async def naver(self, monkeypatch, settings):
+        import asyncio
+
+        import httpx
+
+        from domains.integrations import http_pool
+        from domains.integrations.naver.client import NaverClient
+
+        settings.NAVER_CLIENT_ID = "id"
+        settings.NAVER_CLIENT_SECRET = "secret"
+        settings.UPSTREAM_QUOTAS = {}
+        pages = {}  # {start: (지연 초, 가격 목록 | HTTP 상태)}, "sorts": 요청한 정렬
+        finished = []
+
+        async def handler(request):
+            pages.setdefault("sorts", []).append(request.url.params["sort"])
+            start = int(request.url.params["start"])
+            delay, page = pages.get(start, (0, []))
+            await asyncio.sleep(delay)
+            finished.append(start)
+            if isinstance(page, int):
+                return httpx.Response(page)
+            items = [
+                {"title": f"상품 {start}-{i}", "lprice": str(price), "link": f"https://naver.example/{start}/{i}"}
+                for i, price in enumerate(page)
+            ]
+            return httpx.Response(200, json={"items": items})
+
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_pool, "get_http_client", lambda platform: pooled)
+        yield NaverClient(), pages, finished
+        await pooled.aclose()
+
+    async def test_pages_are_fetched_concurrently_and_kept_in_order(self, naver):
+        """Later pages may land first, but results keep page order and stop past price_max."""
+        client, pages, finished = naver
+        pages[1] = (0.05, [9000] * 50 + [10000] * 50)
+        pages[101] = (0, [20000] * 100)
+        pages[201] = (0.05, [20000] * 99 + [40000])
+        pages[301] = (5, [50000] * 100)
+
+        results = await client.search("루테인", limit=300, price_min=10000, price_max=30000, pages=4)
+
+        assert finished[0] == 101
+        assert 301 not in finished
+        assert [r.price for r in results] == [10000] * 50 + [20000] * 199
+
+    async def test_stops_once_limit_is_filled(self, naver):
+        """Remaining page requests are cancelled once the leading pages fill the limit."""
+        import asyncio
+
+        client, pages, finished = naver
+        pages[1] = (0, [15000] * 100)
+        pages[101] = (5, [15000] * 100)
+        pages[201] = (5, [15000] * 100)
+
+        results = await asyncio.wait_for(client.search("루테인", limit=20, price_min=10000, pages=3), timeout=1)
+
+        assert len(results) == 20
+        assert finished == [1]
+
+    async def test_min_only_range_sorts_by_relevance(self, naver):
+        """A min-only range ("5만원 이상") keeps relevance order and filters, instead of paging the cheapest items."""
+        client, pages, _ = naver
+        pages[1] = (0, [60000, 30000, 80000] + [55000] * 97)
+
+        results = await client.search("루테인", limit=3, price_min=50000, pages=2)
+
+        assert set(pages["sorts"]) == {"sim"}
+        assert [r.price for r in results] == [60000, 80000, 55000]
+
+    async def test_failed_pages_keep_partial_results(self, naver):
+        """A failed page is dropped when others landed; an all-failed search still raises."""
+        from domains.integrations.base import CrawlError
+
+        client, pages, _ = naver
+        pages[1] = (0, [15000] * 100)
+        pages[101] = (0, 500)
+
+        results = await client.search("루테인", limit=200, price_min=10000, pages=2, raise_errors=True)
+        assert len(results) == 100
+
+        pages[1] = (0, 503)
+        with pytest.raises(CrawlError, match="HTTP 503"):
+            await client.search("루테인", limit=200, price_min=10000, pages=2, raise_errors=True)
+
+
+class TestElevenstParser:
+    """Tests for the streaming 11st XML parser."""
+
+    @staticmethod
+    def _payload(*products: tuple[str, str], error: tuple[str, str] | None = None) -> bytes:
+        body = "".join(
+            f"<Product><ProductName><![CDATA[{name}]]></ProductName><SalePrice>{price}</SalePrice>"
+            f"<Price>20,000</Price><SellerNm>건강상점</SellerNm><ReviewCount>1,234</ReviewCount></Product>"
+            for name, price in products
+        )
+        head = f"<ErrorCode>{error[0]}</ErrorCode><ErrorMessage>{error[1]}</ErrorMessage>" if error else ""
+        xml = f'<?xml version="1.0" encoding="euc-kr"?><ProductSearchResponse>{head}<Products>{body}</Products></ProductSearchResponse>'
+        return xml.encode("euc-kr")
+
+    def test_euc_kr_chunks_split_mid_character(self):
+        """Byte chunks that split multi-byte characters still yield each product once."""
+        from domains.integrations.elevenst.parser import ProductStreamParser
+
+        body = self._payload(("루테인 지아잔틴", "15,000"), ("오메가3", "9,900"))
+        parser = ProductStreamParser()
+        products = []
+        for start in range(0, len(body), 7):
+            products += parser.feed(body[start : start + 7])
+        products += parser.close()
+
+        assert [(p["ProductName"], p["SalePrice"]) for p in products] == [
+            ("루테인 지아잔틴", "15,000"),
+            ("오메가3", "9,900"),
+        ]
+        assert parser.error is None
+
+    async def test_search_maps_streamed_products(self, monkeypatch, settings):
+        """The client streams the response, filters by price and surfaces API errors."""
+        from decimal import Decimal
+
+        import httpx
+
+        from domains.integrations import http_pool
+        from domains.integrations.base import CrawlError
+        from domains.integrations.elevenst.client import ElevenStreetClient
+
+        settings.ELEVENST_API_KEY = "key"
+        payloads = [
+            self._payload(("루테인", "15,000"), ("비싼 루테인", "90,000")),
+            self._payload(error=("-1", "잘못된 키")),
+        ]
+
+        def handler(request):
+            return httpx.Response(200, content=payloads.pop(0), headers={"Content-Type": "text/xml;charset=euc-kr"})
+
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_pool, "get_http_client", lambda platform: pooled)
+        client = ElevenStreetClient()
+
+        results = await client.search("루테인", price_max=30000)
+
+        assert [(r.product_name, r.price, r.discount_percent, r.review_count) for r in results] == [
+            ("루테인", Decimal(15000), 25, 1234)
+        ]
+        with pytest.raises(CrawlError, match="잘못된 키"):
+            await client.search("루테인", raise_errors=True)
+        await pooled.aclose()
+
+
+class TestUpstreamQuotas:
+    """Tests for the shared upstream quota manager (per-worker fallback buckets)."""
+
+    @pytest.fixture
+    def quota(self, monkeypatch, settings):
+        from collections import Counter
+
+        from domains.integrations import quota
+
+        # Redis 없이 워커 메모리 버킷으로 같은 규칙 검증
+        monkeypatch.setattr(quota, "_redis_retry_at", float("inf"))
+        monkeypatch.setattr(quota, "_local_buckets", {})
+        monkeypatch.setattr(quota, "_local_daily", Counter())
+        settings.QUOTA_BACKGROUND_RESERVE = 0.2
+        settings.QUOTA_INTERACTIVE_MAX_WAIT = 0
+        settings.QUOTA_BACKGROUND_MAX_WAIT = 0
+        return quota
+
+    async def test_background_leaves_headroom_for_interactive(self, quota, settings):
+        """Background jobs stop at the reserve; interactive searches can use the rest of the bucket."""
+        settings.UPSTREAM_QUOTAS = {"naver": {"per_minute": 1, "burst": 10, "daily": 0}}
+
+        with quota.background_priority():
+            for _ in range(8):
+                await quota.aacquire_quota("naver")
+            with pytest.raises(quota.QuotaExceeded):
+                await quota.aacquire_quota("naver")
+
+        await quota.aacquire_quota("naver")
+        await quota.aacquire_quota("naver")
+        with pytest.raises(quota.QuotaExceeded):
+            await quota.aacquire_quota("naver")
+
+    def test_daily_budget_burn_down(self, quota, settings):
+        """The daily budget rejects calls once spent and is reported in the metrics."""
+        settings.UPSTREAM_QUOTAS = {"gemini": {"per_minute": 0, "burst": 1, "daily": 3}}
+
+        for _ in range(3):
+            quota.acquire_quota("gemini")
+        with pytest.raises(quota.QuotaExceeded, match="daily budget"):
+            quota.acquire_quota("gemini")
+
+        stats = quota.get_quota_stats()["gemini"]
+        assert (stats["used_today"], stats["remaining"], stats["burn"]) == (3, 0, 1.0)
+        assert stats["rejected_daily_interactive"] >= 1
+
+    def test_sync_interactive_calls_fail_fast(self, quota, monkeypatch, settings):
+        """The sync path never sleeps a request thread; it rejects as soon as a wait would be needed."""
+        settings.UPSTREAM_QUOTAS = {"gemini": {"per_minute": 60, "burst": 1, "daily": 0}}
+        settings.QUOTA_INTERACTIVE_MAX_WAIT = 5
+        monkeypatch.setattr(quota.time, "sleep", lambda seconds: pytest.fail("request thread slept"))
+
+        quota.acquire_quota("gemini")
+        with pytest.raises(quota.QuotaExceeded, match="rate limited"):
+            quota.acquire_quota("gemini")
+
+    async def test_search_skips_upstream_when_quota_is_spent(self, quota, monkeypatch, settings):
+        """A spent quota returns no results without calling out (or raises CrawlError on request)."""
+        from domains.integrations import http_pool
+        from domains.integrations.base import CrawlError
+        from domains.integrations.naver.client import NaverClient
+
+        settings.NAVER_CLIENT_ID = "id"
+        settings.NAVER_CLIENT_SECRET = "secret"
+        settings.UPSTREAM_QUOTAS = {"naver": {"per_minute": 0, "burst": 1, "daily": 1}}
+        quota.acquire_quota("naver")
+        monkeypatch.setattr(http_pool, "get_http_client", lambda platform: pytest.fail("upstream called"))
+
+        assert await NaverClient().search("루테인") == []
+        with pytest.raises(CrawlError):
+            await NaverClient().search("루테인", raise_errors=True)
+
+
+class TestCircuitBreakers:
+    """Tests for per-platform circuit breakers and adaptive timeouts."""
+
+    async def test_opens_fails_fast_and_recovers_through_a_probe(self, settings):
+        """Errors open the circuit; after the cooldown one probe decides whether it closes."""
+        from domains.integrations.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpen
+
+        settings.BREAKER_MIN_CALLS = 4
+        settings.BREAKER_ERROR_RATE = 0.5
+        settings.BREAKER_COOLDOWN = 60
+        breaker = CircuitBreaker("11st", max_timeout=10.0)
+        calls = []
+
+        async def failing(timeout):
+            calls.append(timeout)
+            raise RuntimeError("upstream down")
+
+        for _ in range(4):
+            with pytest.raises(RuntimeError):
+                await breaker.acall(failing)
+        assert breaker.state == OPEN
+
+        with pytest.raises(CircuitOpen):
+            await breaker.acall(failing)
+        assert len(calls) == 4
+
+        breaker.opened_at -= 60
+        assert breaker.allow() is True
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpen, match="probe"):
+            breaker.allow()
+        breaker.record(True, 0.2, probe=True)
+
+        assert breaker.state == CLOSED
+        assert breaker.snapshot()["error_rate"] == 0.0
+
+    def test_timeout_follows_observed_p95(self, settings):
+        """With enough samples the timeout is p95 x factor, clamped to the floor and the default."""
+        from domains.integrations.breaker import CircuitBreaker
+
+        settings.BREAKER_MIN_CALLS = 10
+        settings.BREAKER_TIMEOUT_FACTOR = 2.0
+        settings.BREAKER_MIN_TIMEOUT = 1.0
+        breaker = CircuitBreaker("naver", max_timeout=10.0)
+
+        for i in range(9):
+            breaker.record(True, 0.1 * (i + 1))
+        assert breaker.timeout() == 10.0
+
+        breaker.record(True, 1.0)
+        breaker.record(False, 10.0)  # 실패 지연은 타임아웃 계산에서 제외
+        assert breaker.timeout() == pytest.approx(2.0)
+        assert breaker.snapshot()["p95_ms"] == 1000
+
+    async def test_interface_fails_fast_while_open(self, monkeypatch):
+        """An open circuit short-circuits the interface without touching the client."""
+        import time
+
+        from domains.integrations.breaker import OPEN, CircuitBreaker, CircuitOpen
+        from domains.integrations.elevenst import interface as elevenst_interface
+
+        breaker = CircuitBreaker("11st", max_timeout=10.0)
+        breaker.state, breaker.opened_at = OPEN, time.monotonic()
+        monkeypatch.setattr(elevenst_interface, "breaker", breaker)
+        monkeypatch.setattr(
+            elevenst_interface.elevenst_client, "search", lambda *a, **k: pytest.fail("upstream called")
+        )
+
+        assert await elevenst_interface.search_elevenst_products("루테인") == []
+        with pytest.raises(CircuitOpen):
+            await elevenst_interface.search_elevenst_products("루테인", raise_errors=True)
+
+
+class TestSingleFlight:
+    """Tests for single-flight coalescing."""
+
+    async def test_concurrent_calls_share_one_upstream_call(self, settings):
+        """Identical concurrent keys run fn once; every caller gets the result."""
+        import asyncio
+
+        from domains.search.singleflight import SingleFlight
+
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        flight = SingleFlight(namespace="test:flight", lease=1.0, poll_interval=0.01)
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return {"naver": ["루테인"]}
+
+        results = await asyncio.gather(*(flight.do("fetch:루테인", fetch) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert results == [{"naver": ["루테인"]}] * 5
+        assert flight.get_stats()["shared_local"] == 4
+
+    async def test_waiters_do_not_read_a_previous_flights_result(self, settings):
+        """A result published by an earlier flight is not handed to waiters of the next one."""
+        from django.core.cache import cache
+
+        from domains.search.singleflight import SingleFlight
+
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "flight"}
+        }
+        flight = SingleFlight(namespace="test:flight", lease=0.1, poll_interval=0.01)
+
+        async def fetch(result):
+            return result
+
+        assert await flight.do("fetch:루테인", lambda: fetch("이전 결과")) == "이전 결과"
+        # 다른 워커가 새 flight의 락을 잡은 상태 (결과는 아직 게시 전)
+        await cache.aadd(flight._lock_key("fetch:루테인"), "other-flight", timeout=1)
+
+        assert await flight.do("fetch:루테인", lambda: fetch("새 결과")) == "새 결과"
+        assert (flight.get_stats()["shared_cluster"], flight.get_stats()["fallback"]) == (0, 1)
+
+
+class TestSearchSnapshots:
+    """Tests for search result snapshots."""
+
+    async def test_snapshot_round_trip(self, settings):
+        """A stored snapshot is returned only for the same query."""
+        from domains.search.interface import get_search_snapshot, save_search_snapshot
+        from domains.search.logic.schemas import CompareResult, ProductResult
+
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        product = ProductResult(
+            id="naver_a",
+            platform="naver",
+            name="루테인",
+            price=10000,
+            image_url="https://img.example/x.jpg",
+            product_url="https://naver.example/a",
+        )
+        result = CompareResult(query="루테인", keywords=["루테인"], products=[product], recommendation="1개")
+
+        snapshot_id = await save_search_snapshot(result)
+
+        assert snapshot_id
+        assert await get_search_snapshot(snapshot_id, "루테인") == result
+        assert await get_search_snapshot(snapshot_id, "칼슘") is None
+        assert await get_search_snapshot("missing", "루테인") is None
+
+
+class TestSearchLogic:
+    """Tests for pure search logic services."""
+
+    @staticmethod
+    def _products(platform: str, count: int):
+        from domains.search.logic.schemas import ProductResult
+
+        return [
+            ProductResult(
+                id=f"{platform}_{i}",
+                platform=platform,
+                name=f"{platform} {i}",
+                price=1000 + i,
+                image_url="https://img.example/x.jpg",
+                product_url=f"https://{platform}.example/{i}",
+            )
+            for i in range(count)
+        ]
+
+    def test_ranking_prefers_relevant_products_within_quotas(self):
+        """Keyword matches outrank cheaper noise, and no prefix exceeds a platform's share."""
+        from domains.search.logic.ranking import rank_search_results, score_products
+
+        coupang, naver, elevenst = self._products("coupang", 14), self._products("naver", 4), self._products("11st", 2)
+        relevant = naver[3].model_copy(update={"name": "루테인 지아잔틴 눈 영양제", "price": 9000})
+        naver = [*naver[:3], relevant]
+
+        ranked = rank_search_results(coupang, naver, elevenst, keywords=["루테인", "눈 영양제"])
+
+        assert len(ranked) == 20
+        assert ranked[0] == relevant
+        for size in range(1, len(ranked) + 1):
+            assert [p.platform for p in ranked[:size]].count("naver") <= -(-4 * size // 20)
+        scores = score_products([relevant, naver[0]], ["루테인"])
+        assert scores[0] > scores[1]
+
+    def test_elevenst_rating_scale_does_not_outrank_relevance(self):
+        """11st BuySatisfy (0-100) is rescaled to 5 points, and any rating score stays within 0-1."""
+        from domains.integrations.elevenst.client import ElevenStreetClient
+        from domains.search.logic.ranking import score_products
+
+        result = ElevenStreetClient()._to_result({"ProductName": "루테인", "SalePrice": "10,000", "BuySatisfy": "96"})
+        assert result.rating == 4.8
+
+        naver, elevenst = self._products("naver", 1)[0], self._products("11st", 1)[0]
+        relevant = naver.model_copy(update={"name": "루테인 지아잔틴", "price": 9000})
+        raw_scale = elevenst.model_copy(update={"price": 8000, "rating": 96.0, "review_count": 5000})
+
+        scores = score_products([relevant, raw_scale], ["루테인"])
+        assert scores[0] > scores[1]
+
+    def test_price_range_bucket_and_filter(self):
+        """Ranges widen to 10,000 won buckets for caching; the exact range filters results."""
+        from domains.search.logic.services import filter_by_price, price_cache_keyword, price_range_bucket
+
+        assert price_range_bucket(15000, 29000) == (10000, 30000)
+        assert price_range_bucket(None, None) == (None, None)
+        assert price_cache_keyword("루테인", (None, None)) == "루테인"
+        assert price_cache_keyword("루테인", (10000, 30000)) == "루테인 @10000-30000"
+        products = self._products("naver", 3)  # 1000, 1001, 1002
+        assert [p.price for p in filter_by_price(products, 1001, None)] == [1001, 1002]
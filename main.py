@@ -37,8 +37,52 @@ django.setup()
 
 from django.core.asgi import get_asgi_application
 
-# ASGI application
-app = get_asgi_application()
+# Django ASGI application (http/websocket)
+django_app = get_asgi_application()
+
+# 워커 시작 시 쿠팡 카탈로그 색인 준비 (첫 워커가 빌드, 나머지는 같은 파일을 mmap)
+from domains.search.interface import warm_search_catalog
+
+warm_search_catalog()
+
+
+async def lifespan(receive, send):
+    """
+    ASGI lifespan: 워커 시작/종료 시 공유 자원 관리
+
+    - startup: 플랫폼별 HTTP 연결 풀 생성, 백그라운드 작업 큐를 이 루프에서 시작
+    - shutdown: 대기 중인 백그라운드 작업 flush 후 연결 풀 종료
+    """
+    from domains.integrations.interface import close_http_clients, open_http_clients
+    from domains.search.interface import drain_background_jobs, start_background_jobs
+
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            try:
+                await open_http_clients()
+                await start_background_jobs()
+            except Exception as e:
+                await send({"type": "lifespan.startup.failed", "message": str(e)})
+                return
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            try:
+                await drain_background_jobs()
+                await close_http_clients()
+            except Exception as e:
+                await send({"type": "lifespan.shutdown.failed", "message": str(e)})
+                return
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI application (Django는 lifespan을 처리하지 않으므로 여기서 처리)"""
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+    else:
+        await django_app(scope, receive, send)
 
 
 def run_server():
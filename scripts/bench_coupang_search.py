@@ -0,0 +1,141 @@
+"""
+Benchmark Coupang catalog keyword search (legacy OR-icontains scan vs search_text index)
+
+상품 N개를 임시로 넣고 (트랜잭션 롤백으로 정리) 두 쿼리의 평균 시간과
+PostgreSQL 실행 계획을 비교한다. pg_trgm GIN 인덱스는 PostgreSQL에서만 생성되므로
+SQLite에서는 두 쿼리 모두 스캔이다.
+
+Usage:
+    uv run python scripts/bench_coupang_search.py
+    uv run python scripts/bench_coupang_search.py --sizes 10000 100000 --repeat 20
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR / "backend"))
+
+# Set Django settings
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django
+
+django.setup()
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from domains.search.state.interface import get_coupang_products_by_keywords
+from domains.search.state.models import CoupangManualProduct, build_search_text
+
+CATEGORIES = ["건강식품", "운동용품", "전자제품", "생활용품", "뷰티"]
+WORDS = [
+    "루테인",
+    "오메가3",
+    "비타민",
+    "유산균",
+    "콜라겐",
+    "프로틴",
+    "마그네슘",
+    "밀크씨슬",
+    "요가매트",
+    "덤벨",
+    "무선이어폰",
+    "보조배터리",
+    "텀블러",
+    "선크림",
+    "샴푸",
+    "칫솔",
+]
+QUERIES = [["루테인"], ["오메가3", "비타민"], ["무선이어폰"], ["존재하지않는상품"]]
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(count: int) -> None:
+    rng = random.Random(count)
+    products = []
+    for i in range(count):
+        words = rng.sample(WORDS, 3)
+        name = f"{words[0]} {words[1]} {rng.randint(1, 999)}정"
+        category = rng.choice(CATEGORIES)
+        keywords = words[:2]
+        products.append(
+            CoupangManualProduct(
+                product_id=f"bench-{i}",
+                name=name,
+                price=rng.randint(5, 200) * 1000,
+                image_url="https://img.example/bench.jpg",
+                affiliate_url=f"https://link.coupang.com/bench-{i}",
+                category=category,
+                keywords=keywords,
+                # bulk_create는 save()를 거치지 않으므로 직접 채움
+                search_text=build_search_text(name, category, keywords),
+            )
+        )
+    CoupangManualProduct.objects.bulk_create(products, batch_size=5000)
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE search_coupangmanualproduct")
+
+
+def legacy_query(keywords: list[str], limit: int = 20) -> list:
+    """변경 전 쿼리 (name/category/keywords OR icontains)"""
+    q = Q()
+    for keyword in keywords:
+        q |= Q(name__icontains=keyword) | Q(category__icontains=keyword) | Q(keywords__icontains=keyword)
+    return list(CoupangManualProduct.objects.filter(q).filter(is_active=True).order_by("-created_at")[:limit])
+
+
+def timed(func, keywords: list[str], repeat: int) -> float:
+    func(keywords)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(keywords)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def explain(keywords: list[str]) -> str:
+    queryset = CoupangManualProduct.objects.filter(search_text__contains=keywords[0], is_active=True)
+    return queryset.explain()
+
+
+def run(size: int, repeat: int) -> None:
+    print(f"\n📦 {size:,} products ({connection.vendor})")
+    try:
+        with transaction.atomic():
+            seed(size)
+            for keywords in QUERIES:
+                legacy_ms = timed(legacy_query, keywords, repeat)
+                indexed_ms = timed(get_coupang_products_by_keywords, keywords, repeat)
+                print(
+                    f"   {' + '.join(keywords):<24} scan {legacy_ms:8.2f}ms"
+                    f"   index {indexed_ms:8.2f}ms   x{legacy_ms / indexed_ms:.1f}"
+                )
+            if connection.vendor == "postgresql":
+                print("   plan:", explain(QUERIES[0]).replace("\n", "\n         "))
+            raise Rollback
+    except Rollback:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Coupang catalog search benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Benchmark 11st search response parsing (full ElementTree vs streaming parser)
+
+변경 전 파서(response.text 디코딩 → ET.fromstring → 상품마다 필드별 find)와
+ProductStreamParser(바이트 청크 → XMLPullParser, 상품 단위로 비움)의
+평균 파싱 시간과 tracemalloc 최대 메모리를 비교한다.
+
+녹화한 응답 파일(--payload)이 없으면 11번가 응답 형식(EUC-KR)의 합성 페이로드를 사용.
+응답 저장 예:
+    curl -o 11st-lutein.xml "http://openapi.11st.co.kr/openapi/OpenApiService.tmall?key=...&apiCode=ProductSearch&keyword=루테인&pageSize=200"
+
+Usage:
+    uv run python scripts/bench_elevenst_parser.py
+    uv run python scripts/bench_elevenst_parser.py --payload 11st-lutein.xml --repeat 50
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from decimal import Decimal
+from pathlib import Path
+
+# Add backend to path
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR / "backend"))
+
+# Set Django settings
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django
+
+django.setup()
+
+from domains.integrations.base import CrawlResult
+from domains.integrations.elevenst.client import ElevenStreetClient
+from domains.integrations.elevenst.parser import ProductStreamParser
+
+# httpx aiter_bytes 청크 크기와 비슷하게
+CHUNK_SIZE = 16 * 1024
+
+WORDS = ["루테인", "오메가3", "비타민D", "유산균", "마그네슘", "밀크씨슬", "콜라겐", "프로폴리스"]
+
+
+def synthetic_payload(count: int) -> bytes:
+    """11번가 ProductSearch 응답 형식의 합성 페이로드 (EUC-KR)"""
+    rng = random.Random(count)
+    products = []
+    for i in range(count):
+        price = rng.randint(5, 200) * 1000
+        name = f"[11번가] {rng.choice(WORDS)} {rng.choice(WORDS)} {rng.randint(30, 180)}캡슐 {i}"
+        products.append(
+            "<Product>"
+            f"<ProductCode>{4000000000 + i}</ProductCode>"
+            f"<ProductName><![CDATA[{name}]]></ProductName>"
+            f"<ProductPrice>{price + 3000}</ProductPrice>"
+            f"<ProductImage>https://cdn.011st.com/{i}.jpg</ProductImage>"
+            f"<ProductImage100>https://cdn.011st.com/{i}_100.jpg</ProductImage100>"
+            f"<ProductImage300>https://cdn.011st.com/{i}_300.jpg</ProductImage300>"
+            f"<SellerNick>판매자{i % 17}</SellerNick>"
+            f"<SellerNm>건강상점{i % 17}</SellerNm>"
+            f"<Seller>seller{i % 17}</Seller>"
+            f"<SalePrice>{price:,}</SalePrice>"
+            f"<Price>{price + 3000:,}</Price>"
+            "<Delivery>무료</Delivery>"
+            f"<BuySatisfy>{rng.randint(60, 100)}</BuySatisfy>"
+            f"<ReviewCount>{rng.randint(0, 5000):,}</ReviewCount>"
+            f"<DetailPageUrl>https://www.11st.co.kr/products/{4000000000 + i}</DetailPageUrl>"
+            "<Benefit><Discount>3000</Discount><Mileage>100</Mileage></Benefit>"
+            "</Product>"
+        )
+    xml = (
+        '<?xml version="1.0" encoding="euc-kr"?>'
+        "<ProductSearchResponse><Request><Arguments/></Request>"
+        f"<Products><TotalCount>{count}</TotalCount>{''.join(products)}</Products>"
+        "</ProductSearchResponse>"
+    )
+    return xml.encode("euc-kr")
+
+
+def _get_text(element: ET.Element, tag: str, default: str = "") -> str:
+    child = element.find(tag)
+    if child is not None and child.text:
+        return child.text.strip()
+    return default
+
+
+def legacy_parse(body: bytes, limit: int = 200) -> list[CrawlResult]:
+    """변경 전 파싱 (전체 문자열 디코딩 + 전체 트리 + 필드별 find)"""
+    root = ET.fromstring(body.decode("euc-kr"))
+    results = []
+    for product in root.findall(".//Product"):
+        product_name = _get_text(product, "ProductName", "")
+        if not product_name:
+            continue
+        sale_price = _get_text(product, "SalePrice", "0")
+        price = Decimal(sale_price.replace(",", "")) if sale_price else Decimal(0)
+        if price <= 0:
+            continue
+        if len(results) >= limit:
+            break
+        original_price_str = _get_text(product, "Price", "0")
+        original_price = Decimal(original_price_str.replace(",", "")) if original_price_str else None
+        discount_percent = None
+        if original_price and original_price > price:
+            discount_percent = int(((original_price - price) / original_price) * 100)
+        _get_text(product, "ProductCode", "")
+        image = _get_text(product, "ProductImage300", "") or _get_text(product, "ProductImage", "")
+        rating_str = _get_text(product, "BuySatisfy", "")
+        results.append(
+            CrawlResult(
+                product_name=product_name,
+                price=price,
+                original_price=original_price,
+                discount_percent=discount_percent,
+                url=_get_text(product, "DetailPageUrl", ""),
+                image_url=image,
+                platform="11st",
+                mall_name=_get_text(product, "SellerNm", "11번가"),
+                rating=round(float(rating_str) / 20, 2) if rating_str else None,  # 5점 만점 환산 (클라이언트와 동일)
+                review_count=int(_get_text(product, "ReviewCount", "0").replace(",", "")),
+            )
+        )
+    return results
+
+
+def streaming_parse(body: bytes, limit: int = 200) -> list[CrawlResult]:
+    """ProductStreamParser + ElevenStreetClient 변환 (청크 단위로 입력)"""
+    client = ElevenStreetClient()
+    parser = ProductStreamParser()
+    results: list[CrawlResult] = []
+    for start in range(0, len(body), CHUNK_SIZE):
+        client._collect_results(results, parser.feed(body[start : start + CHUNK_SIZE]), limit, None, None)
+    client._collect_results(results, parser.close(), limit, None, None)
+    return results
+
+
+def timed(func, body: bytes, repeat: int) -> float:
+    func(body)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(body)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def peak_memory(func, body: bytes) -> float:
+    tracemalloc.start()
+    try:
+        func(body)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def run(name: str, body: bytes, repeat: int) -> None:
+    legacy, streaming = legacy_parse(body), streaming_parse(body)
+    assert legacy == streaming, "parsers disagree"
+
+    print(f"\n📦 {name}: {len(body) / 1024:.0f}KB, {len(legacy)} products")
+    legacy_ms, streaming_ms = timed(legacy_parse, body, repeat), timed(streaming_parse, body, repeat)
+    legacy_kb, streaming_kb = peak_memory(legacy_parse, body), peak_memory(streaming_parse, body)
+    print(f"   time   legacy {legacy_ms:8.2f}ms   streaming {streaming_ms:8.2f}ms   x{legacy_ms / streaming_ms:.1f}")
+    print(f"   peak   legacy {legacy_kb:8.0f}KB   streaming {streaming_kb:8.0f}KB   x{legacy_kb / streaming_kb:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="11st XML parser benchmark")
+    parser.add_argument("--payload", type=Path, nargs="*", default=[], help="녹화한 11번가 응답 파일")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200], help="합성 페이로드 상품 수")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.payload:
+        for path in args.payload:
+            run(path.name, path.read_bytes(), args.repeat)
+    else:
+        for size in args.sizes:
+            run(f"synthetic {size}", synthetic_payload(size), args.repeat)
+
+
+if __name__ == "__main__":
+    main()